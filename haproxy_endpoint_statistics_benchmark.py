@@ -0,0 +1,329 @@
+import re
+import sys
+import gzip
+import json
+import time
+import random
+import hashlib
+import argparse
+import resource
+import multiprocessing
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
+
+import haproxy_endpoint_statistics as stats_script
+
+'''
+Benchmarks for the parse loop of haproxy_endpoint_statistics.py.
+
+Generates a synthetic HAProxy log in memory and parses it with the original text based loop, the
+current one and, when numpy is installed, the numpy engine. Every benchmark runs in a fresh process
+and reports lines/sec and peak RSS. The current loop is also timed stage by stage (filter, regex,
+unquote, normalize, aggregate), and all parsers must produce the same endpoint statistics:
+
+python haproxy_endpoint_statistics_benchmark.py --lines 1000000
+
+The mix of the generated traffic can be changed on the command line, see --help. To benchmark the
+whole script, write the generated log to a file instead:
+
+python haproxy_endpoint_statistics_benchmark.py --lines 1000000 --write log/synthetic.log.gz
+
+To catch changes to subs or log_pattern that make the hourly job slower, save a baseline on the
+machine that runs the job, and compare against it after every change. The check fails when a
+parser gets slower or uses more memory than the tolerance allows, or when the statistics it
+produces changed:
+
+python haproxy_endpoint_statistics_benchmark.py --save-baseline benchmark_baseline.json
+python haproxy_endpoint_statistics_benchmark.py --baseline benchmark_baseline.json
+'''
+
+## Tweak these endpoints and their relative weights as needed
+endpoints = [
+    (20, 'GET', '/api/stations'),
+    (15, 'GET', '/api/stations/{id}'),
+    (15, 'GET', '/jp/journeys/{fare}/calling-points'),
+    (5, 'POST', '/api/orders'),
+    (10, 'GET', '/api/orders/{id}'),
+    (5, 'PUT', '/api/orders/{id}/tickets/{id}'),
+    (8, 'GET', '/api/bookings/{ref}'),
+    (2, 'GET', '/api/bookings/{ref}/tickets/{id}'),
+    (2, 'DELETE', '/api/cards/{id}'),
+    (18, 'GET', '/api/search?from=London Bridge&to=Brighton'),
+]
+
+success_statuses = [200, 200, 200, 200, 201, 204, 304]
+error_statuses = [400, 401, 404, 404, 409, 500, 502, 503]
+
+default_mix = {
+    # Share of the lines written by other programs than otrl_haproxy
+    'noise': 0.1,
+    # Share of the requests with an error status
+    'errors': 0.1,
+    # Share of the urls which are percent-encoded as a whole, the others only encode what they must
+    'encoded': 0.05,
+    # Shape of the Pareto distribution ids are drawn from, lower values give more distinct ids
+    'id_skew': 1.2,
+    # Number of distinct /OTRL... booking references
+    'references': 100000,
+}
+
+# Slowdowns and memory growth up to this share of the baseline aren't reported as regressions
+default_tolerance = 0.2
+
+# Stages faster than this are too noisy to compare with the baseline
+stage_noise_seconds = 0.05
+
+# Growth of the parse memory below this many MB is too noisy to compare with the baseline
+rss_noise_mb = 5
+
+stages = ['filter', 'regex', 'unquote', 'normalize', 'aggregate']
+
+
+def synthetic_url(generator, url, mix):
+    # Ids are drawn from a small pool so raw urls repeat, like they do in real traffic
+    while '{id}' in url:
+        url = url.replace('{id}', str(int(generator.paretovariate(mix['id_skew'])) * 7), 1)
+    url = url.replace('{fare}', f'{generator.randrange(500)}|SOUTHERN')
+    url = url.replace('{ref}', f'OTRL{generator.randrange(mix["references"]):08d}')
+    if generator.random() < mix['encoded']:
+        return urllib.parse.quote(url, safe='')
+    return urllib.parse.quote(url, safe='/?&=')
+
+
+def synthetic_lines(line_count, seed=1, mix=default_mix):
+    """Yield log lines as bytes, with the mix of endpoints, errors and other programs given in mix."""
+    generator = random.Random(seed)
+    weights = [weight for weight, _, _ in endpoints]
+    for number in range(line_count):
+        if generator.random() < mix['noise']:
+            yield b'Oct 18 10:00:00 lb1 kernel: [12345.678] eth0: link up\n'
+            continue
+
+        _, method, url = generator.choices(endpoints, weights)[0]
+        url = synthetic_url(generator, url, mix)
+        status = generator.choice(error_statuses if generator.random() < mix['errors'] else success_statuses)
+        total_time = generator.randrange(1, 900)
+        line = (
+            f'Oct 18 10:00:00 lb1 otrl_haproxy[1234]: 10.0.0.1:51234 [18/Oct/2026:10:{number // 60000 % 60:02d}:{number // 1000 % 60:02d}.123] '
+            f'https~ backend/web1 0/0/1/{total_time - 1}/{total_time} {status} '
+            f'{generator.randrange(100, 50000)} - - ---- 10/10/1/1/0 0/0 "{method} {url} HTTP/1.1"\n'
+        )
+        yield line.encode('ascii')
+
+
+# The parse loop as it was before the bytes pre-filter and the endpoint_key cache
+reference_log_pattern = re.compile(
+    r'\/(\d+)\s(\d+)\s+(\d+)\s+-.*?"(GET|POST|PUT|DELETE|PATCH|HEAD) ([^ ]+)'
+)
+
+def reference_update_endpoint_stats(endpoint_stats, lines):
+    for line in lines:
+        if "otrl_haproxy" not in line:
+            continue
+
+        match = reference_log_pattern.search(line)
+        if match:
+            resp_time, status, resp_size, method, url = match.groups()
+            url = urllib.parse.unquote(url)
+            normalized_url = stats_script.normalize_url(url, stats_script.subs)
+            key = f"{method} {normalized_url}"
+            stats = endpoint_stats[key]
+            stats['count'] += 1
+            stats['total_time'] += float(resp_time)
+            stats['total_size'] += int(resp_size)
+            status_int = int(status)
+            if 200 <= status_int < 300:
+                stats['2xx'] += 1
+            elif 400 <= status_int < 500:
+                stats['4xx'] += 1
+            elif 500 <= status_int < 600:
+                stats['5xx'] += 1
+
+
+def staged_update_endpoint_stats(endpoint_stats, lines, stage_seconds):
+    """The parse loop of update_endpoint_stats split into stages, each run over all the lines at once.
+
+    The endpoint_key cache is left out, so the unquote and normalize stages show what subs costs on
+    every line, while update_endpoint_stats only pays it once per distinct raw url.
+    """
+    start = time.perf_counter()
+    kept = [line for line in lines if b"otrl_haproxy" in line]
+    stage_seconds['filter'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    search = stats_script.log_pattern.search
+    matches = [match.groups() for match in map(search, kept) if match]
+    stage_seconds['regex'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    urls = [urllib.parse.unquote(fields[4].decode(stats_script.log_encoding, errors='replace')) for fields in matches]
+    stage_seconds['unquote'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    normalize_url, subs = stats_script.normalize_url, stats_script.subs
+    normalized_urls = [normalize_url(url, subs) for url in urls]
+    stage_seconds['normalize'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for (resp_time, status, resp_size, method, _), url in zip(matches, normalized_urls):
+        stats_script.add_request(endpoint_stats[f"{method.decode('ascii')} {url}"], resp_time, status, resp_size)
+    stage_seconds['aggregate'] = time.perf_counter() - start
+
+
+# The reference loop predates the latency sketches, so only the fields it fills in are compared
+reference_fields = ['count', 'total_time', 'total_size', '2xx', '4xx', '5xx']
+
+def reference_view(endpoint_stats):
+    return {key: {field: stats[field] for field in reference_fields} for key, stats in endpoint_stats.items()}
+
+def stats_digest(endpoint_stats):
+    """Hash of the statistics, which doesn't depend on the machine or the order endpoints were seen in."""
+    return hashlib.sha1(json.dumps(reference_view(endpoint_stats), sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_benchmark(parser, line_count, seed, mix, repeat):
+    """Generate the log and parse it repeat times with one parser, keeping the fastest run."""
+    lines = list(synthetic_lines(line_count, seed, mix))
+    if parser == 'reference':
+        lines = [line.decode('ascii') for line in lines]
+    generated_rss = peak_rss_mb()
+
+    seconds = None
+    stage_seconds = {}
+    for _ in range(repeat):
+        # Every run starts with an empty endpoint_key cache, like a fresh run of the script does
+        stats_script.endpoint_key.cache_clear()
+        endpoint_stats = stats_script.new_endpoint_stats()
+        run_stage_seconds = {}
+        start = time.perf_counter()
+        if parser == 'reference':
+            reference_update_endpoint_stats(endpoint_stats, lines)
+        elif parser == 'stages':
+            staged_update_endpoint_stats(endpoint_stats, lines, run_stage_seconds)
+        else:
+            stats_script.engines[parser](endpoint_stats, lines)
+        run_seconds = time.perf_counter() - start
+        if seconds is None or run_seconds < seconds:
+            seconds, stage_seconds = run_seconds, run_stage_seconds
+
+    return {
+        'seconds': seconds,
+        'lines_per_sec': line_count / seconds,
+        'peak_rss_mb': peak_rss_mb(),
+        'parse_rss_mb': peak_rss_mb() - generated_rss,
+        'endpoints': len(endpoint_stats),
+        'digest': stats_digest(endpoint_stats),
+        'stages': stage_seconds,
+    }
+
+
+def run_benchmarks(parsers, line_count, seed, mix, repeat):
+    results = {}
+    # A new process per parser, so each peak RSS only covers that parser
+    context = multiprocessing.get_context('spawn')
+    for parser in parsers:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[parser] = executor.submit(run_benchmark, parser, line_count, seed, mix, repeat).result()
+    return results
+
+
+def find_regressions(results, baseline, tolerance):
+    regressions = []
+    for parser, expected in baseline['results'].items():
+        if parser not in results:
+            continue
+        result = results[parser]
+        if result['digest'] != expected['digest']:
+            regressions.append(f"{parser}: the endpoint statistics changed ({expected['endpoints']} -> {result['endpoints']} endpoints)")
+        if result['lines_per_sec'] < expected['lines_per_sec'] * (1 - tolerance):
+            regressions.append(f"{parser}: {expected['lines_per_sec']:.0f} -> {result['lines_per_sec']:.0f} lines/sec")
+        # The peak RSS is mostly the generated log, only the memory the parse adds on top of it is compared
+        if result['parse_rss_mb'] > max(expected['parse_rss_mb'] * (1 + tolerance), expected['parse_rss_mb'] + rss_noise_mb):
+            regressions.append(f"{parser}: parse RSS {expected['parse_rss_mb']:.0f} -> {result['parse_rss_mb']:.0f} MB")
+        for stage, seconds in result['stages'].items():
+            expected_seconds = expected['stages'].get(stage)
+            if expected_seconds is not None and seconds > max(expected_seconds * (1 + tolerance), stage_noise_seconds):
+                regressions.append(f"{parser}: {stage} stage {expected_seconds:.2f} -> {seconds:.2f} seconds")
+    return regressions
+
+
+def print_results(results):
+    print(f"{'Parser':<12} {'Seconds':<10} {'Lines/sec':<12} {'Peak RSS MB':<13} {'Parse RSS MB':<13} {'Endpoints':<10}")
+    for parser, result in results.items():
+        print(f"{parser:<12} {result['seconds']:<10.2f} {result['lines_per_sec']:<12.0f} {result['peak_rss_mb']:<13.0f} {result['parse_rss_mb']:<13.0f} {result['endpoints']:<10}")
+
+    if 'reference' in results and 'python' in results:
+        print(f"Speedup: {results['reference']['seconds'] / results['python']['seconds']:.2f}x")
+
+    if 'stages' in results:
+        stage_seconds = results['stages']['stages']
+        total = sum(stage_seconds.values())
+        print()
+        print(f"{'Stage':<12} {'Seconds':<10} {'Share':<8}")
+        for stage in stages:
+            print(f"{stage:<12} {stage_seconds[stage]:<10.2f} {stage_seconds[stage] / total:<8.0%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the haproxy_endpoint_statistics.py parse loop on a synthetic log.")
+    parser.add_argument("--lines", type=int, default=1000000, help="Number of log lines to generate (default: 1000000)")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the log generator (default: 1)")
+    parser.add_argument("--repeat", type=int, default=3, help="Parse the log this many times and keep the fastest run (default: 3)")
+    parser.add_argument("--noise", type=float, default=default_mix['noise'], help="Share of lines from other programs (default: %(default)s)")
+    parser.add_argument("--errors", type=float, default=default_mix['errors'], help="Share of requests with a 4xx or 5xx status (default: %(default)s)")
+    parser.add_argument("--encoded", type=float, default=default_mix['encoded'], help="Share of fully percent-encoded urls (default: %(default)s)")
+    parser.add_argument("--id-skew", type=float, default=default_mix['id_skew'], help="Pareto shape of the ids in urls, lower gives more distinct ids (default: %(default)s)")
+    parser.add_argument("--references", type=int, default=default_mix['references'], help="Number of distinct /OTRL references (default: %(default)s)")
+    parser.add_argument("--write", metavar="FILE", help="Write the generated log to this file (.gz is compressed) instead of running the benchmarks")
+    parser.add_argument("--baseline", help="Compare the results with this baseline file and fail on regressions")
+    parser.add_argument("--save-baseline", metavar="FILE", help="Save the results as a baseline to compare later runs with")
+    parser.add_argument("--tolerance", type=float, default=default_tolerance, help="Share a parser may get slower or bigger before it is a regression (default: %(default)s)")
+    args = parser.parse_args()
+
+    mix = {
+        'noise': args.noise,
+        'errors': args.errors,
+        'encoded': args.encoded,
+        'id_skew': args.id_skew,
+        'references': args.references,
+    }
+
+    if args.write:
+        opener = gzip.open if args.write.endswith('.gz') else open
+        with opener(args.write, 'wb') as log_file:
+            log_file.writelines(synthetic_lines(args.lines, args.seed, mix))
+        print(f"Wrote {args.lines} lines to {args.write}")
+        sys.exit(0)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if (baseline['lines'], baseline['seed'], baseline['mix']) != (args.lines, args.seed, mix):
+            parser.error(f"The baseline was made with --lines {baseline['lines']} --seed {baseline['seed']} and mix {baseline['mix']}, run with the same options")
+
+    parsers = ['reference', 'python', 'stages']
+    if stats_script.numpy is not None:
+        parsers.append('numpy')
+    results = run_benchmarks(parsers, args.lines, args.seed, mix, args.repeat)
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as baseline_file:
+            json.dump({'lines': args.lines, 'seed': args.seed, 'mix': mix, 'results': results}, baseline_file, indent=2)
+        print(f"Saved the baseline to {args.save_baseline}")
+
+    digests = {result['digest'] for result in results.values()}
+    if len(digests) != 1:
+        raise SystemExit("The parsers produced different endpoint statistics: " + ", ".join(f"{parser} {result['digest'][:12]}" for parser, result in results.items()))
+
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, args.tolerance)
+        if regressions:
+            raise SystemExit("Regressions against " + args.baseline + ":\n" + "\n".join(regressions))
+        print(f"No regressions against {args.baseline}")
@@ -5,10 +5,18 @@
 #       export AWS_SECRET_ACCESS_KEY="your secret"
 #       python ec2_instances.py
 #
+#       To list the instances of several regions, set AWS_REGIONS:
+#       export AWS_REGIONS="eu-west-1,eu-west-2"
+#
+#       The instances are read from the inventory cache of ec2_inventory.py,
+#       which only asks AWS once the cache is older than its TTL.
+#
 
 import os
-import boto3
+import json
+import hashlib
 import datetime
+from ec2_inventory import AWS_REGIONS, open_inventory, refresh_inventory, cached_instances
 
 ## The boto3 client expects the AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY
 ## to be environment variables.  Make sure they are set before running
@@ -20,7 +28,6 @@ import datetime
 
 AWS_KEY = os.environ['AWS_ACCESS_KEY_ID']
 AWS_SECRET = os.environ['AWS_SECRET_ACCESS_KEY']
-AWS_REGION = "eu-west-1"
 
 output_file = "instances.html"
 default_domain = "otrldev.uk"
@@ -31,53 +38,41 @@ now = datetime.datetime.now()
 days_until_warning = 30
 days_until_danger = 60
 
+## Hash of the last page written, so an unchanged page isn't written again. The rows
+## themselves are rendered on every run, which is cheaper than caching them
+render_cache_file = "instances.cache.json"
 
-def main():
-
-    ## Get all running EC2 Instances so we can build the sidbox list
-    ec2 = boto3.client('ec2', region_name=AWS_REGION)
-    ec2instances = ec2.describe_instances(
-        Filters=[
-            {
-                'Name': 'tag:role',
-                'Values': [
-                    'test',
-                ]
-            },
-        ]
-    ).get("Reservations")
-
-    instances = {}
-    for reservation in ec2instances:
-        for instance in reservation["Instances"]:
-            tags = instance["Tags"]
-            build_tags = {}
-
-            for tag in tags:
-                build_tags[tag["Key"]] = tag["Value"]
-
-            if build_tags["build"] != "buildandscan":
-                instances[build_tags["build"]] = {}
-                instances[build_tags["build"]]['name'] = build_tags["build"]
-                instances[build_tags["build"]]['owner'] = build_tags["launched_by_name"] if build_tags["launched_by_name"] != "" else 'Unknown'
-                instances[build_tags["build"]]['website'] = 'https://southern.' + build_tags['hostname']
-                instances[build_tags["build"]]['hostname'] = build_tags['hostname']
-                instances[build_tags["build"]]['portainer'] = 'http://' + build_tags['hostname'] + ":9000"
-                instances[build_tags["build"]]['rabbit'] = ""
-                instances[build_tags["build"]]['admin'] = 'http://admin-southeastern.' + build_tags['hostname']
-                instances[build_tags["build"]]['launched_at'] = build_tags['launched_at']
-                instances[build_tags["build"]]['running'] = instance["State"]["Name"] == "running"
+## Brand logos, written once per page as CSS classes rather than once per row
+brand_logos = {
+    'ticketyboo': 'iVBORw0KGgoAAAANSUhEUgAAACEAAAAgCAIAAAAT2oadAAAKSWlDQ1BzUkdCIElFQzYxOTY2LTIuMQAASImdU3dYk/cWPt/3ZQ9WQtjwsZdsgQAiI6wIyBBZohCSAGGEEBJAxYWIClYUFRGcSFXEgtUKSJ2I4qAouGdBiohai1VcOO4f3Ke1fXrv7e371/u855zn/M55zw+AERImkeaiagA5UoU8Otgfj09IxMm9gAIVSOAEIBDmy8JnBcUAAPADeXh+dLA//AGvbwACAHDVLiQSx+H/g7pQJlcAIJEA4CIS5wsBkFIAyC5UyBQAyBgAsFOzZAoAlAAAbHl8QiIAqg0A7PRJPgUA2KmT3BcA2KIcqQgAjQEAmShHJAJAuwBgVYFSLALAwgCgrEAiLgTArgGAWbYyRwKAvQUAdo5YkA9AYACAmUIszAAgOAIAQx4TzQMgTAOgMNK/4KlfcIW4SAEAwMuVzZdL0jMUuJXQGnfy8ODiIeLCbLFCYRcpEGYJ5CKcl5sjE0jnA0zODAAAGvnRwf44P5Dn5uTh5mbnbO/0xaL+a/BvIj4h8d/+vIwCBAAQTs/v2l/l5dYDcMcBsHW/a6lbANpWAGjf+V0z2wmgWgrQevmLeTj8QB6eoVDIPB0cCgsL7SViob0w44s+/zPhb+CLfvb8QB7+23rwAHGaQJmtwKOD/XFhbnauUo7nywRCMW735yP+x4V//Y4p0eI0sVwsFYrxWIm4UCJNx3m5UpFEIcmV4hLpfzLxH5b9CZN3DQCshk/ATrYHtctswH7uAQKLDljSdgBAfvMtjBoLkQAQZzQyefcAAJO/+Y9AKwEAzZek4wAAvOgYXKiUF0zGCAAARKCBKrBBBwzBFKzADpzBHbzAFwJhBkRADCTAPBBCBuSAHAqhGJZBGVTAOtgEtbADGqARmuEQtMExOA3n4BJcgetwFwZgGJ7CGLyGCQRByAgTYSE6iBFijtgizggXmY4EImFINJKApCDpiBRRIsXIcqQCqUJqkV1II/ItchQ5jVxA+pDbyCAyivyKvEcxlIGyUQPUAnVAuagfGorGoHPRdDQPXYCWomvRGrQePYC2oqfRS+h1dAB9io5jgNExDmaM2WFcjIdFYIlYGibHFmPlWDVWjzVjHVg3dhUbwJ5h7wgkAouAE+wIXoQQwmyCkJBHWExYQ6gl7CO0EroIVwmDhDHCJyKTqE+0JXoS+cR4YjqxkFhGrCbuIR4hniVeJw4TX5NIJA7JkuROCiElkDJJC0lrSNtILaRTpD7SEGmcTCbrkG3J3uQIsoCsIJeRt5APkE+S+8nD5LcUOsWI4kwJoiRSpJQSSjVlP+UEpZ8yQpmgqlHNqZ7UCKqIOp9aSW2gdlAvU4epEzR1miXNmxZDy6Qto9XQmmlnafdoL+l0ugndgx5Fl9CX0mvoB+nn6YP0dwwNhg2Dx0hiKBlrGXsZpxi3GS+ZTKYF05eZyFQw1zIbmWeYD5hvVVgq9ip8FZHKEpU6lVaVfpXnqlRVc1U/1XmqC1SrVQ+rXlZ9pkZVs1DjqQnUFqvVqR1Vu6k2rs5Sd1KPUM9RX6O+X/2C+mMNsoaFRqCGSKNUY7fGGY0hFsYyZfFYQtZyVgPrLGuYTWJbsvnsTHYF+xt2L3tMU0NzqmasZpFmneZxzQEOxrHg8DnZnErOIc4NznstAy0/LbHWaq1mrX6tN9p62r7aYu1y7Rbt69rvdXCdQJ0snfU6bTr3dQm6NrpRuoW623XP6j7TY+t56Qn1yvUO6d3RR/Vt9KP1F+rv1u/RHzcwNAg2kBlsMThj8MyQY+hrmGm40fCE4agRy2i6kcRoo9FJoye4Ju6HZ+M1eBc+ZqxvHGKsNN5l3Gs8YWJpMtukxKTF5L4pzZRrmma60bTTdMzMyCzcrNisyeyOOdWca55hvtm82/yNhaVFnMVKizaLx5balnzLBZZNlvesmFY+VnlW9VbXrEnWXOss623WV2xQG1ebDJs6m8u2qK2brcR2m23fFOIUjynSKfVTbtox7PzsCuya7AbtOfZh9iX2bfbPHcwcEh3WO3Q7fHJ0dcx2bHC866ThNMOpxKnD6VdnG2ehc53zNRemS5DLEpd2lxdTbaeKp26fesuV5RruutK10/Wjm7ub3K3ZbdTdzD3Ffav7TS6bG8ldwz3vQfTw91jicczjnaebp8LzkOcvXnZeWV77vR5Ps5wmntYwbcjbxFvgvct7YDo+PWX6zukDPsY+Ap96n4e+pr4i3z2+I37Wfpl+B/ye+zv6y/2P+L/hefIW8U4FYAHBAeUBvYEagbMDawMfBJkEpQc1BY0FuwYvDD4VQgwJDVkfcpNvwBfyG/ljM9xnLJrRFcoInRVaG/owzCZMHtYRjobPCN8Qfm+m+UzpzLYIiOBHbIi4H2kZmRf5fRQpKjKqLupRtFN0cXT3LNas5Fn7Z72O8Y+pjLk722q2cnZnrGpsUmxj7Ju4gLiquIF4h/hF8ZcSdBMkCe2J5MTYxD2J43MC52yaM5zkmlSWdGOu5dyiuRfm6c7Lnnc8WTVZkHw4hZgSl7I/5YMgQlAvGE/lp25NHRPyhJuFT0W+oo2iUbG3uEo8kuadVpX2ON07fUP6aIZPRnXGMwlPUit5kRmSuSPzTVZE1t6sz9lx2S05lJyUnKNSDWmWtCvXMLcot09mKyuTDeR55m3KG5OHyvfkI/lz89sVbIVM0aO0Uq5QDhZML6greFsYW3i4SL1IWtQz32b+6vkjC4IWfL2QsFC4sLPYuHhZ8eAiv0W7FiOLUxd3LjFdUrpkeGnw0n3LaMuylv1Q4lhSVfJqedzyjlKD0qWlQyuCVzSVqZTJy26u9Fq5YxVhlWRV72qX1VtWfyoXlV+scKyorviwRrjm4ldOX9V89Xlt2treSrfK7etI66Trbqz3Wb+vSr1qQdXQhvANrRvxjeUbX21K3nShemr1js20zcrNAzVhNe1bzLas2/KhNqP2ep1/XctW/a2rt77ZJtrWv913e/MOgx0VO97vlOy8tSt4V2u9RX31btLugt2PGmIbur/mft24R3dPxZ6Pe6V7B/ZF7+tqdG9s3K+/v7IJbVI2jR5IOnDlm4Bv2pvtmne1cFoqDsJB5cEn36Z8e+NQ6KHOw9zDzd+Zf7f1COtIeSvSOr91rC2jbaA9ob3v6IyjnR1eHUe+t/9+7zHjY3XHNY9XnqCdKD3x+eSCk+OnZKeenU4/PdSZ3Hn3TPyZa11RXb1nQ8+ePxd07ky3X/fJ897nj13wvHD0Ivdi2yW3S609rj1HfnD94UivW2/rZffL7Vc8rnT0Tes70e/Tf/pqwNVz1/jXLl2feb3vxuwbt24m3Ry4Jbr1+Hb27Rd3Cu5M3F16j3iv/L7a/eoH+g/qf7T+sWXAbeD4YMBgz8NZD+8OCYee/pT/04fh0kfMR9UjRiONj50fHxsNGr3yZM6T4aeypxPPyn5W/3nrc6vn3/3i+0vPWPzY8Av5i8+/rnmp83Lvq6mvOscjxx+8znk98ab8rc7bfe+477rfx70fmSj8QP5Q89H6Y8en0E/3Pud8/vwv94Tz+y1HOM8AAAAgY0hSTQAAeiYAAICEAAD6AAAAgOgAAHUwAADqYAAAOpgAABdwnLpRPAAABDdJREFUSIntVk2IllUUfs657zvfOORPi7SfhZM/k4Im+FOCOQyVqbQajVpUhAXVoh8hDCJBcWGFFdEmk7SQaGWUIbTIKVOs7MexyLFSKCLyZ7KaEdPve+95nhavjrRo6W7u4nLPufee55xzz3m4JgmXefjlBhjFGMW4XBhktIJA1DIFAGSMzECIFSQAwQwg5wpAzrneZVT13VpzUX9J47CUrD4cjMoNjMqRAUAEomq1zEuKFJKlTBZFSdLdAZAGqvamKAoyiqIYwajXFpHdnOLHfR+TVERKfusdy9xAwS2AVJtwTxdiZbinKudkHublf/NNBil3c08556IorFVVyS3Lenq6HUbJzQBMGDdu5YqVqx56MEgAyQUkIKrKUlIQyeGeghkRnlxIdWQXkTgielkUENuSJ/OQ3FxiAH8MD7/x1raTx08kKbkDdRCpLAwRyYgIMgyWyoaQACECrICgcDGTBFCQ4cnJIAmz8ePHdi9avHf/vr+GhgX77ttDS5YtO/D555/s2TMwMDBj5sy7eldM7ZpqohdtO3a823+of3Dw1JxZs3vvvufqSZPcIFIwCmQURQmgqONNXqB2VZKio719aGg4pMmTO7dve3Pzm1sFc+CnX37+qG/3cxufXzh//pOrV3/df1CUm31/5IdP9+3d9Mqrk6+71hwIeUruXr+ck2ESAJlB+HP4zK4PP/z95ClJt/f0dM2csf2dtwFLkAEJaLaqDRvWf/blV9/0HwRlZgaD8NvxE6++uKku/ZQSSTIgou5BTyUZDpOpo9GY0tkJCIbPDnyxa+cH/zRbBnV2dm57ffM1EycJ+nvozKd9uynR7Lbu7m1bXnMDzI78dNQZpEstl9zckwNwd0RuukMSpCvHT7j3/gdumrdAsvPnm4ePDJhkMgnwkuYmuEFQnT3BTg+fpSAhGeLUsXMvrzq74T792g+StEv9AbNFtyyGGyQTae5AiFu3bH38icfONZsmyADAgAnjxj67dt2ap5+iYGYj9XrT3HkbZ0TevxuAz1l4xZo3IudUNNw9UTxfZTNQkiQzAIKmT5nS1TX90Ycf6Wg0ANVF0d5orFu3buHN8xfMnVfbF2DSNRMnrl/7jNo7Ap4jJTcAqWgAsNxsprY2AC9sfE5W1xUB6+q6oXdlr4Pw8vD3A3s+6Tt67NjUadOWLlk6bfr1npwZO3e+f+SHHwcHB2+cPWv58juvmnSVnT1dvfcSpMaKNRo7QXL3ZJIiN80AKwAD5A4gIRhGh8wdSKwqFKVb3cAhwryszp8r28fkKixZzQVUknKyRGaY1/TjuZVTanMU7okXqDeRgeSmkJVAYtBLBxnMMI+ArCRZto8RK5hEMjIFQ8vgofBUihcI2CTV3JJz9lQ4RBgANwBBApbcIFZmBUGGiqKoWS9IR8hKkDBzNwY9eW1whElt9H81ijGK8b/jXwUzirlWg1KaAAAAAElFTkSuQmCC',
+    'southeastern': 'iVBORw0KGgoAAAANSUhEUgAAAEgAAABICAMAAABiM0N1AAACEFBMVEUAAAAdr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+UZruUdr+Udr+Udr+Udr+Udr+UdG1D///8dr+UeHFEAADcgsOazs8UgHlMaGE4AADkAoeEbGU8An+AAAC8UEkkAADQPDUZPTXcFAz4AADHQz9oJqOMXFUs8OmgVreQKCEEBpeIAo+EDATwaruUFp+MRD0cIBkAAACwAACcMCkP7/v8NquMAACkRq+QZF037+/w0t+g+PGoyMGBpaIv1/P53z/Blye1CvOqlpLnz8/bx8fQmsubV1d+6ucq2tcd4d5ZkY4ZZWH8kIlXl9vzg9Pz29vhTwuzm5esAnt+vrsKenbSQj6mMi6ZLSnQAACTp+P3W8fu55/ei3vTu7fJpyu48uuna2uPJyNXFxdLCwtC/vsysq76ZmbF0dJNRUHhEQ244NmYmJVfO7vrE6viT2fOL1vKE1PHn5+xKv+rj4+kvtucstOfMzNioqLxvbo8tLFwAAB3u+f34+PrJ7Pm05fZwze/o6O5gx+2iobeGhaGDgp9XVX3w+v2u4/an4PWb3PR/0vFYxOzS0t2UlKyJiKSAfp18eplfXoJOTXUqKVq/6fjq6u/e3uaVk61WVHyBgJ5MfWgmAAAAJnRSTlMA8rGcjU/56+HbbEU6LgTFuKmjfWdWCObWzsCUXicfGP7TNHMTeRokMPkAAAg9SURBVFjDnZiHX9NAFMcLKIIDBffezSUlbdo0ldrYPe1gKaDIFkQFVJS9RVQEBPfee/+LvneNtS2lgj8+Hz5NcvnevXfv3r2LKp12rdq/PXPb3i17965dl3Vw407V/2jTqmVbSZJyC3bsXiJmddZmQrUnHLS44S9sdRFUdv7GJWA2riWosF0Q3NbqEtCUy+IQHEEKy92/aXGY5WiSJiwIrpvHO8dP3zkKOnb66svXLdUOgwVRm1cuArMzk4Dshj1vOk8zSbpz/0G14HBpCNm66l+cDdkwGrtwawIoqXSs86ZDIIDanhaTlw+YoGHq1VFGUfHk4b7awv6e780x1qVKwQ6kvTvTxM0WsEqwXFcwJ2qePitTB5w6ndMWmf08NHBDQXVqDFYNyV6+EGdfBtFYWysvMlQ15WOcKHlNxohWG5E9NrjQ/6wqjhpYYbDAoDak5qwCsyzC8ShmppQTbXpWHSdWbZLMX95HbXxpcQBpZcrxoJftL6OjOSJyWoWSyHL6+EHa5KLGkJq0Kxs4lnvY5m65JME7KcXyTt9IN42FEiTN91MOcq5ii+mxkJFX3tPKpoDX67UFPLI+NirRVoXtjlLSmiROJvjHTjkzToln8QV9QBK5APulrKxstlEuksxOY3SYvNdXR11eLWjIirzEOIT5MtzHpz9EL48YrSSNNbQVTk+eLC4ubv7W3fu4bsQEz1gkGf312LYp6NaQ/HjObkJI63V8NhgyIYd3Su0zJ5kknXo6Jhqj3URJXwVropu2EY1QiU/O+qIciR9gUunEkGRTSEN4fb2VkIy8+AgKWpqwS84W5ZRdZhbQgM5EPSj7z+FlCYTTsrgZI4ZruLAaJdqdTVasKp6u+lDe8PNZfd27mocK6ZxI548NcKfg6ioat/tPHoOZv4VtykPAAZkfM9TO+lmbZDZzHAf/der2NngTNKLDNjhsvKqAGMhSQFtgQC/gXo8o0/k1sTCg4sFZSfTKsUjUmzjRO4yoKnM0pFh/G86cO0zIgWh+hjxWgvBRMAzlLEUL5nR6NjGoWaNfD76r0SmgQADNvQJDWk9BBTCgV3TGlDeKEPREVM+X0TPJMLWcEuR86DYuOreVbKb7TjYJkmNwp5RjFdARuDovpQB51GcYphBBVCbTN2h500HIasz1hAhX4LpXiqiXCGJ97zHNGQiNgCwA4eIo97FLBjlx4i5YwyQXQLlg2XOGaW60qZcEQkV0PYptu1S7CHG0YC7j9EsHseJTXCdg2w50kQGX6weRXSIIxbXjtuJwgZPWg4swGoc5dQLoaUitTZbeZJtMBAUaIXZPg5PWga+tmBiLZ72JoH7JrEsW5z/SnAiSveCko7csZItqHQkTWPjfI554EOhtVWGyzg5A/wkgPTeA3raTDNVWYrkF4dhjk5NAqZUMMv+AO48cANpC3F3wu1anXTIIJT7B5SYAKIfYK/HpPNDlofJTiYTa+rZ5IPNHuPMAQZsXAJ0sm+uwJZBmQv658nkg3E+OIyh3AdMG/CzfURcPKhV5U9GNZNN+Kaahs0ug+ugriiSCen0Bee5dPKihQy/JJ5NB5zFLorO3kWD1HUj7HmOSjz6axeG78aDuL2LRTPKsSbjptiAon1jDF2GfGQskz9rhPiZJ/WeSnR1x9sOdLjfJUS0jLsclmtIXO/21cSCPFpx2QRMm21Q7lK3odmzRYs5Op/44kBP7HHe7YCNZQ4jwiO4NMZDceCidSuUYhxUxa18zYKGUtwLWCEzbDWNssfERDtZnR4fZycVLpwt1dPicnJePC6OzuEIEQvZhQeNyY311SGL/9qS1jZa2jxrV8dKy7aWlbAAwMQXYE7D4qy1kBaTaleCk12ib+BfE++ohs5QVaeMlS4Mwld5AXH++ciWv5UdLGncJFny8l/3D4RqLIdXNOXXxcoq+Xtg4Q9oYSOam6Q5JCD3prCUu4SvceB9SQKxHOgyRde5sYaJqz2FkPfPxf/ozY6J9bg2SbHrM2QHFEab/ZtmmkEJtzMI6EXEqJNncQ+dMQwqi54YMYnVglT7oj3YkjmCCnD6cQr3g3D7RyEYd2cBQV8cq0vVEY3hDqwgzj9WR5zIUAqLNlEJmDMAPsJViO9sNHBDUbGsBouz+LmEclyUHUyIX9cL49ZxsTCVaynx2Aifif4yVrdVCd/7YkOxTtBrzy6zcWN7QMApRl0qsUX7WUN/ugV+heqXOggHFtIJoIJZAt/1qXq/jOCyDU4o3QoybeHDkKD1yGfYQsjPhPGM1jOOTYb+aItILOPxlnPqwG2vROOUTjTt8AUmfQ9p/kljg0Nq0CwzLoYB444QpeuD75Dfx/+BoQ1g+o4PIvMPIGgJuqmRQTySOZ9OZZQs10C6Pt7pSHP42AtxQSRv0N4Y8/IKYiC/wjqEcOI+mOiMfRFIJ9dPd20Vw5khtlWQe7qacR63AyZzPwWgCP5HxaOL/ZPN5sTxOOouK3EgtbdBU2erSQDEDSk2y2ycYqrdDcDZ2eiJKftZrjUWiWfuphqF64YL5wvGk1gZ66q+8x1A1Fw6V6p2SaAaJks5YVl6lnEcuVAj29N8QVkEUEMH9IPYZYrLvcdvHurq6J4M13bGPERMucDPm+zQ6kInfVwzWBxeZBdQ0UU3P/LmrVem1MoPaF2zpbJpPOXa/ghjcgCHL8lT/0u4sAiirIJCWiUvURsUx915VTDmEIGLW7VMtRmsKCCroEOyurpaK46Arb7o0FkGwuAho23LVYrVzWQ5lucJuu0DlcAf3EFRGAThnCcpbnpVL5mlF5o4DqqVrzYbt63IyFG1eW7B/dZqPa78B5Q9OmJ+QqsUAAAAASUVORK5CYII=',
+    'thameslink': 'iVBORw0KGgoAAAANSUhEUgAAAEgAAABICAYAAABV7bNHAAAAAXNSR0IArs4c6QAAAAlwSFlzAAALEwAACxMBAJqcGAAAAVlpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IlhNUCBDb3JlIDUuNC4wIj4KICAgPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICAgICAgPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIKICAgICAgICAgICAgeG1sbnM6dGlmZj0iaHR0cDovL25zLmFkb2JlLmNvbS90aWZmLzEuMC8iPgogICAgICAgICA8dGlmZjpPcmllbnRhdGlvbj4xPC90aWZmOk9yaWVudGF0aW9uPgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAgPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KTMInWQAAEcVJREFUeAHtW2uMXdV1XvfOfY6NZ2wjCAYTAzK2eRmXBqjVkpCqiSJQIkVqfhT6o+ojiqqo/dc/VdX2R9Uf/VGpqhJVkSoFtZX6SEmrRjRKlCokjQVpMTaE12ACIQKMY4w9nvuY++j61t7fuevse869M2PTpko2zF1rr/dee+19zj7nuDIajcby01aagWop56cMy0CtUqkYMh6PhThzAxpbGQ90ynkZ0qhPSHkvS57XKeJDDjK0gX6ZnJcFnjbaAZ04oZetbGWJ+QC9sR9nfKsxb2mJIdP/l21W1ZTFVRRzkZ2UViXBQ+Lemad5PJUBz/PTvpcHPovv7aSy5FGffdonPdVj38uV4WZjK0uMBn8S4JaW2E9CYjhGS1BanmR6uBEZyG9UztveCj7LTxGviDbPL3RsD0ovb5s1Bnn+wSn1CX0gpFGefcqQTjtpn3RuukX6HA95ZdBsRcdlMhU1hmaDAiwKgPxoywBlKe95wMk3x7CrSbzcLY0r5/MSnHm7xfdBGIuOiYK8qPshpsHMygHtIGaPF40BvryfIhkknf7BT/tFOhuhsYpytouuYhTciNH3SsYHeak+/HjKJqDMny0xBgAhzsZwOIyzFMvJ5pW1BA3SqU1YRPc0j1NnAuFhoVqVhYWFXJVAgrFxwGWD8rK2tAcjkZH+lSxzG3d9ITck+qgVOQHtS4/+izx18llZ3nGFDAbDoAzP72FbqC7IO+fOySc//qDcc/fPZp6YGBAYOJnscxwmq8yxJqSiiR6cvSAXvvB1Ga/1pdLQJPDhBWaiXpXRmTVpffQ22fZLd+qu4gsgbAc1OgK0TMb1/fyLK/Knf/wHcuS+j8iZ8xd1VjHzrtFWJKNraKSPY6Fg0oxH+WiC8iRDfMdiS058+2vyC0fvdY5CXCAwCZ6Z0rJ+rJbuEy9I9/cel8qBZZF3daLR4LSlHs9rVb0zku2/+UEjW/KiHu3YaR4dzkSQFNm+fVEO3nO/3LR3j+zp9qb4lLucsFGvy+kLR6XRaEyZTePjACBoVYOrBJuiFZ3Q4YWOdL/8tFQ/sFsqexZl3JushEpzQUYnLkjrj45I88DeoInk2IxObFkFpc5RC8PhSN46vyb7e+vS7Wl5xswyhvcCYtBvnl3VStGZTVrRJCYi1g3Jgn5Fek+fksHnX5Pqx3bI+Hx/Iq7Js2SpTOtDtxl9rOOtLISDBdLD8eb2oEkQIYMVyKP2+cfEok9cUfD1VhFYrpmjSEnXd6ZPW4CYBCxlb9tZ9FXjyLmlN9Y9BnvPqLsunX87LrJP9x21RzfQqzSU/9+r0vjMIWke3BvcqW9vn3i2B1nmnVdcSXbpnlCv16QxrGcZdSKGwvFQN8SBXvV8EJRjkuq1Gm7by8Zuug2V2bWjbcuD+inkzHIA4IeqQRaQ3Fg933tVBo+ckuqhtozXlaYsxBeayr41lvbHDktFr17Y0MsmJtuDoDgxILLW6cjKk8fkyh3b5d3VNdVHOWG4oXHgQ10WS9sWZUn3LATNAWgnCMaZefPts9Ltr0tVEw/exFIUU7Ct3ZSzzxyT9fVBICa/WSISOrrkoXrGw7F0v3pCxl2dNK2WSjckzWJqaUJOrUn9d2+Q5m37oiWMHMel0PXjsCWWDYriKnn93uvk05/9bdm9a6cFTOUokgEM+Edn35GXXnlVUCVsY1WAv5HOKC7f991zl7TbLdvbymzh3uf2QzfL0tISzRj08Xk8J4QOJkWN91/+ofS/+LxUDi+K9JWG2bAchAyMX1iX1ufulOpiU1UwqXlL3sfUjSJEIdDTjVnvsnPK9ENzIzXeajbl2BNPygO/8TvycwdusHsm1gcSdn71oly5c1n+4s/+RPZcc43Zraa3DGqQthFwTa9m0AXumw/c04H7WT/3+cek+5lvS/WBnSIXtRpZ/FpN47d6Uj28W3b9+a/KwvK27H6pzN5kyhOJZnP6UpuIZN12qyXn9GrHiQC0sen4bNPUhLfbbbs7XlxsZ3qzkDQ5kE1pSFiWGDjUfv+1t6X/Nyel+sHtItllXSNCULh6He9J6w8PZ8lhBXjbnAjQkFtzQgHPRAWB7iFw/uE4ggbYsr3FumowQgVM2hB349ogi1dxtFEEGYspzPihnEFNDlr38Wdl9K0LuqHVbS9CAiycBYXv9KX6iSulfe+hidWY5AkhPxG5yzyE4IxJKoKgMTAaBW0dugrR7C4aiHaJe1tBjKmD4CU2xKwTtH76nPT+6YRU7tYq1SuXeQAPGWrr5nxsTdqP3Cu1q5fDGBCI8mc1qyAIcACzhMFLk5OXn+0sL3sZe3FiusdekOE/n5HK7oZWj1Y/4sVfTSf1gl5Bj14hrftuDY7nJAZCyEn2VsMP3OPBWv4Xij6h2JRrGglmzP60bDBrNnMsIWeCuqkd0ila1KdOxoMfjWf47kXpPvq0yJ24MqkF+LXEaSx6rBh/c00aD90m9euvCubBMxFEPGmZ3UiaqiAGQBUqEJLuIS7oiAnNoGaGMVrGAqv0N7XtYyCP0BvxQ+sdf1mGf/26VPe09NIebgwtGtxIdwZSuaUp7Q/fbuHYjSEmOQZHf94H8SqrxUPiCIY4IWm+bzSNVle7zUqAPnxI5BsCoI0UQhI0/vm+x1EpOJSOOn3pfFmPFfvr4XEGHmmACX5NL+0n9Mbw4QPS2H9tmMCYGNr3EPZ9y5aYJzJ7njYP11jUbQwKHavzci0EhUboJUkrioM8Wz7RRu/kK7L+V69I5UY9VuDGEOsC84NJwDFCCe2P6rECh1Hdm8KxIvj3fj1OP1kFFTE9bR5u+02cGUyd1Y/GEOh5bTrPU6d7M+VQJTrgsd4+dB7TvUdvvlFNoUQCrDSVv9KR+q/fKM1b3h8cYO+ZMXneJ/BsD5oOb+MUmwvLSNRBDOgbNG7OWFFl5ATmdcxXmITeC69L/5GXpHIwHkotQ8Gn/Z4aSPvBI1Jt6X0Rqsl05zmY8C9LgjBtCIapiPUTvYSIyAPRz1IU2hxQY3Yo1RnufP2kVok+69FDqAyiF6wqVM8POlL7reulefjGzdl30nP3IM52Cp0NQ6sIOqZID3ghW4g3xuzlacvTNoXHJbL+/be0ep6R6v3bwqEUc4ElhKUG+ExfWp/QY8UVWl3QAW0TDXFmFTQvaM46YCprl3nzHQNgHIAJyccHO/wDfcpuMiCas71G5TvffFbG312TyqIeKfURR0iAQr0xlDN9WfjU1dK6+0Bw6eL2PlO/jIEw26SZACiU4cFTnp/RiBjUAJPBeTbtA/IPfNIpO9VXs4GmR5s3zkrv709K5SgeaWBNxYY84c75yY40P3mH1K7Ux62xemgPkDi0inDKZBVE+0XQZ5yZTeU0Lm38VYigShrt0dasPmXMlJlEHWn1/OdzMvrKWaks6b0PLt3xcmn3PThWfHhJ2j9/i8kilpydQJ36ZRxgUD7bg0jwTOLMMGUIwWcLYfM3QPJmwSJbkKfPnC4GqvsL3nX1vqSH0rv0rlkv9+PskqkZxDOfx9ek+St3SP3a3UE9qWb49H85H7ED/5CxCioKkgYgDzwNONXZeEqKwgk0BuV9GY0qcaC9/1qR4d++IXKVnrvi82YrXiytNX0udbgt7Q+FQyku7WmsMOd9oO9lgLNfuMSgzD8oo0HBG/U4+JOzMxaaX14eh2Ro3j5tMSgvA9ws6A/4o9WuHiueErlFlxYYmXmdcX1TOn6iI42HD0n9hmuCGcSN/3RMbMCLxkMZDwsTVBYoHECZBugQEFey4lZGD9KprbQ/sRkG2D3xigz+8lWpvl+f+WRPDJWnS2/c073oqpq0P6LHCvRtb1L/k9xk5ugH0I/X0yFsCQKRDBDLcBjiH+TK2+ykFOl5n1N8HaDdGPYH0v2KHkr3ImznA3zsPS/qofShm+xdl9nQeHUwU+ZSwizf2WXeK/mMejoM8c/TgbtwFfdBeTxolQVURucgu/quq//FFX3PHi/tcIrkwDvc/GAk7Qfu1GTpA/8tHCtCdPnfwiVWFGgRjaYQ23QayL0EaBWg+jiU6tWq+7WT+sGBvuvCXoPDKpseK0avrknts/ukdfsNkeqnjILzYVocucs8mYSpOdD553lxIpUUgtJV7dgeD+RCG0hG0ry1/qk3tHqek8rPaPXgysUGIfw9ty7tj+u7rm0tq3KY4zjoz/ehTrrHWQjkWQVRkYKAaBQibsT443VACqUYZtUGZj8hdq+X4t4HeRkNGyjelmjrfEMPpSc7dqzAm1MNLiwvVNObPVl4+Bpp3bU/mEAYMeFpnOwTQqEMBy97qwEhZg8MNN/3eKFsUIm/k/LXXSvHQcfb8jgFMxoSpHGtv35G+n/3jFTu00OpXqli7kMScLV6St91/b4eSnduj3vP9Fho28fucfIJGUO2xMgAhGLaPI3KXsanwfCMMNuWtzGFxzg63/qejL5xTirbdfPF24o4mWO86zqn77r0DWrr6MFMHbH6eD3uY/d4puwQ6GVXMS/sccoX0cgD9Lt9PiUhU1m+VHaeLSuRWD2Dt98Nx4oP6H2PPu+xwcOhGrRL+3f0WPEpPVa8b1ewy+SpPttcfxRMIPT8uBL2VrouNQ7dtKXJ2KT7xIsy/IfT9q4rPBBTJpKHh/H63r1y93Zpb+Jd12ZjsSXmS3CzBijvrith18kGGTK1qXwhAbo5D/ULt+6jemN4e/hOADMKs2a6ocvrP1al+fCt0th3daBp9VzuZhXkS7AsWWV0BISwEdrUhpwlabNhh4HaJ3Rf0Hdd1+kTQRwj0GATew++/Tmg77p+8Q4j68v+APXXlmGyD2XMBKFsQs662RJjApAs4pDyeKaVIHYn62jZPGaIYzo0tW19TQDOUfYJ3b9q9dyoz5rZYoXYjeLz+rbioZulcfN1gZtUj590qnuY+vY84pCZu0nTESGVU4hcTBKlvSTgVB791KZVoE4QWu/Z78vgcy9Ldb/eGKJ6mBxA3AfpBxz2CR32IhxKXaNdQsfKUPIAiWfMiIBe+H0QMpcqkcbMp/yBDSwMLgyU7gKNPUDa8DTgsImXe2P9Mh7vusb6iU/w6xKAz3dXLkr90/qu69Z9ZsKeUceYy2ybYPRBPIXUtTjihGT/6hnCHDQhFWgo7ZMO+D79vrBmn+BpcrFR6P81/aSuUasbnNzdBS0fBCiWRiRZA+uv/FDW//El/RJMbwxRjHq3HDc5e2IoKwNpPajHirZ+xYEHYrqhM2Zvl7TgcfKLcZDn8YlEnCyVyyqIChAqSoR3TBnq4FO8N148Leevu1rWB/rJW8iPNPQL2R+d14+1WzoQy4APIcFRPTZQ/YD0seMyOr4q1fv1denF+PE39PEBptIXfu1aaR25KRrA4i6OmYPneBhvVMyNkzKprSxBNAYBb4iK5LPvZfDJ8MEj18vunUvh33VohjCe+oJ+QqxJWl7agcKYarBBu6agMuuvnZb1f1/Rj7/163h9xiPbXGbRX9JD6S/fJQs7wle1qCwfy5QTJaR89gmh43Fvo/AjzpxALMdsIJ6pOOidTlcurF7Ax0Y2zpyIjg/JWV5etiWIQGbZGl3synBVD6V6KZ82ppbVXnVpm1Sb+ip5blnmIintlMUDBUvQrKBpFUbY0sA8jzJFMNXLycB+TF6OXtKZaatEZyvkwn9xWJTRIpp3iI8xTSYSmU5OctGnv14/w7GiqJQRE0Tvk/63WpageQmYFZDXBR7WRn4QW5rxWFWzfL/XvKnHHRhgGOS0a/IIUwnQkQhfAKEf9h2vB9y3tA8eJIp0UprXJc/TzJYbl+cRpx5k0TK6DsBdJgITvyBTyOMTiY1jG9VnKPS7cQ8hXshvRTf14+Pd0hJDEBxManwWL5Xdap9JYAyX4nOe7tQSQ9AMwA/A05hh0gghz6C9bop7+ZTn+0VyoMGH9+Nx6EPG63rc2wee6nq+2dGrz9QSA2Oe4iy+d/L/HS98YDZv8Cl/1gz5BG1UzusU4ZfLTpHtlGbPg7Y64NTYvH7qZ578jwM/ex7kgykayKxZo/wsGW//UnH6m2fncsRT+LgDhhmExxlQSvOBeB5xz4cN2C6jkVcGGUMKfbwpz8dBu6kM+uQRgvY//WGXnwTQ/RIAAAAASUVORK5CYII=',
+    'greatnorthern': 'iVBORw0KGgoAAAANSUhEUgAAAEgAAABICAYAAABV7bNHAAAAAXNSR0IArs4c6QAAAAlwSFlzAAALEwAACxMBAJqcGAAAAVlpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IlhNUCBDb3JlIDUuNC4wIj4KICAgPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICAgICAgPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIKICAgICAgICAgICAgeG1sbnM6dGlmZj0iaHR0cDovL25zLmFkb2JlLmNvbS90aWZmLzEuMC8iPgogICAgICAgICA8dGlmZjpPcmllbnRhdGlvbj4xPC90aWZmOk9yaWVudGF0aW9uPgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAgPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KTMInWQAAF2VJREFUeAHtWwl8ldWV/+e9vJeFkIWsQAhhR5awiIJQKqBDW3Hcflrb2qnLzLTWdpyZ1rZjF/21th2n02lHnc44001bOm0dx9K6VKs/64YCAiIoyI4QlgRISEhI8pZkzv9873y578tLApH5TTvtxffde88959xz/t+56xezuru7e/DH1C8CoX5b/tigCGRnZWVpoaenB1Y2bEiz1F8b6cbn8hjN5C03fpfX2lyZTO3kI4/pYL0/PpeX5WAyPaRb2XKXN2soQ8w10FX2u1weqs1DGmJE+v8yDRQ1/dmVyeZMeoK0kBHc3MpuZy7NLQd52Oa2B+suP8sDtbt6grzWZvJWN/1GD8pZ3eXrr6w6hjLETOEfQj6kIfaHAIz5qAAFw9Ma3fx0eMh/unyu7qGUB+onU1sm2mD9UkbnoODy1p+ygehss/Zg7hritrkyxuPSrOzKkI91m3StzZU3f6ytv9x0DZiLMqY+nZLmJjPKOnPbjWb8bpvRTJ71YNl4zjQ3u03O+g3aY+2nm7t6M+6DXAdOV2mQ72zoCOq0elB3sG58bn66PJQxoFnOCBAb/pg8BHQOIrr8MQ1U9kTSeYwWlDW6q894rM1y69vqg/EFdbpyVjYeV7eV3dzKJmc56fo7m/sgKrTwdMvWqeXWZjnpmcqkWXLnBZ8GmTvlH1Omfk3nYHpceVUmD1/2bAJkys9WTud75F96IiBBWoAjBWwm0NI5B69liRKmdE6p9jUsneX3oeZGjh8RTlTSB9d343F9U4CMYMyuYmv7fcwH88fazTfzm3Qrp61ibAiFQmhracPWTTsR64whS+peSFto984Lpjhzzqg0XitbpBo9k6Txum2Z5IwvPacPuXlRTJg2DiWlRWkR4mo83XK2y2ioPfrTZ/Chj9+PZahCFxIuy+98OSQvJYlu1C2pxV/fcyOm1k2EzLNyZAgNadrQG8W+oQacj2KMuaAUXS1xCbfBpkUPN4sLfd+pl66gs0HerPznMxpviqLTrtGUzwLDGKRR1Vg9lfu07t6G7PwwXntuN+779IP4+4c+i8KS4R5IMhqCvvZKeSsX6+SxYMl2K0SaDfOXzkUFfo2OYzLEpN6d5HKaASQjSp4lDvVI3iOGZoWzEBkW1rxHvgmow+RJjdbEqW4ku4SRdepIJRYpny2y4RxpTIFEHfE2iQva4fAr3sIfzg2pjM+f6MHk80ZhwzO7sGXDNiy6+HztwfXVLVv/lhs4rPt30l6j13vN+NFY9vl5eOTrz6N2Tjm6muJiRcoytUq41RtPiobx2wgBiBZlI96ZxJFNJ3ASnYhLuNuKGEEY+YigrHY4ckdEET8pTsfF6RRwVJ0VycLxLSdxAqeQLQhSOlvkqsYXIRSWuvELL8EMRbPQtrUTR6U3Di/yD0MUVXNKpK8oXnziVZz/7jmIRCMSRR7ABIfJQLJciamH0fqsYmzgRL3+pdfxicV3Y0JdBZJt0i2V6uvzlKse9Sj11uUtMiL2bz2GPORgwY3nYFJdLSprypA3LFcm/DiOHmrCvu31ePWebTiA4xhXW4bocAFUgFKQQlmIHU6g7oMTMbK2HIl4EqHsELpOxbDmP7cg2Z1EtvTTLRHCFIqE0LGnCxOvqMbEWWORTCYRzg6juaEFm36xHVnDgObtp/CdN76ISdPH6zBzo0OVyIM09S9FcOs6SbuNJjRl5gS86+ppePPhvSidOVxD3It546Bm+SWBSEEYnUdjaGpsx3VfWY6LrlgMRiGBCaZYVxwNtzbi5WfWY+XHnkArOlAytQA9cZlIc7PQ0N6Ky264GOcumoVkQgCSl0WDH5nyBL56wwOYfu5odB2P67CNFmbjzcRB3HD55bjyw5cgIfzZAtDubW9j9X1fQ8m5+WiRSFz73EYFKEteAKM9mIL+u/WQW6GgoTe8qABLrpqPJnGAikkP/pN41rHfcTAGNGbh60//FW754g0guAQnqJtDLZoTwRgB79qPXo67N3wKUy8bg64DMYSjMmcp4mKDgMLEIaUk8Wv5FRfiomvqcHRDiw7jXkdFio4rf29OXYn2JEaXj8Az31+DxsPHVH/QJhUc4OFZIgwEgMkAYnnuwjpMGFOBU4e6JJy9dtKZOOJCMpHGTyURO5HAHa98AgsvPk8d4ptkoi5GTGtzGzpPdamBpHMx4HCYPncKPnbndegSR7qTskCkHO2RduMjEOQtKBqGP/vMVbLtSCIhE3woOwWGMHISV36ZxJlYZ2sy1o1hNbl487V6bF63VdvO5EH7/a8ahixzA2t0TRWWffI8HDp6AmFZOnVFEouVV5atUE4W6vc14ZafX4vZC6Yrnc4wzFuaWvHYz57GNz/3b/jqzffiHz79r1j5nYexa9teHTbhcBhHjxzHkw8/J9O2DCNZBAicTujOy/Ki19vD1J03DTfecyl2vdWASHG22kOJFLufs6B6BK8eAb5EZsXnVq1BR3un9u36aL4acMG6v1FkgyuomysJ9Qsumocf4ymZGL03nHpHyM6TyXBzGxZedQ7e/Z4LVD+jgJNk46Fj+KfbvotHfroWtbKf4uqVkPH4BNbie/gV7nj0o5gwtRb33f4Ann14M6ZOH6nLfji1UqbHqkSqRJZuQSRf8YGLsfq/N+LgC8dQsag45ZdJWE4rpSz/dXf1YITMcS898AZ23rIHBNmSgWG50ZkbzZ+DNCqkgblX9jqbcE4tlv7lbDRuaUFEVhxdz6X/cG4YR2RpXXL1fAyX8E+mwOHKs/K+R/D4T9fjXYsmoWJGMUpnF2LUglLMWFyDqilFuPdPV+L2934Tux6rx+xFY+UtS8c6qrxZjgZaoi0cntwJE6TSihLc9OWr0SB9E4Awl04/ea+PDbSeT24LInnZiMkrevnp9Rp1nPiD/vb67SvTgj/EXDLRY9hSKC8/F0suX4Bmmay5G9SQlzed6Exo6DISmKzDvTvexhN3v4KZ00ejo7FT5oEkmja1YeOat7Hhxb3Ys/0oDsouZ/PuA2jobMW61Xtx/K1WHa5qpDc4VKcU9U1y/jhc3+APj/MWz8FH7lyOgy8d132VDidPwn8SKqULfpwnR40pxjNfW4eD+48oj9nrCwQK1q476UCb7yyZCNbMc6di9vyxOLr2BAqm5emOtqsxjsoJEh2VJSpOQJne3l0vYJ5CVaRIl92T2ztxwSen49ZldVonj4UvIyIqG7htG3fjN3etRckc2bg4qVt2giH5d7ypGetf3IxbvnS92sbV7aobL8HGx7bhtxu2a3Q5YnxbadWkbFzzK3Pw+oF6bHx5M6prR9II30+X2YAhjWV/DnKZrExHyFRWVYpl1y/AvWv/C4WRfAlTGREnu5FfmysTsqfCnG5uaJWwlwiU+SKcI/ORDIWZ86fiPVcuM7V98qLiIjx419MozyuUthTSDldhcQE+cccPceGlCzB9zhRd1UaPrcL1X7kSD6y4hb72SSRxiGkutiQ6ulGNIjz70Bosed9C/3xmdvdRkCK4A7gPDzu2v6+af+EclKEAsZMJXXFoldeW/rayZXebTumjVgmMHq54TPFYQo8VgRevbXxwzpBDDH7yz6tw8kQbuAIyvUvOWJ+66mqcbGnXuvvwhlgvJdnZjaIZw/DqL3dg2+s7tIH9DQpQJgajUQFXEKbaSWOw5La5OLKnRQ+H4eIQWne2o7OjK9WZB0tFdZmOfYLHJbZAHDt2pBmH9zdg/+6D2LfzgNw3tavT3vvVaPfmC316elRp6kEwF6IcL/xoM576xXNK1e1ENBs3feFq2YV7jGa3F1LU0zs76d5I5k6e71789at6jAnLUHWHlKel90l9fgT5ynvb/RINzI5k490rzpfZRbb5Us+tiOJgazOO1B9VPuto/JSxGFdQoUcPnqPKaobjqXtW49a5d+Fzy7+BD07+HHZs2+3JiAOavHcQLEq9t4HH3tpzy/H9m1Zhx5bdGkXsc+qsSboVScQlstPGWq+s14mMBomiinGF+O03NuDtXQeUTB2unJUt77PMU8qcNcWWT501GYsunYqm19oQzc+WPW0SW1/zwtWWzpFjKvHh+1fg+YP79S3lV+UiWpaNyKgwImUh7JPTV1yc0WTBojkdsp/1aAwyDAXMaF5El+uf3LtKN310gv1OmDZW91++3XRaVdhTYlV4ecWSOyJHtgitePXFTR6HjBBfTihWZs6fH0FmUqacyslcJBdPy65doHuQpGzrq4tH4Ml7V+vwoaHcCzFdcs1FuP/7N6Nx60lsWrcf2zcdwe4tjXhz3SEsLhiPMjkfafLsd4oExJzzWLynNxhj7QmMOrcEq763Br99/CWfgbbZG1ei6PWgdZ/SIvRkh5zPIsV4+oev4FhDk5A83yhvP+owff6NIgnsyBrdMmkcZuSZu3AmxhdWoH1fB4ZPzMPe9Y1Y9eMncfPtH9EjRiKR0LuXq2+6VHl3btsjx46TiOZGUFpegsnTJqCyutzry+tO3z532p5RDmqpOPAzaeLF2aSaCnz32kcwbfZk1E6u8c5xqV24OmACUknTJvYnZE9UWJcv+7K9eEMu05ZcskhFgiBbXSPI0PKUp7pIIWo046muHYWln5mHxsZWvZcZM7MUK7/4G6xa+aS+Ni77nEDZwfipY2V5X4r3//lluOK692Hx8gUKjoHNYwnPbKt/s15uMAvQLYdLOmQvp4f7CSZGiFfSeSSvNCp7rZP4+f2PIi6HYe6LrE+PPYU8RVNyXiY1UdQd60GpbDGf/9VadMkio6ukw0hfzd+MQ4wG2s86pICduBf9yTzpR8a0HCu6O3tQM60U37x+JX7wrZ/JnVCzTqDWQZp9qYo3X0G+nOzAVz9+H35190venZOEPw+fXBCYIpGI5jz8JugqURKLYy0JVM8pxUPffgEvPLVGebj02/IfUfmUx4osy16ddnHjWDZlOF74983YuXWvyttLYcXKzDNuFKnEmFQ69TCneTu3+PqZePXBt1A+o1A2YUmMnVmGH9z2GNY9vhmXfmwpZsjum0MqNzdHhxDB7ZK33d7WjgN7DmLNs6/h0TteVM1jZpXqrSIvzHLEpBPHW4TvlEzEHXKvlIcTEmXD5MjbY9cZYjgPoWMKS/CjL61CzYTRqKquEP0x+eSTg6ajzYIjL2AlKS5asopEvnc13CFT/ivPblBbGYX02Xw0/zN/WVWz0x8uaCw/88vncdsV/4K6eWPQ2SiX+3JfxJvFltfbcUhWidFyip90ZTVGTi5H/vAcCeU4ju0/gQOvNWDnG4d1tz16YoncCvDKVZZob7DrYTK3OIpIvgAieynuw7ra4+g6IX3oPEOP5QWyTe6jYkfjehgdPm6Yf+OQ6Eqis0n2Z/ySoCkdIMFBbyM6jgigw6L41urPg6svXyL7MymKpn049JQJMUMEGY3Icojwhu4z770bLbva5MiRo5MfXxmvQfiVoetEHG17OtAmV1wx2Q7wzoeX6PnFOcivydE+GHl6CS9yntu0KAvx1gQSR+WeWgDhST9SIV8t5CZB37Cw+A5IIRQNIdGWQOxgaocv/KGSECIlHBw+p7nWm8v0llMaka8e9fj6QzfrymtR08vUD0AuQ6YywWJ68J6H8B9/80tMmFepG0P98sHXQ8Mlomg8L9azeDLg+U0u2zkR86avFxFV5T2oVmW9CzRBRCwUkgwJ3kfpmBGS5irBRnlh0pcXXSQSVOlH7riVUXVSiEkqrLMTaY4UZOP4G3JWvGYc7vze36KgUKIwtVqTi8kfYua0vqUMEaTMKWCohFG0XXa0N9TdgTEyVHJLcsR5eX1qgHKr8fTRT2af6kk18GOaouVzaYGtvipS0ipSN70pcbdK9kFTSo4fGfe9chT/+MKncN7i2T5AhodO0lah0kxlA806NZ7JM8bjth9+CHfc+AM5J+eozXoFaowD5EF/01lT1vuomPvpXOmoGU8mWevNeHr1cNg/j11oqG/sJTolfw6i05nGoMPrF42XOSe219e9iTc37pDLxtRmL80OVlIGmp1C0U13agip4jQZr6tUwHqVtKejKI3OFxwgaNUjuk1qlRD4tTa/IBdLVyxEWeUInfzNXIqmDTEDyABwuwrSrM78/0vq5nwm/rg4+BE0NCcJjrepPBOg+PYOnJQ9kXxtzUpyBpYZkz8OUjeSFHt5WE4jB3ohNuEpP5klOfpYZBNtpRqeHeMy+cdky1BTVoDKIrkMNB2UlZRxo+g1nc7T693bGTuWDCBKAwnFPXKQ/Xa93HOHZGKPyYUOT/jMY7J/kQ2llmXjp7mc78BvbVzJXAfoJX+8s7IyO/DHiNhkZpFOPsrLoVd/crL/5IxyrJg1GhOriijYJ/nf5oPI9eEcgGDDLchCm11/2E57GcZP72/HcvlKWivXsvuEpjokNwEJbb5ijawsAqQgGnAGYgpAuZHsIQ8nNl7UyY8YRQWQSvlR935RBdkvkf6+icX4wNxRuOCckRhXVYxsWZG9rg1NrerDn4OM1L+zvWPTeIN5f7IunwHUIluC61Yfx+OyKayRr6SHBcmIWO+bGIwIcYzeKQdRJ6P8MUMWQeRPIrBHQOyJx1EYj6EkFkNbRwz1bQKm7OKRl4U7p5Vh+axqTBtbhuL8HN8svToW/e78Y43+EDPnGElWJpNbNqGBcpc/U5l+so8i+RZ/fXUeHt/SKodS+YQtDse1MaVdQUjBxUyPDYqSx6AAypuXg6wgi4L8LNlqyO5Y6HtlZWrgnkxQfH9RGFdVhDG/IkfnGYLARBvMV7tWZt1NtP8dTtKuutMvcwSEJfQPyRlrvnzbqpeDZ4UcKxppoGGgoPSj0/GjUvjzha1eZOP8sxgZZSV5IdwuN5lLR+VhamkOClLf8amNm1yNROuHxAGSH0Euj/vmjW405kyGvrW79UxvwmiU1+8e4tCoYRF8dmQubt11Cvl0go47zvtldunQGSVVQqPxuwkKfyJ/U1kElwko8yRaRhd4VyW0j30r9iJj9pMeTNbm+uJP0mQ2J0zQBKx+unl/eoxOjHlzEZbCW3LqPuflJlU9TOrtDhI+LsIrxy2USjtnjgYJwc5UtMyUG4S/qMrBhQL0ZPmrtTy5trDEfQ0TZy722dt/73xKH106+d26H0FGVIXUFkhsHwww4zE+q5sqo4sFEkVemlQSxRfkq+fX6jtRLn8t0i4jwIChewVSKZfhKPdyOGzRImjdWhnFComW2RItFXJlYikdlNSkLo0prIxNc98eqfVbFic8mFWJX/QVuYKuw27ZmB1VRtLc1WEN5GVvnDTXHu7AgrXNqJbJul6IEZmQRwhMhQLOToYagZG0pDCMD8rcsliiZYLcGXEZ1yS6OK8RWYfktb3D54BDjLrpnIHRHwBnYoOB5QJ0SjaAH3/lOH4kfyw6U65IDom3xwkKwZH635VHsXxULurKc1Eqf1ViqTdavKgj3YPSOE4vNx8zcfv7oIGYKGiOsRwEKpPsQPzUYYkOMYqe2NeGFetbdLJl22Xy17LXSKRcIBEztijCP8dVEfbNaLFIUeL/4iPjMt+fw0FgzoZdBlCzXKR/ekMzKmU1uqwmH9PkywX3Sl4SULg6SyJOhGookaIKzvDhA5QJlDPU9Y7Y6Xi7DKsc2Q+50aIzZAqUd9TBEIX7DDEbGpmixdqsL+MxcC1nu/G6PK6cy2t0k0nKGPIixVue2U49JmN8RrN25tbm0ly6ybh2Gc2V8fuSxozRGhRyO6aiM0muroHkOOly+AylL3NjKLJBm1x7hzTEDN2gYtYHasvEPxSageCCYuUz1TeYvbKA8J2lp8FohrDxWU4tp2Ooy5/ec3otEx9p7MPtxy1TA3lcWbec3sPA9qoeObz1GWJsCHbqKh6s3eX9fS9rBAURHggcOhxsD8r3B8rp8vUnb/Szpcf0DZTrkWioDg+kOFNbsJ9MPL9rNP8vzFzDMjky0Fsz/oF4XP3vtGz9DabnbNiT9j/UWcdUnKlsBrntpLmGuG1WdtvJT9390aytv5zymZJrb7DdtcP0BnlYtzbLSfsffxEXZ3YFO7gAAAAASUVORK5CYII=',
+    'gatwick': 'iVBORw0KGgoAAAANSUhEUgAAAEgAAABICAYAAABV7bNHAAAGKElEQVR4nO3aa4xdVRXA8d/cuZ2ptdGWWhAtgg+QjEhjrEFpiEY/GVQKiYJBxQcJEdFi4qOGpmp4SJqCtTHgA4wJ8UGU9INGxBjxFWhQwEdBozaKQhXrUAq1Sp1SP6xzOnfOPefec84dmmr2Pznp9OznWXfvtdZea5NIJBKJRCKRSCQSiUQikUgkDjG24/iT6tY9BmuyZwHWY1tJvXG8DpfiNRjDQTxZqPd0bMRHC+/PweexOJ8jZgp1upjEm/CtmvN/C67Gs7P5jJXMCTrZv7tx7fjaJcuGdbwMF+Nr2SAP4gLcX1H/IHbgq/gNVmM5JgoP/Ay3FdqP4eGs/yV4bknbblb3ONyOR4d9RMYj+JUQ7vOwsKTvcfwcF+GWYSvoFdiCV2b/347XYlfNCREC3oy3lZRtxgeHtL9U/PKTFeUfxqYG8yGEcB3ek/2dM4Mv4uOyb+z0NZ3t4Hx806xwpvEJzYSTt7sI1zdsl5MLsbjNctbhtIZ9HsDn8PeedzNia39IzzdWCeiNuEksw5xf4JaGE8nZJz7kKy3bXy+2bBnLcKHQaU24F49nf89kY3xEzPUQZQJaJZbfWM+7aXym4QSKPCa2SpXuGsZmodPKuBCvb9Fn/o3XiR9wX7FCUUBH4ZM4tvD+AfWtxSC2Z5Npw734+oDy9TixYZ/j+I7QOX3CYa6AujhP/y/xBL7dcOBB3I5ftmy7Cd+rKFuJcxv2tw2XGGAFewW0TCjDsUKdx3Fnw4EHcT9+2LLtPqFcpyvKL8PpDfq7BH8eVCEX0Lhw0F5QUmcv7mgwaB3u7hm3KVuzp4yF4qOPqtnXbmHRKskFtBjvVa60HxEKdj65R1jFf7Rsv1E4fGW8VXjy80Lukb4ILy4pn8GP5muwHu7DGSO0/z1uxqkV5evFj7BjhDEQK2aBONOULff9+Muog1SwN3vacpWwQGWcirNG6PsQuYBerlxA/8Hf5mOgp4gt2FlRdpXmHnYfHbHNVlaU/xu/G3WQp5Db9B92cyaFVR56Gh9ER5j1QZ1UnYGOFK7EryvKzhWH69Z08Bz9vk8vg8qOBHbgGwPKrxRGqBUdYb2qDq3/K1yu2vk8EW/WzufSEZbq/4EtqkMxV4hDeGO6ysOOo7IILxQWclD/k8KNqLJETdgqTPsFJWUdfEyc+hs5p1381vwLaQq34lni/PSwsIjFrXyciB5snKdxL8PLlDuQZ4mw8c1NOuwafB45qN0W3Gk2TLoKZw+ou7xF/1U8JEIiU2ZPCb1cjbvwx7oddsTqeaCifMLcqGJdduIa4aydI1z/w8Wn8OOKshPEfMqEV0pHeMvbxGopskBkFUZlqzh/HS42qT4BXIGX1O0ot2I/Vb7NJoTUR2UP/joP/dTlVtVBvoUivLq0Tkf5FvuBcgFNCms0Knmi73CyTrWHfZ5Iag4ltyrTqh2tqSazOoKYFh52lZG5BiuGdZILaC8+rXwVLcXRLSZ4JHC52ehlkefjnYas7F6/5E5hAosswZktJtdLWW6+LRNiexxfs/4G1fpvPU4Z1LhXQI+JiwRFa/YMvKHmZKpYIJTjfHCxmOeimvW/L5R2GZNCSJUKu+jZ3iWWZZGVQlBtWS6W9Ki8SuSwVuBfDdptUJ10XCN2SGnUoiigJ/BZ/KTw/hi8o8GEihyrXI/tF8H7OpyOG8SWf1S531bFQ1nb0uSgcC5LFXZZmGMX3m2uN7pYHPRqe6AFVpe824f3q5evX40vmbWoBzQTEFwrrtuUsUKki/rUQFUc6A94l/CPcqaEF9qU0/RffblPLO0v1Gh/Br5sbtblFO08/HWqIwdrRcpoTtxo0AWq3SJrsCeb5AROEs5X3XTKUiHUPHieX6FZK/L0wzgbN+r35hcJvXa3yNvV5UGRHF2lX+d0RXh2XGRb91DvCl4HLxUXmd6eNX6fasuQc7LY22vExYMbheO2y/Dt8UyhjD+gOhJ4QOjMPwk9tkG9H+5ofFeERcrYj38KPXdPkzuKXXG/70wRx9mu/LZFV1yAeLXIw9+RTfxJQ9K8GSeLbMRUVr9K34xlY3VFvGmd+hmY87PnaSVz6vQ8e2r2l0gkEolEIpFIJBKJRCKRSCQS+C+irDFmnPRXhQAAAABJRU5ErkJggg==',
+    'southern': 'iVBORw0KGgoAAAANSUhEUgAAAEgAAABICAMAAABiM0N1AAAChVBMVEUAAABAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWoAPy7///9AgWoAPSwAMiDz9vYgV0gANSMAQTAALx0AJhMAOSc+gGlBgmsAKxhCg2wAOyl3mJAAHgozeGC8zcktdFsANyUAMB4ocVcAJBGTrqclcFUALRoAIg/X4t8rc1oAKRcAKBVRjHcAGwbv9PI7fmY4fGQ1emIhbVIAIAzm7uvx9fQ2e2MPSzv6+/v3+vmzxcCgtrAjblQxd18BQjH8/v71+Pfq7+7X5eDA0MypxrxGhW4fbFEcVEUHQzIAFgHs8fDn7Ou5y8amvbdqjoRak39Ih3FJdWkvdl0MSDj4+vrq8e/j7Orj6+jJ1tKvw76Gr6F/n5d1pJNjmIVWj3tMem4fa1AZUkIAEQDg6ebW4N3S4dzO2tfG2tTD1s+60cmsyL6swbtylYtnm4hbhXpafXI1Z1kTRzcRQzPa5+Lc5eK908uxzcO6yMOrvrmcvrKas62VuayQraaEoZh6m5NeloJMiXNOd2tDcmYoYFEjWkseVkcfTT3o8O3O3tnL29W+1My1zsWuycCiwreSt6mLoZltn453lo1qkYdgh31WgXY8a19Hal47al0zX1AmUkITTj7e5uPW3NmfwLSmuLGaubCUsaqNtKaLqqOVqqKMqKB/qptTdmpLcGMpW00xW0wdVkcXSzsJPi230Mear6iIpZxuoI5vkIdmhXpGYFIea08ACAB/1EsgAAAAK3RSTlMAOAn3vtvJsGb90J5MSBL07buZkj8wI9PBtqSG5otyV1JGKtZ5XRwb4KsZc0SXGwAACIdJREFUWMOdmPVD20AUx7sNxtzd3dqXbClp0mYNqazt2lJqUDZgTNlgwmDMfczd3d3d3d3t79m7hK5CC2Pfn3q5l0/fvbt79y6qmtSiXqOubdI6paR0SmvTtVG9Fqr/Uf123VNaQoxapnRtV7+OmHptU4GI47x+EeX3chwQpXZvXwdMzxQZ4nPanJKvLBNV5JOw4ZNhnZv9I6Z5Q0CFbBZu88JJaydk52Rl5WRPWDtp4RLOYgsBqnW7f8B06ALAgxTgF1+ap4nTykuLuYCE3dB0QG2cRg0IZnLm47OahMrenxmQeB5a9a95qtAdgzg5c8PY8Iuzx6+ZnpGRsWb8qPCTsRuOTfYb0KmahtUR3bGFnla9lLV3ePmKYh2NEopPHz+yd5zyfPQV0YZONUk6vHqtwOCbvGSlYp63dbvdaDUzJh3KxKRbjfaPN/cqfTuPLvcaoFv7JJwGYBhjOaj4//K9K2gW1DESzEb9vXwF9dwmGqBBvWQcSVwvm+1753BT6gQSWPbeAtlkzywnkhL41KElGCze1cTm7FY3YpKIYvU/sojVWr+EoxtSbb5SweD0TiAW07cHBW3YA4wOk04zjEkIo7U645mJxG4CITWJBw3G+IgyZ4TLpWAomjXqGUpdMSxXrTalOxzhmGnd9gPE8ryEceoStw6B99nWkd7hRrqQGFOstaL8SP7EXdOmjsqaNm/+xsNbV+gdJvk/CtONL4jtepuXh57RnIGNAZbvlzkeRktM9ezd/KmaWM3O28pYFZ/ooEw6uJyHBtFpqjUYCjbL4zLKHK11+z5NIq25g/GTScanpH3UZoDBEU5v4MVQNj6fyNIK5z22EqvUQck+mfUkEnPH+HmIrKaOOLBJ+Hj8DlchsTLvmIMtYrf31c3jt7fdPn7zcN6uKlK5MrpC9mMOtvZPBmgY5vQC3rKU2CwzyrGkrM9Ia9qX8u12F2t1691W1m0vvnv4kQynTEqcjFuwNeqYxEPzKlBD4Ap248MFVmV+mYqp6N2mHVYrTVHhdUgxbodpK3FrmUN5pHNlkBWOLqVU7Q0A50wN6oNLsbCfwu1/5LdZHSetqfLkWJxYJUoYyZNkV2aiS31kUFOAwAZ8dAANZKUPG6rRbPKoq8ucOw7/gq2yoxwb8bXL6FJbeXO0ArGIZJph6FAENNyYCDRlNPYgSBFLXJrKhaCbnOsBCl7LEaLqChLkKC22AZDToA1wlt1KDOsGQgVv4YsXLRx0lxeRvygL82oxXWcQxgzb2eAjS2lIY7BcQ+4MN1V3kGCfjq9udkKD+qpmALYr2LqBL9YOWjEuAiIyDsdXF9oAt0kP4KSL2LrtjgWVVgq6anJXzI4FWcvx1Q1ODhqp2gI3ZjWmiFxzDAiHaqerCXdFLCh9ipzgOOiqSgMfj2fzSIqJBWnO5WXEa/pETRyI0U7Dw8nnhaaYisTMLEwgjC4GlETxIJNpvkYz55gfOuOOHbMUI5iXLvwPSEfjtOVkjoFOqlSQlmBvvpuKA2XcuYNGURpa+vP6qGqgDFyCmSKkJAWtMpV46PNRnLHLKoOVpUlBSYd22IOrZFEUaKpAa/UPEg5tKQ4tEmxTLGiBx272bIwCjT5doqu8mzjYIgY7DUJF2TgSIX76b5jNpZpozT+jv78q+fS3Ba+4Gv8vl46ftZUPNbEaizk70YI8NwsXJNkiTlKCbHNFgTQ1aZE1AmJP4INLZIuQTSvXRKXGyNY8nT1uaFLN3hS9aTeRWolkNnJaW76RNBLppgpPnxqWVO9yI/Mr6PNIGrHguS0ntrIcnF11JNqU2ewqKSnR0+nRMqd7SkpY2m7SRh0GGM05PCY2JdVK5PQ94VBHZNKdKL/1wBRbrRUvO15ebCaYmFT7uSrV9gIoWEjKvagYUh5cimtoOxMtmhzAedYoOsWSkb3GEPUmx1FLEMvG4eSu0IcNtMZteNSucKupaKlpZj4uL08E5D5FimiDH1rJl6YuAIE9+OSVMcyxC9kIWjcyThPmk5V1yqENO+QghdukAEAbFVE74C1HST3woMolwTFDk1wj6XAudX0g7aVOgKriti9wtrVkBVSd2SShDn15aER1HbqKVcShoGImWEmhvLuA+1vX9EeX5CriRJB4bb+HP7dUuvQJVHKS9LFKIJcpDvHw9wI3CDg5SvM+2bVqgZkxddo+u4lKKMeiedPWbGew0HLtGE8i9AuiSuSewI/x5pDz38FoqeIVubk6XHUJJZhyK6ZUCFhEsuTczw6JkToL1QkMgcXyhvSYCimGpnXISSitQDM0haWS5xCx3xwwQOfo+wMAR6pIUhahL7UKOcOJ9ePJADBQFaUewIec50jfdQ9TK6mQ9lwntutsPh4TCCqm0pZ8K5V0Y6+FpNWzX+XLiDjLAGnxl5puYLBgzkXN+BSkasJQwR15MsfrNEBqtS8K7RuDwVa2U86xb6325CCX9c1ceYV7LQZo2SHBdR/IhW2thujAmaA9oVeUPnhfuUNeCKE/jRNeIZshSZIuy2Y5V89YHQwVR6Ed7P2rs2WD/RaMT4PeST5B4GXUH1g8RznG8t+qWaOLZnQCRQk6hnYZ3cVvnoxSrhbXlvtwXOhPYrUfBDwX4CdpFM3LL91WITB2lrUzQu6270/GV3Vc9hYAD6l9avhg1BmHNysw84ImrJxVEzfm52+cuCpSoFycGRANAGk1fwHqB+iUxXJ0Q44moXImzSywoDuNe6hqUZ/WMspWtvDCnHjK2d0LywqcHI/u4LBqVf++iAKxQCpbfHD96uwsjO+orLmr11+5ViQViICYjj1V/6ZGTQDF+W0WSSzKnLlkyczMIlGyWPwcoBo2Uv27mndpBTKMC4mzJGmWGOJkCLRq2ltVN7Xo1bQvxKpxkza9/u/LX4dm/dqmpTRJTW2Skta2X7Mav2L9AfO0w2Bnyt6BAAAAAElFTkSuQmCC',
+    'transpennine': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAAsTAAALEwEAmpwYAAAKT2lDQ1BQaG90b3Nob3AgSUNDIHByb2ZpbGUAAHjanVNnVFPpFj333vRCS4iAlEtvUhUIIFJCi4AUkSYqIQkQSoghodkVUcERRUUEG8igiAOOjoCMFVEsDIoK2AfkIaKOg6OIisr74Xuja9a89+bN/rXXPues852zzwfACAyWSDNRNYAMqUIeEeCDx8TG4eQuQIEKJHAAEAizZCFz/SMBAPh+PDwrIsAHvgABeNMLCADATZvAMByH/w/qQplcAYCEAcB0kThLCIAUAEB6jkKmAEBGAYCdmCZTAKAEAGDLY2LjAFAtAGAnf+bTAICd+Jl7AQBblCEVAaCRACATZYhEAGg7AKzPVopFAFgwABRmS8Q5ANgtADBJV2ZIALC3AMDOEAuyAAgMADBRiIUpAAR7AGDIIyN4AISZABRG8lc88SuuEOcqAAB4mbI8uSQ5RYFbCC1xB1dXLh4ozkkXKxQ2YQJhmkAuwnmZGTKBNA/g88wAAKCRFRHgg/P9eM4Ors7ONo62Dl8t6r8G/yJiYuP+5c+rcEAAAOF0ftH+LC+zGoA7BoBt/qIl7gRoXgugdfeLZrIPQLUAoOnaV/Nw+H48PEWhkLnZ2eXk5NhKxEJbYcpXff5nwl/AV/1s+X48/Pf14L7iJIEyXYFHBPjgwsz0TKUcz5IJhGLc5o9H/LcL//wd0yLESWK5WCoU41EScY5EmozzMqUiiUKSKcUl0v9k4t8s+wM+3zUAsGo+AXuRLahdYwP2SycQWHTA4vcAAPK7b8HUKAgDgGiD4c93/+8//UegJQCAZkmScQAAXkQkLlTKsz/HCAAARKCBKrBBG/TBGCzABhzBBdzBC/xgNoRCJMTCQhBCCmSAHHJgKayCQiiGzbAdKmAv1EAdNMBRaIaTcA4uwlW4Dj1wD/phCJ7BKLyBCQRByAgTYSHaiAFiilgjjggXmYX4IcFIBBKLJCDJiBRRIkuRNUgxUopUIFVIHfI9cgI5h1xGupE7yAAygvyGvEcxlIGyUT3UDLVDuag3GoRGogvQZHQxmo8WoJvQcrQaPYw2oefQq2gP2o8+Q8cwwOgYBzPEbDAuxsNCsTgsCZNjy7EirAyrxhqwVqwDu4n1Y8+xdwQSgUXACTYEd0IgYR5BSFhMWE7YSKggHCQ0EdoJNwkDhFHCJyKTqEu0JroR+cQYYjIxh1hILCPWEo8TLxB7iEPENyQSiUMyJ7mQAkmxpFTSEtJG0m5SI+ksqZs0SBojk8naZGuyBzmULCAryIXkneTD5DPkG+Qh8lsKnWJAcaT4U+IoUspqShnlEOU05QZlmDJBVaOaUt2ooVQRNY9aQq2htlKvUYeoEzR1mjnNgxZJS6WtopXTGmgXaPdpr+h0uhHdlR5Ol9BX0svpR+iX6AP0dwwNhhWDx4hnKBmbGAcYZxl3GK+YTKYZ04sZx1QwNzHrmOeZD5lvVVgqtip8FZHKCpVKlSaVGyovVKmqpqreqgtV81XLVI+pXlN9rkZVM1PjqQnUlqtVqp1Q61MbU2epO6iHqmeob1Q/pH5Z/YkGWcNMw09DpFGgsV/jvMYgC2MZs3gsIWsNq4Z1gTXEJrHN2Xx2KruY/R27iz2qqaE5QzNKM1ezUvOUZj8H45hx+Jx0TgnnKKeX836K3hTvKeIpG6Y0TLkxZVxrqpaXllirSKtRq0frvTau7aedpr1Fu1n7gQ5Bx0onXCdHZ4/OBZ3nU9lT3acKpxZNPTr1ri6qa6UbobtEd79up+6Ynr5egJ5Mb6feeb3n+hx9L/1U/W36p/VHDFgGswwkBtsMzhg8xTVxbzwdL8fb8VFDXcNAQ6VhlWGX4YSRudE8o9VGjUYPjGnGXOMk423GbcajJgYmISZLTepN7ppSTbmmKaY7TDtMx83MzaLN1pk1mz0x1zLnm+eb15vft2BaeFostqi2uGVJsuRaplnutrxuhVo5WaVYVVpds0atna0l1rutu6cRp7lOk06rntZnw7Dxtsm2qbcZsOXYBtuutm22fWFnYhdnt8Wuw+6TvZN9un2N/T0HDYfZDqsdWh1+c7RyFDpWOt6azpzuP33F9JbpL2dYzxDP2DPjthPLKcRpnVOb00dnF2e5c4PziIuJS4LLLpc+Lpsbxt3IveRKdPVxXeF60vWdm7Obwu2o26/uNu5p7ofcn8w0nymeWTNz0MPIQ+BR5dE/C5+VMGvfrH5PQ0+BZ7XnIy9jL5FXrdewt6V3qvdh7xc+9j5yn+M+4zw33jLeWV/MN8C3yLfLT8Nvnl+F30N/I/9k/3r/0QCngCUBZwOJgUGBWwL7+Hp8Ib+OPzrbZfay2e1BjKC5QRVBj4KtguXBrSFoyOyQrSH355jOkc5pDoVQfujW0Adh5mGLw34MJ4WHhVeGP45wiFga0TGXNXfR3ENz30T6RJZE3ptnMU85ry1KNSo+qi5qPNo3ujS6P8YuZlnM1VidWElsSxw5LiquNm5svt/87fOH4p3iC+N7F5gvyF1weaHOwvSFpxapLhIsOpZATIhOOJTwQRAqqBaMJfITdyWOCnnCHcJnIi/RNtGI2ENcKh5O8kgqTXqS7JG8NXkkxTOlLOW5hCepkLxMDUzdmzqeFpp2IG0yPTq9MYOSkZBxQqohTZO2Z+pn5mZ2y6xlhbL+xW6Lty8elQfJa7OQrAVZLQq2QqboVFoo1yoHsmdlV2a/zYnKOZarnivN7cyzytuQN5zvn//tEsIS4ZK2pYZLVy0dWOa9rGo5sjxxedsK4xUFK4ZWBqw8uIq2Km3VT6vtV5eufr0mek1rgV7ByoLBtQFr6wtVCuWFfevc1+1dT1gvWd+1YfqGnRs+FYmKrhTbF5cVf9go3HjlG4dvyr+Z3JS0qavEuWTPZtJm6ebeLZ5bDpaql+aXDm4N2dq0Dd9WtO319kXbL5fNKNu7g7ZDuaO/PLi8ZafJzs07P1SkVPRU+lQ27tLdtWHX+G7R7ht7vPY07NXbW7z3/T7JvttVAVVN1WbVZftJ+7P3P66Jqun4lvttXa1ObXHtxwPSA/0HIw6217nU1R3SPVRSj9Yr60cOxx++/p3vdy0NNg1VjZzG4iNwRHnk6fcJ3/ceDTradox7rOEH0x92HWcdL2pCmvKaRptTmvtbYlu6T8w+0dbq3nr8R9sfD5w0PFl5SvNUyWna6YLTk2fyz4ydlZ19fi753GDborZ752PO32oPb++6EHTh0kX/i+c7vDvOXPK4dPKy2+UTV7hXmq86X23qdOo8/pPTT8e7nLuarrlca7nuer21e2b36RueN87d9L158Rb/1tWeOT3dvfN6b/fF9/XfFt1+cif9zsu72Xcn7q28T7xf9EDtQdlD3YfVP1v+3Njv3H9qwHeg89HcR/cGhYPP/pH1jw9DBY+Zj8uGDYbrnjg+OTniP3L96fynQ89kzyaeF/6i/suuFxYvfvjV69fO0ZjRoZfyl5O/bXyl/erA6xmv28bCxh6+yXgzMV70VvvtwXfcdx3vo98PT+R8IH8o/2j5sfVT0Kf7kxmTk/8EA5jz/GMzLdsAAAAgY0hSTQAAeiUAAICDAAD5/wAAgOkAAHUwAADqYAAAOpgAABdvkl/FRgAABmlJREFUeNq8lmtQVecVhp9v733O5nA/4BEFRAQBL0WsM6S2XiZRx6hVY7UmjbU1ZMzUMdaYxhEVhWJDvMZkJiW1xlgdb0lGJ0adOjHaqlgTqyiOKFjFGyAoCgfOgXPd++sPa5qkNkWgeX/uWe/az6y1Zn1LSCkBKCwspL2ak7u8d0mDf9zFzav/SAf06oJcoYdoiq5rhtKRBCGqaJl3unlDv5zcuY/r/cnE2cNOHKkatGpVkQHQIQBVYEgJzx9vLP7RrxZPbY9n3tyFjqz0KfM+3lm2sFv3sIyH3zsEYEpURRVICdOPN+0Z8/KSsd8WP370rHE73z/928ry+nfssaHW1AxHSacABBimlKAKmgMm0441fTr5laU//GZczi/n903tOT7/yJ8v/8I0zLmaptAnrdvJ37+7rq5TAF9KSjRN4U6bwbSjTSefezVvEMD8+blRw7N/NmP3trNL6mqaC8PCrTOEIggGTfr0jT311RQanZRhSlSr4HpLkKlHG88fzivo5b55P+zzkus7IsKsaCEapikxTUlkVMje5L6xX3zV3+EKqEKAIlAEGCZoukKFM8DkQw3VEamxleN+3A93WwAhQCiCgN8gfWDckTfXr3J3GsAENegzwWNiBiWKeNAOPUSltMHP5EP36D8smczvxeFy+1EVAUBSn5iz38zVIYC331jRtGWkPW/RkEhSoy2YAYnhNfF5TSy6QkmdjxknnIx5ZgA9uofjcvtxxIVvTU6NOdUlAK/l5UcOj7X+YfXgCC5PdPDFBAfFw+1MTLahCoFQBPvKW8i54GXS1IGohklq/+7HV/5r+XRqCF94bVnm5ivedbfbjLExVoWkcIWeNpUxDp0ZSTZqPQYXmgOca/RTXOlisc3OrDFpL8THR1Q+Kt9jAYyes/TFP1315gZN0sM0gTsoOd8YpNQMYkpJiCLpaVNIi9Z5Nt3G5JRIDl9zEZeddHHHW2+c6TDArxfn99hf7Ss6UO0ba9NEoq6CaUpUKVGFRFgUNGsIwmKhRYGj9W4qdp9AddazYMpQEnzdav9b7v8JMO2VvLHv/cNT6PSbQ8NUMAyDoBCoFguarqOoAsPnx1Vby+1zZVw9V07j1SqmTczmp2OG491bwf4RA+c8tWB55V/f/t2udgMsXp6vflbjy9txpe0lTZAYalFRdB2LpiFNE8/9RqpPfk5dxWVcNbVUlZ7nbk09kyaNoHjrEhKDUezLP0DvxDBO2GPz3eXNzSnQPoCc3yzN3FjZtrouoI2PtkeCAL+rlYbyi9wsLcNZXcOdysu4G+7h9fhwtrSSnZ3Jps3LGPfkE5RuOsW2TZ/gcfl46qVnqDUEn1xri7qxcFm/Leter/xWgMmLCiZ9dIdcr6IM05x1VHx2lrvXbnC/6hp3r17H7/WiKMqDfnsC9IhzULBiLi/OnoT/hovtM7dyu7yWUHsY0fZQWtPi+VulBwKSPbe8hcBzX3vYHl5Ed9uM3rvK6jYeKTk/trGyguZb1dRdukyrsxkpJarViqZbUVQVaZrYbDqzZk5g3svTSYx3cGbr3ynZcBwhwRZlo+V+K09Oz+LizFHkHL4LVoUBkRqnn+4WurZohQegoKDg3xVodHmSezhrLz0bF6wPxKboYmSazxIyvlXRNOPBppVIU6pCCMPvD4T2z+h96ODB3R/aPEJ+MHsHNWeqsUXbEIrACJpIU5L0g2TeawiAx0BXBZfu+NlX610MFPxHCz7c8OYx4Fh7d8KNa6dZsmiJvu35LThvNRHWLRzTMJBSYvoNYhKjiR2SFP3zgGVChh4zpcwZnHDgti98U1Vb/ohHAXREK9es9A1OyWxy17vs0jRBgqIq+Lw+skZnbC96a00zDyZ/V1/g9rJ8a2ljYErWyPzw9UUr3F1yD9iT7OeuHr0yyhpmRSKRUiKEIHFIr/385euxa15f4Qc+OtIV98BDxWcl7FZU5csfB71BHOkOT9ITvfe0x98FAIkfh3cPxwgYCFUQ8AZIG5WxsegRL9//BWDtO2vre2Ym1AS9wQdDpWskfD/xYHv9nQYAiE6IuiClJOAJkDA48eb7+zd/+p0CJAzp9YFqVQn6gqSMSN3+ON4uAYgfFL83whGBpmskZbdv+LrsLAdYtX51y+DUzKaoXtH3ine+e+47rwBAZM/IS8lD++x5XJ/WVQD9nh5QpEfot6h6PN8/BwCmmaZcdxuN3QAAAABJRU5ErkJggg==',
+}
 
 
+def main():
 
-    ## Get a list of Rabbit MQ instances in and build the console link
-    mq = boto3.client('mq', region_name=AWS_REGION)
-    mqinstances = mq.list_brokers(MaxResults=50).get("BrokerSummaries")
+    ## Get all test EC2 Instances and their Rabbit MQ consoles so we can build the sidbox list
+    db = open_inventory()
+    refresh_inventory(db, AWS_REGIONS)
 
-    for res in mqinstances:
-        build = res["BrokerName"].split("-rabbit-dev")[0]
-        if build in instances:
-            instances[build]['rabbit'] ="https://" + res["BrokerId"] + ".mq." + AWS_REGION + ".on.aws"
+    instances = {}
+    for record in cached_instances(db, AWS_REGIONS):
+        if record["build"] and record["build"] != "buildandscan":
+            instances[record["build"]] = {}
+            instances[record["build"]]['name'] = record["build"]
+            instances[record["build"]]['owner'] = record["owner"] if record["owner"] != "" else 'Unknown'
+            instances[record["build"]]['website'] = 'https://southern.' + record['hostname']
+            instances[record["build"]]['hostname'] = record['hostname']
+            instances[record["build"]]['portainer'] = 'http://' + record['hostname'] + ":9000"
+            instances[record["build"]]['rabbit'] = record['rabbit']
+            instances[record["build"]]['admin'] = 'http://admin-southeastern.' + record['hostname']
+            instances[record["build"]]['launched_at'] = record['launched_at']
+            instances[record["build"]]['running'] = record["state"] == "running"
 
 
     for res in instances:
@@ -104,18 +99,50 @@ def build_launch_date(days_ago):
 
     return return_val
 
+def load_render_cache():
+    try:
+        with open(render_cache_file, 'r') as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return {'document': None}
+
+
+def save_render_cache(render_cache):
+    with open(render_cache_file + '.tmp', 'w') as f:
+        json.dump(render_cache, f)
+    os.replace(render_cache_file + '.tmp', render_cache_file)
+
+
 def make_html(instances):
-    table_rows = ""
-    for res in instances:
-        table_rows += make_row(res[1])
+    render_cache = load_render_cache()
+
+    table_rows = "".join(make_row(res[1]) for res in instances)
+
+    ## Leave the page alone if nothing but the generation time would change
+    document = hashlib.sha1(base_document("", table_rows, "", len(instances)).encode('utf-8')).hexdigest()
+    if document == render_cache.get('document') and os.path.exists(output_file):
+        return False
 
-    with open(output_file, 'w') as f:
+    ## Write to a temporary file first so the web server never serves a half written page
+    with open(output_file + '.tmp', 'w') as f:
         f.write(base_document(now, table_rows, "", len(instances)))
-        f.close()
+    os.replace(output_file + '.tmp', output_file)
 
+    save_render_cache({'document': document})
+    return True
 
-def make_row(instance):
-    return """
+
+def brand_logo_styles():
+    styles = [".brand-logo {display:inline-block;width:20px;height:20px;background-size:20px 20px;vertical-align:middle;}"]
+    for brand, logo in brand_logos.items():
+        styles.append(".brand-logo-%s {background-image:url(data:image/png;base64,%s);}" % (brand, logo))
+    return "\n      ".join(styles)
+
+
+## Label and colour of the status dot, for running and stopped instances
+row_statuses = {True: ("Running", "#28a745"), False: ("Stopped", "#dc3545")}
+
+row_template = """
     <!-- desktop -->
     <tr class="hidden-xs hidden-sm {tr_class}">
         <td class="text-center">
@@ -123,25 +150,25 @@ def make_row(instance):
         </td>
         <td class="text-center">
             <a href="https://ticketyboo.{hostname}" style="font-size:10px;" title="ticketyboo" target="_blank">
-                <img height="20px" width="20px" src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAACEAAAAgCAIAAAAT2oadAAAKSWlDQ1BzUkdCIElFQzYxOTY2LTIuMQAASImdU3dYk/cWPt/3ZQ9WQtjwsZdsgQAiI6wIyBBZohCSAGGEEBJAxYWIClYUFRGcSFXEgtUKSJ2I4qAouGdBiohai1VcOO4f3Ke1fXrv7e371/u855zn/M55zw+AERImkeaiagA5UoU8Otgfj09IxMm9gAIVSOAEIBDmy8JnBcUAAPADeXh+dLA//AGvbwACAHDVLiQSx+H/g7pQJlcAIJEA4CIS5wsBkFIAyC5UyBQAyBgAsFOzZAoAlAAAbHl8QiIAqg0A7PRJPgUA2KmT3BcA2KIcqQgAjQEAmShHJAJAuwBgVYFSLALAwgCgrEAiLgTArgGAWbYyRwKAvQUAdo5YkA9AYACAmUIszAAgOAIAQx4TzQMgTAOgMNK/4KlfcIW4SAEAwMuVzZdL0jMUuJXQGnfy8ODiIeLCbLFCYRcpEGYJ5CKcl5sjE0jnA0zODAAAGvnRwf44P5Dn5uTh5mbnbO/0xaL+a/BvIj4h8d/+vIwCBAAQTs/v2l/l5dYDcMcBsHW/a6lbANpWAGjf+V0z2wmgWgrQevmLeTj8QB6eoVDIPB0cCgsL7SViob0w44s+/zPhb+CLfvb8QB7+23rwAHGaQJmtwKOD/XFhbnauUo7nywRCMW735yP+x4V//Y4p0eI0sVwsFYrxWIm4UCJNx3m5UpFEIcmV4hLpfzLxH5b9CZN3DQCshk/ATrYHtctswH7uAQKLDljSdgBAfvMtjBoLkQAQZzQyefcAAJO/+Y9AKwEAzZek4wAAvOgYXKiUF0zGCAAARKCBKrBBBwzBFKzADpzBHbzAFwJhBkRADCTAPBBCBuSAHAqhGJZBGVTAOtgEtbADGqARmuEQtMExOA3n4BJcgetwFwZgGJ7CGLyGCQRByAgTYSE6iBFijtgizggXmY4EImFINJKApCDpiBRRIsXIcqQCqUJqkV1II/ItchQ5jVxA+pDbyCAyivyKvEcxlIGyUQPUAnVAuagfGorGoHPRdDQPXYCWomvRGrQePYC2oqfRS+h1dAB9io5jgNExDmaM2WFcjIdFYIlYGibHFmPlWDVWjzVjHVg3dhUbwJ5h7wgkAouAE+wIXoQQwmyCkJBHWExYQ6gl7CO0EroIVwmDhDHCJyKTqE+0JXoS+cR4YjqxkFhGrCbuIR4hniVeJw4TX5NIJA7JkuROCiElkDJJC0lrSNtILaRTpD7SEGmcTCbrkG3J3uQIsoCsIJeRt5APkE+S+8nD5LcUOsWI4kwJoiRSpJQSSjVlP+UEpZ8yQpmgqlHNqZ7UCKqIOp9aSW2gdlAvU4epEzR1miXNmxZDy6Qto9XQmmlnafdoL+l0ugndgx5Fl9CX0mvoB+nn6YP0dwwNhg2Dx0hiKBlrGXsZpxi3GS+ZTKYF05eZyFQw1zIbmWeYD5hvVVgq9ip8FZHKEpU6lVaVfpXnqlRVc1U/1XmqC1SrVQ+rXlZ9pkZVs1DjqQnUFqvVqR1Vu6k2rs5Sd1KPUM9RX6O+X/2C+mMNsoaFRqCGSKNUY7fGGY0hFsYyZfFYQtZyVgPrLGuYTWJbsvnsTHYF+xt2L3tMU0NzqmasZpFmneZxzQEOxrHg8DnZnErOIc4NznstAy0/LbHWaq1mrX6tN9p62r7aYu1y7Rbt69rvdXCdQJ0snfU6bTr3dQm6NrpRuoW623XP6j7TY+t56Qn1yvUO6d3RR/Vt9KP1F+rv1u/RHzcwNAg2kBlsMThj8MyQY+hrmGm40fCE4agRy2i6kcRoo9FJoye4Ju6HZ+M1eBc+ZqxvHGKsNN5l3Gs8YWJpMtukxKTF5L4pzZRrmma60bTTdMzMyCzcrNisyeyOOdWca55hvtm82/yNhaVFnMVKizaLx5balnzLBZZNlvesmFY+VnlW9VbXrEnWXOss623WV2xQG1ebDJs6m8u2qK2brcR2m23fFOIUjynSKfVTbtox7PzsCuya7AbtOfZh9iX2bfbPHcwcEh3WO3Q7fHJ0dcx2bHC866ThNMOpxKnD6VdnG2ehc53zNRemS5DLEpd2lxdTbaeKp26fesuV5RruutK10/Wjm7ub3K3ZbdTdzD3Ffav7TS6bG8ldwz3vQfTw91jicczjnaebp8LzkOcvXnZeWV77vR5Ps5wmntYwbcjbxFvgvct7YDo+PWX6zukDPsY+Ap96n4e+pr4i3z2+I37Wfpl+B/ye+zv6y/2P+L/hefIW8U4FYAHBAeUBvYEagbMDawMfBJkEpQc1BY0FuwYvDD4VQgwJDVkfcpNvwBfyG/ljM9xnLJrRFcoInRVaG/owzCZMHtYRjobPCN8Qfm+m+UzpzLYIiOBHbIi4H2kZmRf5fRQpKjKqLupRtFN0cXT3LNas5Fn7Z72O8Y+pjLk722q2cnZnrGpsUmxj7Ju4gLiquIF4h/hF8ZcSdBMkCe2J5MTYxD2J43MC52yaM5zkmlSWdGOu5dyiuRfm6c7Lnnc8WTVZkHw4hZgSl7I/5YMgQlAvGE/lp25NHRPyhJuFT0W+oo2iUbG3uEo8kuadVpX2ON07fUP6aIZPRnXGMwlPUit5kRmSuSPzTVZE1t6sz9lx2S05lJyUnKNSDWmWtCvXMLcot09mKyuTDeR55m3KG5OHyvfkI/lz89sVbIVM0aO0Uq5QDhZML6greFsYW3i4SL1IWtQz32b+6vkjC4IWfL2QsFC4sLPYuHhZ8eAiv0W7FiOLUxd3LjFdUrpkeGnw0n3LaMuylv1Q4lhSVfJqedzyjlKD0qWlQyuCVzSVqZTJy26u9Fq5YxVhlWRV72qX1VtWfyoXlV+scKyorviwRrjm4ldOX9V89Xlt2treSrfK7etI66Trbqz3Wb+vSr1qQdXQhvANrRvxjeUbX21K3nShemr1js20zcrNAzVhNe1bzLas2/KhNqP2ep1/XctW/a2rt77ZJtrWv913e/MOgx0VO97vlOy8tSt4V2u9RX31btLugt2PGmIbur/mft24R3dPxZ6Pe6V7B/ZF7+tqdG9s3K+/v7IJbVI2jR5IOnDlm4Bv2pvtmne1cFoqDsJB5cEn36Z8e+NQ6KHOw9zDzd+Zf7f1COtIeSvSOr91rC2jbaA9ob3v6IyjnR1eHUe+t/9+7zHjY3XHNY9XnqCdKD3x+eSCk+OnZKeenU4/PdSZ3Hn3TPyZa11RXb1nQ8+ePxd07ky3X/fJ897nj13wvHD0Ivdi2yW3S609rj1HfnD94UivW2/rZffL7Vc8rnT0Tes70e/Tf/pqwNVz1/jXLl2feb3vxuwbt24m3Ry4Jbr1+Hb27Rd3Cu5M3F16j3iv/L7a/eoH+g/qf7T+sWXAbeD4YMBgz8NZD+8OCYee/pT/04fh0kfMR9UjRiONj50fHxsNGr3yZM6T4aeypxPPyn5W/3nrc6vn3/3i+0vPWPzY8Av5i8+/rnmp83Lvq6mvOscjxx+8znk98ab8rc7bfe+477rfx70fmSj8QP5Q89H6Y8en0E/3Pud8/vwv94Tz+y1HOM8AAAAgY0hSTQAAeiYAAICEAAD6AAAAgOgAAHUwAADqYAAAOpgAABdwnLpRPAAABDdJREFUSIntVk2IllUUfs657zvfOORPi7SfhZM/k4Im+FOCOQyVqbQajVpUhAXVoh8hDCJBcWGFFdEmk7SQaGWUIbTIKVOs7MexyLFSKCLyZ7KaEdPve+95nhavjrRo6W7u4nLPufee55xzz3m4JgmXefjlBhjFGMW4XBhktIJA1DIFAGSMzECIFSQAwQwg5wpAzrneZVT13VpzUX9J47CUrD4cjMoNjMqRAUAEomq1zEuKFJKlTBZFSdLdAZAGqvamKAoyiqIYwajXFpHdnOLHfR+TVERKfusdy9xAwS2AVJtwTxdiZbinKudkHublf/NNBil3c08556IorFVVyS3Lenq6HUbJzQBMGDdu5YqVqx56MEgAyQUkIKrKUlIQyeGeghkRnlxIdWQXkTgielkUENuSJ/OQ3FxiAH8MD7/x1raTx08kKbkDdRCpLAwRyYgIMgyWyoaQACECrICgcDGTBFCQ4cnJIAmz8ePHdi9avHf/vr+GhgX77ttDS5YtO/D555/s2TMwMDBj5sy7eldM7ZpqohdtO3a823+of3Dw1JxZs3vvvufqSZPcIFIwCmQURQmgqONNXqB2VZKio719aGg4pMmTO7dve3Pzm1sFc+CnX37+qG/3cxufXzh//pOrV3/df1CUm31/5IdP9+3d9Mqrk6+71hwIeUruXr+ck2ESAJlB+HP4zK4PP/z95ClJt/f0dM2csf2dtwFLkAEJaLaqDRvWf/blV9/0HwRlZgaD8NvxE6++uKku/ZQSSTIgou5BTyUZDpOpo9GY0tkJCIbPDnyxa+cH/zRbBnV2dm57ffM1EycJ+nvozKd9uynR7Lbu7m1bXnMDzI78dNQZpEstl9zckwNwd0RuukMSpCvHT7j3/gdumrdAsvPnm4ePDJhkMgnwkuYmuEFQnT3BTg+fpSAhGeLUsXMvrzq74T792g+StEv9AbNFtyyGGyQTae5AiFu3bH38icfONZsmyADAgAnjxj67dt2ap5+iYGYj9XrT3HkbZ0TevxuAz1l4xZo3IudUNNw9UTxfZTNQkiQzAIKmT5nS1TX90Ycf6Wg0ANVF0d5orFu3buHN8xfMnVfbF2DSNRMnrl/7jNo7Ap4jJTcAqWgAsNxsprY2AC9sfE5W1xUB6+q6oXdlr4Pw8vD3A3s+6Tt67NjUadOWLlk6bfr1npwZO3e+f+SHHwcHB2+cPWv58juvmnSVnT1dvfcSpMaKNRo7QXL3ZJIiN80AKwAD5A4gIRhGh8wdSKwqFKVb3cAhwryszp8r28fkKixZzQVUknKyRGaY1/TjuZVTanMU7okXqDeRgeSmkJVAYtBLBxnMMI+ArCRZto8RK5hEMjIFQ8vgofBUihcI2CTV3JJz9lQ4RBgANwBBApbcIFZmBUGGiqKoWS9IR8hKkDBzNwY9eW1whElt9H81ijGK8b/jXwUzirlWg1KaAAAAAElFTkSuQmCC" />
+                <span class="brand-logo brand-logo-ticketyboo"></span>
             </a> |
             <a href="https://southeastern.{hostname}" style="font-size:10px;" title="southeastern" target="_blank">
-                <img height="20px" width="20px" src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEgAAABICAMAAABiM0N1AAACEFBMVEUAAAAdr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+Udr+UZruUdr+Udr+Udr+Udr+Udr+UdG1D///8dr+UeHFEAADcgsOazs8UgHlMaGE4AADkAoeEbGU8An+AAAC8UEkkAADQPDUZPTXcFAz4AADHQz9oJqOMXFUs8OmgVreQKCEEBpeIAo+EDATwaruUFp+MRD0cIBkAAACwAACcMCkP7/v8NquMAACkRq+QZF037+/w0t+g+PGoyMGBpaIv1/P53z/Blye1CvOqlpLnz8/bx8fQmsubV1d+6ucq2tcd4d5ZkY4ZZWH8kIlXl9vzg9Pz29vhTwuzm5esAnt+vrsKenbSQj6mMi6ZLSnQAACTp+P3W8fu55/ei3vTu7fJpyu48uuna2uPJyNXFxdLCwtC/vsysq76ZmbF0dJNRUHhEQ244NmYmJVfO7vrE6viT2fOL1vKE1PHn5+xKv+rj4+kvtucstOfMzNioqLxvbo8tLFwAAB3u+f34+PrJ7Pm05fZwze/o6O5gx+2iobeGhaGDgp9XVX3w+v2u4/an4PWb3PR/0vFYxOzS0t2UlKyJiKSAfp18eplfXoJOTXUqKVq/6fjq6u/e3uaVk61WVHyBgJ5MfWgmAAAAJnRSTlMA8rGcjU/56+HbbEU6LgTFuKmjfWdWCObWzsCUXicfGP7TNHMTeRokMPkAAAg9SURBVFjDnZiHX9NAFMcLKIIDBffezSUlbdo0ldrYPe1gKaDIFkQFVJS9RVQEBPfee/+LvneNtS2lgj8+Hz5NcvnevXfv3r2LKp12rdq/PXPb3i17965dl3Vw407V/2jTqmVbSZJyC3bsXiJmddZmQrUnHLS44S9sdRFUdv7GJWA2riWosF0Q3NbqEtCUy+IQHEEKy92/aXGY5WiSJiwIrpvHO8dP3zkKOnb66svXLdUOgwVRm1cuArMzk4Dshj1vOk8zSbpz/0G14HBpCNm66l+cDdkwGrtwawIoqXSs86ZDIIDanhaTlw+YoGHq1VFGUfHk4b7awv6e780x1qVKwQ6kvTvTxM0WsEqwXFcwJ2qePitTB5w6ndMWmf08NHBDQXVqDFYNyV6+EGdfBtFYWysvMlQ15WOcKHlNxohWG5E9NrjQ/6wqjhpYYbDAoDak5qwCsyzC8ShmppQTbXpWHSdWbZLMX95HbXxpcQBpZcrxoJftL6OjOSJyWoWSyHL6+EHa5KLGkJq0Kxs4lnvY5m65JME7KcXyTt9IN42FEiTN91MOcq5ii+mxkJFX3tPKpoDX67UFPLI+NirRVoXtjlLSmiROJvjHTjkzToln8QV9QBK5APulrKxstlEuksxOY3SYvNdXR11eLWjIirzEOIT5MtzHpz9EL48YrSSNNbQVTk+eLC4ubv7W3fu4bsQEz1gkGf312LYp6NaQ/HjObkJI63V8NhgyIYd3Su0zJ5kknXo6Jhqj3URJXwVropu2EY1QiU/O+qIciR9gUunEkGRTSEN4fb2VkIy8+AgKWpqwS84W5ZRdZhbQgM5EPSj7z+FlCYTTsrgZI4ZruLAaJdqdTVasKp6u+lDe8PNZfd27mocK6ZxI548NcKfg6ioat/tPHoOZv4VtykPAAZkfM9TO+lmbZDZzHAf/der2NngTNKLDNjhsvKqAGMhSQFtgQC/gXo8o0/k1sTCg4sFZSfTKsUjUmzjRO4yoKnM0pFh/G86cO0zIgWh+hjxWgvBRMAzlLEUL5nR6NjGoWaNfD76r0SmgQADNvQJDWk9BBTCgV3TGlDeKEPREVM+X0TPJMLWcEuR86DYuOreVbKb7TjYJkmNwp5RjFdARuDovpQB51GcYphBBVCbTN2h500HIasz1hAhX4LpXiqiXCGJ97zHNGQiNgCwA4eIo97FLBjlx4i5YwyQXQLlg2XOGaW60qZcEQkV0PYptu1S7CHG0YC7j9EsHseJTXCdg2w50kQGX6weRXSIIxbXjtuJwgZPWg4swGoc5dQLoaUitTZbeZJtMBAUaIXZPg5PWga+tmBiLZ72JoH7JrEsW5z/SnAiSveCko7csZItqHQkTWPjfI554EOhtVWGyzg5A/wkgPTeA3raTDNVWYrkF4dhjk5NAqZUMMv+AO48cANpC3F3wu1anXTIIJT7B5SYAKIfYK/HpPNDlofJTiYTa+rZ5IPNHuPMAQZsXAJ0sm+uwJZBmQv658nkg3E+OIyh3AdMG/CzfURcPKhV5U9GNZNN+Kaahs0ug+ugriiSCen0Bee5dPKihQy/JJ5NB5zFLorO3kWD1HUj7HmOSjz6axeG78aDuL2LRTPKsSbjptiAon1jDF2GfGQskz9rhPiZJ/WeSnR1x9sOdLjfJUS0jLsclmtIXO/21cSCPFpx2QRMm21Q7lK3odmzRYs5Op/44kBP7HHe7YCNZQ4jwiO4NMZDceCidSuUYhxUxa18zYKGUtwLWCEzbDWNssfERDtZnR4fZycVLpwt1dPicnJePC6OzuEIEQvZhQeNyY311SGL/9qS1jZa2jxrV8dKy7aWlbAAwMQXYE7D4qy1kBaTaleCk12ib+BfE++ohs5QVaeMlS4Mwld5AXH++ciWv5UdLGncJFny8l/3D4RqLIdXNOXXxcoq+Xtg4Q9oYSOam6Q5JCD3prCUu4SvceB9SQKxHOgyRde5sYaJqz2FkPfPxf/ozY6J9bg2SbHrM2QHFEab/ZtmmkEJtzMI6EXEqJNncQ+dMQwqi54YMYnVglT7oj3YkjmCCnD6cQr3g3D7RyEYd2cBQV8cq0vVEY3hDqwgzj9WR5zIUAqLNlEJmDMAPsJViO9sNHBDUbGsBouz+LmEclyUHUyIX9cL49ZxsTCVaynx2Aifif4yVrdVCd/7YkOxTtBrzy6zcWN7QMApRl0qsUX7WUN/ugV+heqXOggHFtIJoIJZAt/1qXq/jOCyDU4o3QoybeHDkKD1yGfYQsjPhPGM1jOOTYb+aItILOPxlnPqwG2vROOUTjTt8AUmfQ9p/kljg0Nq0CwzLoYB444QpeuD75Dfx/+BoQ1g+o4PIvMPIGgJuqmRQTySOZ9OZZQs10C6Pt7pSHP42AtxQSRv0N4Y8/IKYiC/wjqEcOI+mOiMfRFIJ9dPd20Vw5khtlWQe7qacR63AyZzPwWgCP5HxaOL/ZPN5sTxOOouK3EgtbdBU2erSQDEDSk2y2ycYqrdDcDZ2eiJKftZrjUWiWfuphqF64YL5wvGk1gZ66q+8x1A1Fw6V6p2SaAaJks5YVl6lnEcuVAj29N8QVkEUEMH9IPYZYrLvcdvHurq6J4M13bGPERMucDPm+zQ6kInfVwzWBxeZBdQ0UU3P/LmrVem1MoPaF2zpbJpPOXa/ghjcgCHL8lT/0u4sAiirIJCWiUvURsUx915VTDmEIGLW7VMtRmsKCCroEOyurpaK46Arb7o0FkGwuAho23LVYrVzWQ5lucJuu0DlcAf3EFRGAThnCcpbnpVL5mlF5o4DqqVrzYbt63IyFG1eW7B/dZqPa78B5Q9OmJ+QqsUAAAAASUVORK5CYII=" />
+                <span class="brand-logo brand-logo-southeastern"></span>
             </a> |           
             <a href="https://thameslink.{hostname}" style="font-size:10px;" title="thameslink" target="_blank">
-                <img height="20px" width="20px" src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEgAAABICAYAAABV7bNHAAAAAXNSR0IArs4c6QAAAAlwSFlzAAALEwAACxMBAJqcGAAAAVlpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IlhNUCBDb3JlIDUuNC4wIj4KICAgPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICAgICAgPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIKICAgICAgICAgICAgeG1sbnM6dGlmZj0iaHR0cDovL25zLmFkb2JlLmNvbS90aWZmLzEuMC8iPgogICAgICAgICA8dGlmZjpPcmllbnRhdGlvbj4xPC90aWZmOk9yaWVudGF0aW9uPgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAgPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KTMInWQAAEcVJREFUeAHtW2uMXdV1XvfOfY6NZ2wjCAYTAzK2eRmXBqjVkpCqiSJQIkVqfhT6o+ojiqqo/dc/VdX2R9Uf/VGpqhJVkSoFtZX6SEmrRjRKlCokjQVpMTaE12ACIQKMY4w9nvuY++j61t7fuevse869M2PTpko2zF1rr/dee+19zj7nuDIajcby01aagWop56cMy0CtUqkYMh6PhThzAxpbGQ90ynkZ0qhPSHkvS57XKeJDDjK0gX6ZnJcFnjbaAZ04oZetbGWJ+QC9sR9nfKsxb2mJIdP/l21W1ZTFVRRzkZ2UViXBQ+Lemad5PJUBz/PTvpcHPovv7aSy5FGffdonPdVj38uV4WZjK0uMBn8S4JaW2E9CYjhGS1BanmR6uBEZyG9UztveCj7LTxGviDbPL3RsD0ovb5s1Bnn+wSn1CX0gpFGefcqQTjtpn3RuukX6HA95ZdBsRcdlMhU1hmaDAiwKgPxoywBlKe95wMk3x7CrSbzcLY0r5/MSnHm7xfdBGIuOiYK8qPshpsHMygHtIGaPF40BvryfIhkknf7BT/tFOhuhsYpytouuYhTciNH3SsYHeak+/HjKJqDMny0xBgAhzsZwOIyzFMvJ5pW1BA3SqU1YRPc0j1NnAuFhoVqVhYWFXJVAgrFxwGWD8rK2tAcjkZH+lSxzG3d9ITck+qgVOQHtS4/+izx18llZ3nGFDAbDoAzP72FbqC7IO+fOySc//qDcc/fPZp6YGBAYOJnscxwmq8yxJqSiiR6cvSAXvvB1Ga/1pdLQJPDhBWaiXpXRmTVpffQ22fZLd+qu4gsgbAc1OgK0TMb1/fyLK/Knf/wHcuS+j8iZ8xd1VjHzrtFWJKNraKSPY6Fg0oxH+WiC8iRDfMdiS058+2vyC0fvdY5CXCAwCZ6Z0rJ+rJbuEy9I9/cel8qBZZF3daLR4LSlHs9rVb0zku2/+UEjW/KiHu3YaR4dzkSQFNm+fVEO3nO/3LR3j+zp9qb4lLucsFGvy+kLR6XRaEyZTePjACBoVYOrBJuiFZ3Q4YWOdL/8tFQ/sFsqexZl3JushEpzQUYnLkjrj45I88DeoInk2IxObFkFpc5RC8PhSN46vyb7e+vS7Wl5xswyhvcCYtBvnl3VStGZTVrRJCYi1g3Jgn5Fek+fksHnX5Pqx3bI+Hx/Iq7Js2SpTOtDtxl9rOOtLISDBdLD8eb2oEkQIYMVyKP2+cfEok9cUfD1VhFYrpmjSEnXd6ZPW4CYBCxlb9tZ9FXjyLmlN9Y9BnvPqLsunX87LrJP9x21RzfQqzSU/9+r0vjMIWke3BvcqW9vn3i2B1nmnVdcSXbpnlCv16QxrGcZdSKGwvFQN8SBXvV8EJRjkuq1Gm7by8Zuug2V2bWjbcuD+inkzHIA4IeqQRaQ3Fg933tVBo+ckuqhtozXlaYsxBeayr41lvbHDktFr17Y0MsmJtuDoDgxILLW6cjKk8fkyh3b5d3VNdVHOWG4oXHgQ10WS9sWZUn3LATNAWgnCMaZefPts9Ltr0tVEw/exFIUU7Ct3ZSzzxyT9fVBICa/WSISOrrkoXrGw7F0v3pCxl2dNK2WSjckzWJqaUJOrUn9d2+Q5m37oiWMHMel0PXjsCWWDYriKnn93uvk05/9bdm9a6cFTOUokgEM+Edn35GXXnlVUCVsY1WAv5HOKC7f991zl7TbLdvbymzh3uf2QzfL0tISzRj08Xk8J4QOJkWN91/+ofS/+LxUDi+K9JWG2bAchAyMX1iX1ufulOpiU1UwqXlL3sfUjSJEIdDTjVnvsnPK9ENzIzXeajbl2BNPygO/8TvycwdusHsm1gcSdn71oly5c1n+4s/+RPZcc43Zraa3DGqQthFwTa9m0AXumw/c04H7WT/3+cek+5lvS/WBnSIXtRpZ/FpN47d6Uj28W3b9+a/KwvK27H6pzN5kyhOJZnP6UpuIZN12qyXn9GrHiQC0sen4bNPUhLfbbbs7XlxsZ3qzkDQ5kE1pSFiWGDjUfv+1t6X/Nyel+sHtItllXSNCULh6He9J6w8PZ8lhBXjbnAjQkFtzQgHPRAWB7iFw/uE4ggbYsr3FumowQgVM2hB349ogi1dxtFEEGYspzPihnEFNDlr38Wdl9K0LuqHVbS9CAiycBYXv9KX6iSulfe+hidWY5AkhPxG5yzyE4IxJKoKgMTAaBW0dugrR7C4aiHaJe1tBjKmD4CU2xKwTtH76nPT+6YRU7tYq1SuXeQAPGWrr5nxsTdqP3Cu1q5fDGBCI8mc1qyAIcACzhMFLk5OXn+0sL3sZe3FiusdekOE/n5HK7oZWj1Y/4sVfTSf1gl5Bj14hrftuDY7nJAZCyEn2VsMP3OPBWv4Xij6h2JRrGglmzP60bDBrNnMsIWeCuqkd0ila1KdOxoMfjWf47kXpPvq0yJ24MqkF+LXEaSx6rBh/c00aD90m9euvCubBMxFEPGmZ3UiaqiAGQBUqEJLuIS7oiAnNoGaGMVrGAqv0N7XtYyCP0BvxQ+sdf1mGf/26VPe09NIebgwtGtxIdwZSuaUp7Q/fbuHYjSEmOQZHf94H8SqrxUPiCIY4IWm+bzSNVle7zUqAPnxI5BsCoI0UQhI0/vm+x1EpOJSOOn3pfFmPFfvr4XEGHmmACX5NL+0n9Mbw4QPS2H9tmMCYGNr3EPZ9y5aYJzJ7njYP11jUbQwKHavzci0EhUboJUkrioM8Wz7RRu/kK7L+V69I5UY9VuDGEOsC84NJwDFCCe2P6rECh1Hdm8KxIvj3fj1OP1kFFTE9bR5u+02cGUyd1Y/GEOh5bTrPU6d7M+VQJTrgsd4+dB7TvUdvvlFNoUQCrDSVv9KR+q/fKM1b3h8cYO+ZMXneJ/BsD5oOb+MUmwvLSNRBDOgbNG7OWFFl5ATmdcxXmITeC69L/5GXpHIwHkotQ8Gn/Z4aSPvBI1Jt6X0Rqsl05zmY8C9LgjBtCIapiPUTvYSIyAPRz1IU2hxQY3Yo1RnufP2kVok+69FDqAyiF6wqVM8POlL7reulefjGzdl30nP3IM52Cp0NQ6sIOqZID3ghW4g3xuzlacvTNoXHJbL+/be0ep6R6v3bwqEUc4ElhKUG+ExfWp/QY8UVWl3QAW0TDXFmFTQvaM46YCprl3nzHQNgHIAJyccHO/wDfcpuMiCas71G5TvffFbG312TyqIeKfURR0iAQr0xlDN9WfjU1dK6+0Bw6eL2PlO/jIEw26SZACiU4cFTnp/RiBjUAJPBeTbtA/IPfNIpO9VXs4GmR5s3zkrv709K5SgeaWBNxYY84c75yY40P3mH1K7Ux62xemgPkDi0inDKZBVE+0XQZ5yZTeU0Lm38VYigShrt0dasPmXMlJlEHWn1/OdzMvrKWaks6b0PLt3xcmn3PThWfHhJ2j9/i8kilpydQJ36ZRxgUD7bg0jwTOLMMGUIwWcLYfM3QPJmwSJbkKfPnC4GqvsL3nX1vqSH0rv0rlkv9+PskqkZxDOfx9ek+St3SP3a3UE9qWb49H85H7ED/5CxCioKkgYgDzwNONXZeEqKwgk0BuV9GY0qcaC9/1qR4d++IXKVnrvi82YrXiytNX0udbgt7Q+FQyku7WmsMOd9oO9lgLNfuMSgzD8oo0HBG/U4+JOzMxaaX14eh2Ro3j5tMSgvA9ws6A/4o9WuHiueErlFlxYYmXmdcX1TOn6iI42HD0n9hmuCGcSN/3RMbMCLxkMZDwsTVBYoHECZBugQEFey4lZGD9KprbQ/sRkG2D3xigz+8lWpvl+f+WRPDJWnS2/c073oqpq0P6LHCvRtb1L/k9xk5ugH0I/X0yFsCQKRDBDLcBjiH+TK2+ykFOl5n1N8HaDdGPYH0v2KHkr3ImznA3zsPS/qofShm+xdl9nQeHUwU+ZSwizf2WXeK/mMejoM8c/TgbtwFfdBeTxolQVURucgu/quq//FFX3PHi/tcIrkwDvc/GAk7Qfu1GTpA/8tHCtCdPnfwiVWFGgRjaYQ23QayL0EaBWg+jiU6tWq+7WT+sGBvuvCXoPDKpseK0avrknts/ukdfsNkeqnjILzYVocucs8mYSpOdD553lxIpUUgtJV7dgeD+RCG0hG0ry1/qk3tHqek8rPaPXgysUGIfw9ty7tj+u7rm0tq3KY4zjoz/ehTrrHWQjkWQVRkYKAaBQibsT443VACqUYZtUGZj8hdq+X4t4HeRkNGyjelmjrfEMPpSc7dqzAm1MNLiwvVNObPVl4+Bpp3bU/mEAYMeFpnOwTQqEMBy97qwEhZg8MNN/3eKFsUIm/k/LXXSvHQcfb8jgFMxoSpHGtv35G+n/3jFTu00OpXqli7kMScLV6St91/b4eSnduj3vP9Fho28fucfIJGUO2xMgAhGLaPI3KXsanwfCMMNuWtzGFxzg63/qejL5xTirbdfPF24o4mWO86zqn77r0DWrr6MFMHbH6eD3uY/d4puwQ6GVXMS/sccoX0cgD9Lt9PiUhU1m+VHaeLSuRWD2Dt98Nx4oP6H2PPu+xwcOhGrRL+3f0WPEpPVa8b1ewy+SpPttcfxRMIPT8uBL2VrouNQ7dtKXJ2KT7xIsy/IfT9q4rPBBTJpKHh/H63r1y93Zpb+Jd12ZjsSXmS3CzBijvrith18kGGTK1qXwhAbo5D/ULt+6jemN4e/hOADMKs2a6ocvrP1al+fCt0th3daBp9VzuZhXkS7AsWWV0BISwEdrUhpwlabNhh4HaJ3Rf0Hdd1+kTQRwj0GATew++/Tmg77p+8Q4j68v+APXXlmGyD2XMBKFsQs662RJjApAs4pDyeKaVIHYn62jZPGaIYzo0tW19TQDOUfYJ3b9q9dyoz5rZYoXYjeLz+rbioZulcfN1gZtUj590qnuY+vY84pCZu0nTESGVU4hcTBKlvSTgVB791KZVoE4QWu/Z78vgcy9Ldb/eGKJ6mBxA3AfpBxz2CR32IhxKXaNdQsfKUPIAiWfMiIBe+H0QMpcqkcbMp/yBDSwMLgyU7gKNPUDa8DTgsImXe2P9Mh7vusb6iU/w6xKAz3dXLkr90/qu69Z9ZsKeUceYy2ybYPRBPIXUtTjihGT/6hnCHDQhFWgo7ZMO+D79vrBmn+BpcrFR6P81/aSuUasbnNzdBS0fBCiWRiRZA+uv/FDW//El/RJMbwxRjHq3HDc5e2IoKwNpPajHirZ+xYEHYrqhM2Zvl7TgcfKLcZDn8YlEnCyVyyqIChAqSoR3TBnq4FO8N148Leevu1rWB/rJW8iPNPQL2R+d14+1WzoQy4APIcFRPTZQ/YD0seMyOr4q1fv1denF+PE39PEBptIXfu1aaR25KRrA4i6OmYPneBhvVMyNkzKprSxBNAYBb4iK5LPvZfDJ8MEj18vunUvh33VohjCe+oJ+QqxJWl7agcKYarBBu6agMuuvnZb1f1/Rj7/163h9xiPbXGbRX9JD6S/fJQs7wle1qCwfy5QTJaR89gmh43Fvo/AjzpxALMdsIJ6pOOidTlcurF7Ax0Y2zpyIjg/JWV5etiWIQGbZGl3synBVD6V6KZ82ppbVXnVpm1Sb+ip5blnmIintlMUDBUvQrKBpFUbY0sA8jzJFMNXLycB+TF6OXtKZaatEZyvkwn9xWJTRIpp3iI8xTSYSmU5OctGnv14/w7GiqJQRE0Tvk/63WpageQmYFZDXBR7WRn4QW5rxWFWzfL/XvKnHHRhgGOS0a/IIUwnQkQhfAKEf9h2vB9y3tA8eJIp0UprXJc/TzJYbl+cRpx5k0TK6DsBdJgITvyBTyOMTiY1jG9VnKPS7cQ8hXshvRTf14+Pd0hJDEBxManwWL5Xdap9JYAyX4nOe7tQSQ9AMwA/A05hh0gghz6C9bop7+ZTn+0VyoMGH9+Nx6EPG63rc2wee6nq+2dGrz9QSA2Oe4iy+d/L/HS98YDZv8Cl/1gz5BG1UzusU4ZfLTpHtlGbPg7Y64NTYvH7qZ578jwM/ex7kgykayKxZo/wsGW//UnH6m2fncsRT+LgDhhmExxlQSvOBeB5xz4cN2C6jkVcGGUMKfbwpz8dBu6kM+uQRgvY//WGXnwTQ/RIAAAAASUVORK5CYII=" />
+                <span class="brand-logo brand-logo-thameslink"></span>
             </a> |
             <a href="https://greatnorthern.{hostname}" style="font-size:10px;" title="greatnorthern" target="_blank">
-                <img height="20px" width="20px" src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEgAAABICAYAAABV7bNHAAAAAXNSR0IArs4c6QAAAAlwSFlzAAALEwAACxMBAJqcGAAAAVlpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IlhNUCBDb3JlIDUuNC4wIj4KICAgPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICAgICAgPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIKICAgICAgICAgICAgeG1sbnM6dGlmZj0iaHR0cDovL25zLmFkb2JlLmNvbS90aWZmLzEuMC8iPgogICAgICAgICA8dGlmZjpPcmllbnRhdGlvbj4xPC90aWZmOk9yaWVudGF0aW9uPgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAgPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KTMInWQAAF2VJREFUeAHtWwl8ldWV/+e9vJeFkIWsQAhhR5awiIJQKqBDW3Hcflrb2qnLzLTWdpyZ1rZjF/21th2n02lHnc44001bOm0dx9K6VKs/64YCAiIoyI4QlgRISEhI8pZkzv9873y578tLApH5TTvtxffde88959xz/t+56xezuru7e/DH1C8CoX5b/tigCGRnZWVpoaenB1Y2bEiz1F8b6cbn8hjN5C03fpfX2lyZTO3kI4/pYL0/PpeX5WAyPaRb2XKXN2soQ8w10FX2u1weqs1DGmJE+v8yDRQ1/dmVyeZMeoK0kBHc3MpuZy7NLQd52Oa2B+suP8sDtbt6grzWZvJWN/1GD8pZ3eXrr6w6hjLETOEfQj6kIfaHAIz5qAAFw9Ma3fx0eMh/unyu7qGUB+onU1sm2mD9UkbnoODy1p+ygehss/Zg7hritrkyxuPSrOzKkI91m3StzZU3f6ytv9x0DZiLMqY+nZLmJjPKOnPbjWb8bpvRTJ71YNl4zjQ3u03O+g3aY+2nm7t6M+6DXAdOV2mQ72zoCOq0elB3sG58bn66PJQxoFnOCBAb/pg8BHQOIrr8MQ1U9kTSeYwWlDW6q894rM1y69vqg/EFdbpyVjYeV7eV3dzKJmc56fo7m/sgKrTwdMvWqeXWZjnpmcqkWXLnBZ8GmTvlH1Omfk3nYHpceVUmD1/2bAJkys9WTud75F96IiBBWoAjBWwm0NI5B69liRKmdE6p9jUsneX3oeZGjh8RTlTSB9d343F9U4CMYMyuYmv7fcwH88fazTfzm3Qrp61ibAiFQmhracPWTTsR64whS+peSFto984Lpjhzzqg0XitbpBo9k6Txum2Z5IwvPacPuXlRTJg2DiWlRWkR4mo83XK2y2ioPfrTZ/Chj9+PZahCFxIuy+98OSQvJYlu1C2pxV/fcyOm1k2EzLNyZAgNadrQG8W+oQacj2KMuaAUXS1xCbfBpkUPN4sLfd+pl66gs0HerPznMxpviqLTrtGUzwLDGKRR1Vg9lfu07t6G7PwwXntuN+779IP4+4c+i8KS4R5IMhqCvvZKeSsX6+SxYMl2K0SaDfOXzkUFfo2OYzLEpN6d5HKaASQjSp4lDvVI3iOGZoWzEBkW1rxHvgmow+RJjdbEqW4ku4SRdepIJRYpny2y4RxpTIFEHfE2iQva4fAr3sIfzg2pjM+f6MHk80ZhwzO7sGXDNiy6+HztwfXVLVv/lhs4rPt30l6j13vN+NFY9vl5eOTrz6N2Tjm6muJiRcoytUq41RtPiobx2wgBiBZlI96ZxJFNJ3ASnYhLuNuKGEEY+YigrHY4ckdEET8pTsfF6RRwVJ0VycLxLSdxAqeQLQhSOlvkqsYXIRSWuvELL8EMRbPQtrUTR6U3Di/yD0MUVXNKpK8oXnziVZz/7jmIRCMSRR7ABIfJQLJciamH0fqsYmzgRL3+pdfxicV3Y0JdBZJt0i2V6uvzlKse9Sj11uUtMiL2bz2GPORgwY3nYFJdLSprypA3LFcm/DiOHmrCvu31ePWebTiA4xhXW4bocAFUgFKQQlmIHU6g7oMTMbK2HIl4EqHsELpOxbDmP7cg2Z1EtvTTLRHCFIqE0LGnCxOvqMbEWWORTCYRzg6juaEFm36xHVnDgObtp/CdN76ISdPH6zBzo0OVyIM09S9FcOs6SbuNJjRl5gS86+ppePPhvSidOVxD3It546Bm+SWBSEEYnUdjaGpsx3VfWY6LrlgMRiGBCaZYVxwNtzbi5WfWY+XHnkArOlAytQA9cZlIc7PQ0N6Ky264GOcumoVkQgCSl0WDH5nyBL56wwOYfu5odB2P67CNFmbjzcRB3HD55bjyw5cgIfzZAtDubW9j9X1fQ8m5+WiRSFz73EYFKEteAKM9mIL+u/WQW6GgoTe8qABLrpqPJnGAikkP/pN41rHfcTAGNGbh60//FW754g0guAQnqJtDLZoTwRgB79qPXo67N3wKUy8bg64DMYSjMmcp4mKDgMLEIaUk8Wv5FRfiomvqcHRDiw7jXkdFio4rf29OXYn2JEaXj8Az31+DxsPHVH/QJhUc4OFZIgwEgMkAYnnuwjpMGFOBU4e6JJy9dtKZOOJCMpHGTyURO5HAHa98AgsvPk8d4ptkoi5GTGtzGzpPdamBpHMx4HCYPncKPnbndegSR7qTskCkHO2RduMjEOQtKBqGP/vMVbLtSCIhE3woOwWGMHISV36ZxJlYZ2sy1o1hNbl487V6bF63VdvO5EH7/a8ahixzA2t0TRWWffI8HDp6AmFZOnVFEouVV5atUE4W6vc14ZafX4vZC6Yrnc4wzFuaWvHYz57GNz/3b/jqzffiHz79r1j5nYexa9teHTbhcBhHjxzHkw8/J9O2DCNZBAicTujOy/Ki19vD1J03DTfecyl2vdWASHG22kOJFLufs6B6BK8eAb5EZsXnVq1BR3un9u36aL4acMG6v1FkgyuomysJ9Qsumocf4ymZGL03nHpHyM6TyXBzGxZedQ7e/Z4LVD+jgJNk46Fj+KfbvotHfroWtbKf4uqVkPH4BNbie/gV7nj0o5gwtRb33f4Ann14M6ZOH6nLfji1UqbHqkSqRJZuQSRf8YGLsfq/N+LgC8dQsag45ZdJWE4rpSz/dXf1YITMcS898AZ23rIHBNmSgWG50ZkbzZ+DNCqkgblX9jqbcE4tlv7lbDRuaUFEVhxdz6X/cG4YR2RpXXL1fAyX8E+mwOHKs/K+R/D4T9fjXYsmoWJGMUpnF2LUglLMWFyDqilFuPdPV+L2934Tux6rx+xFY+UtS8c6qrxZjgZaoi0cntwJE6TSihLc9OWr0SB9E4Awl04/ea+PDbSeT24LInnZiMkrevnp9Rp1nPiD/vb67SvTgj/EXDLRY9hSKC8/F0suX4Bmmay5G9SQlzed6Exo6DISmKzDvTvexhN3v4KZ00ejo7FT5oEkmja1YeOat7Hhxb3Ys/0oDsouZ/PuA2jobMW61Xtx/K1WHa5qpDc4VKcU9U1y/jhc3+APj/MWz8FH7lyOgy8d132VDidPwn8SKqULfpwnR40pxjNfW4eD+48oj9nrCwQK1q476UCb7yyZCNbMc6di9vyxOLr2BAqm5emOtqsxjsoJEh2VJSpOQJne3l0vYJ5CVaRIl92T2ztxwSen49ZldVonj4UvIyIqG7htG3fjN3etRckc2bg4qVt2giH5d7ypGetf3IxbvnS92sbV7aobL8HGx7bhtxu2a3Q5YnxbadWkbFzzK3Pw+oF6bHx5M6prR9II30+X2YAhjWV/DnKZrExHyFRWVYpl1y/AvWv/C4WRfAlTGREnu5FfmysTsqfCnG5uaJWwlwiU+SKcI/ORDIWZ86fiPVcuM7V98qLiIjx419MozyuUthTSDldhcQE+cccPceGlCzB9zhRd1UaPrcL1X7kSD6y4hb72SSRxiGkutiQ6ulGNIjz70Bosed9C/3xmdvdRkCK4A7gPDzu2v6+af+EclKEAsZMJXXFoldeW/rayZXebTumjVgmMHq54TPFYQo8VgRevbXxwzpBDDH7yz6tw8kQbuAIyvUvOWJ+66mqcbGnXuvvwhlgvJdnZjaIZw/DqL3dg2+s7tIH9DQpQJgajUQFXEKbaSWOw5La5OLKnRQ+H4eIQWne2o7OjK9WZB0tFdZmOfYLHJbZAHDt2pBmH9zdg/+6D2LfzgNw3tavT3vvVaPfmC316elRp6kEwF6IcL/xoM576xXNK1e1ENBs3feFq2YV7jGa3F1LU0zs76d5I5k6e71789at6jAnLUHWHlKel90l9fgT5ynvb/RINzI5k490rzpfZRbb5Us+tiOJgazOO1B9VPuto/JSxGFdQoUcPnqPKaobjqXtW49a5d+Fzy7+BD07+HHZs2+3JiAOavHcQLEq9t4HH3tpzy/H9m1Zhx5bdGkXsc+qsSboVScQlstPGWq+s14mMBomiinGF+O03NuDtXQeUTB2unJUt77PMU8qcNcWWT501GYsunYqm19oQzc+WPW0SW1/zwtWWzpFjKvHh+1fg+YP79S3lV+UiWpaNyKgwImUh7JPTV1yc0WTBojkdsp/1aAwyDAXMaF5El+uf3LtKN310gv1OmDZW91++3XRaVdhTYlV4ecWSOyJHtgitePXFTR6HjBBfTihWZs6fH0FmUqacyslcJBdPy65doHuQpGzrq4tH4Ml7V+vwoaHcCzFdcs1FuP/7N6Nx60lsWrcf2zcdwe4tjXhz3SEsLhiPMjkfafLsd4oExJzzWLynNxhj7QmMOrcEq763Br99/CWfgbbZG1ei6PWgdZ/SIvRkh5zPIsV4+oev4FhDk5A83yhvP+owff6NIgnsyBrdMmkcZuSZu3AmxhdWoH1fB4ZPzMPe9Y1Y9eMncfPtH9EjRiKR0LuXq2+6VHl3btsjx46TiOZGUFpegsnTJqCyutzry+tO3z532p5RDmqpOPAzaeLF2aSaCnz32kcwbfZk1E6u8c5xqV24OmACUknTJvYnZE9UWJcv+7K9eEMu05ZcskhFgiBbXSPI0PKUp7pIIWo046muHYWln5mHxsZWvZcZM7MUK7/4G6xa+aS+Ni77nEDZwfipY2V5X4r3//lluOK692Hx8gUKjoHNYwnPbKt/s15uMAvQLYdLOmQvp4f7CSZGiFfSeSSvNCp7rZP4+f2PIi6HYe6LrE+PPYU8RVNyXiY1UdQd60GpbDGf/9VadMkio6ukw0hfzd+MQ4wG2s86pICduBf9yTzpR8a0HCu6O3tQM60U37x+JX7wrZ/JnVCzTqDWQZp9qYo3X0G+nOzAVz9+H35190venZOEPw+fXBCYIpGI5jz8JugqURKLYy0JVM8pxUPffgEvPLVGebj02/IfUfmUx4osy16ddnHjWDZlOF74983YuXWvyttLYcXKzDNuFKnEmFQ69TCneTu3+PqZePXBt1A+o1A2YUmMnVmGH9z2GNY9vhmXfmwpZsjum0MqNzdHhxDB7ZK33d7WjgN7DmLNs6/h0TteVM1jZpXqrSIvzHLEpBPHW4TvlEzEHXKvlIcTEmXD5MjbY9cZYjgPoWMKS/CjL61CzYTRqKquEP0x+eSTg6ajzYIjL2AlKS5asopEvnc13CFT/ivPblBbGYX02Xw0/zN/WVWz0x8uaCw/88vncdsV/4K6eWPQ2SiX+3JfxJvFltfbcUhWidFyip90ZTVGTi5H/vAcCeU4ju0/gQOvNWDnG4d1tz16YoncCvDKVZZob7DrYTK3OIpIvgAieynuw7ra4+g6IX3oPEOP5QWyTe6jYkfjehgdPm6Yf+OQ6Eqis0n2Z/ySoCkdIMFBbyM6jgigw6L41urPg6svXyL7MymKpn049JQJMUMEGY3Icojwhu4z770bLbva5MiRo5MfXxmvQfiVoetEHG17OtAmV1wx2Q7wzoeX6PnFOcivydE+GHl6CS9yntu0KAvx1gQSR+WeWgDhST9SIV8t5CZB37Cw+A5IIRQNIdGWQOxgaocv/KGSECIlHBw+p7nWm8v0llMaka8e9fj6QzfrymtR08vUD0AuQ6YywWJ68J6H8B9/80tMmFepG0P98sHXQ8Mlomg8L9azeDLg+U0u2zkR86avFxFV5T2oVmW9CzRBRCwUkgwJ3kfpmBGS5irBRnlh0pcXXSQSVOlH7riVUXVSiEkqrLMTaY4UZOP4G3JWvGYc7vze36KgUKIwtVqTi8kfYua0vqUMEaTMKWCohFG0XXa0N9TdgTEyVHJLcsR5eX1qgHKr8fTRT2af6kk18GOaouVzaYGtvipS0ipSN70pcbdK9kFTSo4fGfe9chT/+MKncN7i2T5AhodO0lah0kxlA806NZ7JM8bjth9+CHfc+AM5J+eozXoFaowD5EF/01lT1vuomPvpXOmoGU8mWevNeHr1cNg/j11oqG/sJTolfw6i05nGoMPrF42XOSe219e9iTc37pDLxtRmL80OVlIGmp1C0U13agip4jQZr6tUwHqVtKejKI3OFxwgaNUjuk1qlRD4tTa/IBdLVyxEWeUInfzNXIqmDTEDyABwuwrSrM78/0vq5nwm/rg4+BE0NCcJjrepPBOg+PYOnJQ9kXxtzUpyBpYZkz8OUjeSFHt5WE4jB3ohNuEpP5klOfpYZBNtpRqeHeMy+cdky1BTVoDKIrkMNB2UlZRxo+g1nc7T693bGTuWDCBKAwnFPXKQ/Xa93HOHZGKPyYUOT/jMY7J/kQ2llmXjp7mc78BvbVzJXAfoJX+8s7IyO/DHiNhkZpFOPsrLoVd/crL/5IxyrJg1GhOriijYJ/nf5oPI9eEcgGDDLchCm11/2E57GcZP72/HcvlKWivXsvuEpjokNwEJbb5ijawsAqQgGnAGYgpAuZHsIQ8nNl7UyY8YRQWQSvlR935RBdkvkf6+icX4wNxRuOCckRhXVYxsWZG9rg1NrerDn4OM1L+zvWPTeIN5f7IunwHUIluC61Yfx+OyKayRr6SHBcmIWO+bGIwIcYzeKQdRJ6P8MUMWQeRPIrBHQOyJx1EYj6EkFkNbRwz1bQKm7OKRl4U7p5Vh+axqTBtbhuL8HN8svToW/e78Y43+EDPnGElWJpNbNqGBcpc/U5l+so8i+RZ/fXUeHt/SKodS+YQtDse1MaVdQUjBxUyPDYqSx6AAypuXg6wgi4L8LNlqyO5Y6HtlZWrgnkxQfH9RGFdVhDG/IkfnGYLARBvMV7tWZt1NtP8dTtKuutMvcwSEJfQPyRlrvnzbqpeDZ4UcKxppoGGgoPSj0/GjUvjzha1eZOP8sxgZZSV5IdwuN5lLR+VhamkOClLf8amNm1yNROuHxAGSH0Euj/vmjW405kyGvrW79UxvwmiU1+8e4tCoYRF8dmQubt11Cvl0go47zvtldunQGSVVQqPxuwkKfyJ/U1kElwko8yRaRhd4VyW0j30r9iJj9pMeTNbm+uJP0mQ2J0zQBKx+unl/eoxOjHlzEZbCW3LqPuflJlU9TOrtDhI+LsIrxy2USjtnjgYJwc5UtMyUG4S/qMrBhQL0ZPmrtTy5trDEfQ0TZy722dt/73xKH106+d26H0FGVIXUFkhsHwww4zE+q5sqo4sFEkVemlQSxRfkq+fX6jtRLn8t0i4jwIChewVSKZfhKPdyOGzRImjdWhnFComW2RItFXJlYikdlNSkLo0prIxNc98eqfVbFic8mFWJX/QVuYKuw27ZmB1VRtLc1WEN5GVvnDTXHu7AgrXNqJbJul6IEZmQRwhMhQLOToYagZG0pDCMD8rcsliiZYLcGXEZ1yS6OK8RWYfktb3D54BDjLrpnIHRHwBnYoOB5QJ0SjaAH3/lOH4kfyw6U65IDom3xwkKwZH635VHsXxULurKc1Eqf1ViqTdavKgj3YPSOE4vNx8zcfv7oIGYKGiOsRwEKpPsQPzUYYkOMYqe2NeGFetbdLJl22Xy17LXSKRcIBEztijCP8dVEfbNaLFIUeL/4iPjMt+fw0FgzoZdBlCzXKR/ekMzKmU1uqwmH9PkywX3Sl4SULg6SyJOhGookaIKzvDhA5QJlDPU9Y7Y6Xi7DKsc2Q+50aIzZAqUd9TBEIX7DDEbGpmixdqsL+MxcC1nu/G6PK6cy2t0k0nKGPIixVue2U49JmN8RrN25tbm0ly6ybh2Gc2V8fuSxozRGhRyO6aiM0muroHkOOly+AylL3NjKLJBm1x7hzTEDN2gYtYHasvEPxSageCCYuUz1TeYvbKA8J2lp8FohrDxWU4tp2Ooy5/ec3otEx9p7MPtxy1TA3lcWbec3sPA9qoeObz1GWJsCHbqKh6s3eX9fS9rBAURHggcOhxsD8r3B8rp8vUnb/Szpcf0DZTrkWioDg+kOFNbsJ9MPL9rNP8vzFzDMjky0Fsz/oF4XP3vtGz9DabnbNiT9j/UWcdUnKlsBrntpLmGuG1WdtvJT9390aytv5zymZJrb7DdtcP0BnlYtzbLSfsffxEXZ3YFO7gAAAAASUVORK5CYII=" />
+                <span class="brand-logo brand-logo-greatnorthern"></span>
             </a> |
             <a href="https://gatwick.{hostname}" style="font-size:10px;" title="gatwick" target="_blank">
-                <img height="20px" width="20px" src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEgAAABICAYAAABV7bNHAAAGKElEQVR4nO3aa4xdVRXA8d/cuZ2ptdGWWhAtgg+QjEhjrEFpiEY/GVQKiYJBxQcJEdFi4qOGpmp4SJqCtTHgA4wJ8UGU9INGxBjxFWhQwEdBozaKQhXrUAq1Sp1SP6xzOnfOPefec84dmmr2Pznp9OznWXfvtdZea5NIJBKJRCKRSCQSiUQikUgkDjG24/iT6tY9BmuyZwHWY1tJvXG8DpfiNRjDQTxZqPd0bMRHC+/PweexOJ8jZgp1upjEm/CtmvN/C67Gs7P5jJXMCTrZv7tx7fjaJcuGdbwMF+Nr2SAP4gLcX1H/IHbgq/gNVmM5JgoP/Ay3FdqP4eGs/yV4bknbblb3ONyOR4d9RMYj+JUQ7vOwsKTvcfwcF+GWYSvoFdiCV2b/347XYlfNCREC3oy3lZRtxgeHtL9U/PKTFeUfxqYG8yGEcB3ek/2dM4Mv4uOyb+z0NZ3t4Hx806xwpvEJzYSTt7sI1zdsl5MLsbjNctbhtIZ9HsDn8PeedzNia39IzzdWCeiNuEksw5xf4JaGE8nZJz7kKy3bXy+2bBnLcKHQaU24F49nf89kY3xEzPUQZQJaJZbfWM+7aXym4QSKPCa2SpXuGsZmodPKuBCvb9Fn/o3XiR9wX7FCUUBH4ZM4tvD+AfWtxSC2Z5Npw734+oDy9TixYZ/j+I7QOX3CYa6AujhP/y/xBL7dcOBB3I5ftmy7Cd+rKFuJcxv2tw2XGGAFewW0TCjDsUKdx3Fnw4EHcT9+2LLtPqFcpyvKL8PpDfq7BH8eVCEX0Lhw0F5QUmcv7mgwaB3u7hm3KVuzp4yF4qOPqtnXbmHRKskFtBjvVa60HxEKdj65R1jFf7Rsv1E4fGW8VXjy80Lukb4ILy4pn8GP5muwHu7DGSO0/z1uxqkV5evFj7BjhDEQK2aBONOULff9+Muog1SwN3vacpWwQGWcirNG6PsQuYBerlxA/8Hf5mOgp4gt2FlRdpXmHnYfHbHNVlaU/xu/G3WQp5Db9B92cyaFVR56Gh9ER5j1QZ1UnYGOFK7EryvKzhWH69Z08Bz9vk8vg8qOBHbgGwPKrxRGqBUdYb2qDq3/K1yu2vk8EW/WzufSEZbq/4EtqkMxV4hDeGO6ysOOo7IILxQWclD/k8KNqLJETdgqTPsFJWUdfEyc+hs5p1381vwLaQq34lni/PSwsIjFrXyciB5snKdxL8PLlDuQZ4mw8c1NOuwafB45qN0W3Gk2TLoKZw+ou7xF/1U8JEIiU2ZPCb1cjbvwx7oddsTqeaCifMLcqGJdduIa4aydI1z/w8Wn8OOKshPEfMqEV0pHeMvbxGopskBkFUZlqzh/HS42qT4BXIGX1O0ot2I/Vb7NJoTUR2UP/joP/dTlVtVBvoUivLq0Tkf5FvuBcgFNCms0Knmi73CyTrWHfZ5Iag4ltyrTqh2tqSazOoKYFh52lZG5BiuGdZILaC8+rXwVLcXRLSZ4JHC52ehlkefjnYas7F6/5E5hAosswZktJtdLWW6+LRNiexxfs/4G1fpvPU4Z1LhXQI+JiwRFa/YMvKHmZKpYIJTjfHCxmOeimvW/L5R2GZNCSJUKu+jZ3iWWZZGVQlBtWS6W9Ki8SuSwVuBfDdptUJ10XCN2SGnUoiigJ/BZ/KTw/hi8o8GEihyrXI/tF8H7OpyOG8SWf1S531bFQ1nb0uSgcC5LFXZZmGMX3m2uN7pYHPRqe6AFVpe824f3q5evX40vmbWoBzQTEFwrrtuUsUKki/rUQFUc6A94l/CPcqaEF9qU0/RffblPLO0v1Gh/Br5sbtblFO08/HWqIwdrRcpoTtxo0AWq3SJrsCeb5AROEs5X3XTKUiHUPHieX6FZK/L0wzgbN+r35hcJvXa3yNvV5UGRHF2lX+d0RXh2XGRb91DvCl4HLxUXmd6eNX6fasuQc7LY22vExYMbheO2y/Dt8UyhjD+gOhJ4QOjMPwk9tkG9H+5ofFeERcrYj38KPXdPkzuKXXG/70wRx9mu/LZFV1yAeLXIw9+RTfxJQ9K8GSeLbMRUVr9K34xlY3VFvGmd+hmY87PnaSVz6vQ8e2r2l0gkEolEIpFIJBKJRCKRSCQS+C+irDFmnPRXhQAAAABJRU5ErkJggg==" />
+                <span class="brand-logo brand-logo-gatwick"></span>
             </a> |
              <a href="https://southern.{hostname}" style="font-size:10px;" title="southern" target="_blank">
-                <img height="20px" width="20px" src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEgAAABICAMAAABiM0N1AAAChVBMVEUAAABAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWpAgWoAPy7///9AgWoAPSwAMiDz9vYgV0gANSMAQTAALx0AJhMAOSc+gGlBgmsAKxhCg2wAOyl3mJAAHgozeGC8zcktdFsANyUAMB4ocVcAJBGTrqclcFUALRoAIg/X4t8rc1oAKRcAKBVRjHcAGwbv9PI7fmY4fGQ1emIhbVIAIAzm7uvx9fQ2e2MPSzv6+/v3+vmzxcCgtrAjblQxd18BQjH8/v71+Pfq7+7X5eDA0MypxrxGhW4fbFEcVEUHQzIAFgHs8fDn7Ou5y8amvbdqjoRak39Ih3FJdWkvdl0MSDj4+vrq8e/j7Orj6+jJ1tKvw76Gr6F/n5d1pJNjmIVWj3tMem4fa1AZUkIAEQDg6ebW4N3S4dzO2tfG2tTD1s+60cmsyL6swbtylYtnm4hbhXpafXI1Z1kTRzcRQzPa5+Lc5eK908uxzcO6yMOrvrmcvrKas62VuayQraaEoZh6m5NeloJMiXNOd2tDcmYoYFEjWkseVkcfTT3o8O3O3tnL29W+1My1zsWuycCiwreSt6mLoZltn453lo1qkYdgh31WgXY8a19Hal47al0zX1AmUkITTj7e5uPW3NmfwLSmuLGaubCUsaqNtKaLqqOVqqKMqKB/qptTdmpLcGMpW00xW0wdVkcXSzsJPi230Mear6iIpZxuoI5vkIdmhXpGYFIea08ACAB/1EsgAAAAK3RSTlMAOAn3vtvJsGb90J5MSBL07buZkj8wI9PBtqSG5otyV1JGKtZ5XRwb4KsZc0SXGwAACIdJREFUWMOdmPVD20AUx7sNxtzd3dqXbClp0mYNqazt2lJqUDZgTNlgwmDMfczd3d3d3d3t79m7hK5CC2Pfn3q5l0/fvbt79y6qmtSiXqOubdI6paR0SmvTtVG9Fqr/Uf123VNaQoxapnRtV7+OmHptU4GI47x+EeX3chwQpXZvXwdMzxQZ4nPanJKvLBNV5JOw4ZNhnZv9I6Z5Q0CFbBZu88JJaydk52Rl5WRPWDtp4RLOYgsBqnW7f8B06ALAgxTgF1+ap4nTykuLuYCE3dB0QG2cRg0IZnLm47OahMrenxmQeB5a9a95qtAdgzg5c8PY8Iuzx6+ZnpGRsWb8qPCTsRuOTfYb0KmahtUR3bGFnla9lLV3ePmKYh2NEopPHz+yd5zyfPQV0YZONUk6vHqtwOCbvGSlYp63dbvdaDUzJh3KxKRbjfaPN/cqfTuPLvcaoFv7JJwGYBhjOaj4//K9K2gW1DESzEb9vXwF9dwmGqBBvWQcSVwvm+1753BT6gQSWPbeAtlkzywnkhL41KElGCze1cTm7FY3YpKIYvU/sojVWr+EoxtSbb5SweD0TiAW07cHBW3YA4wOk04zjEkIo7U645mJxG4CITWJBw3G+IgyZ4TLpWAomjXqGUpdMSxXrTalOxzhmGnd9gPE8ryEceoStw6B99nWkd7hRrqQGFOstaL8SP7EXdOmjsqaNm/+xsNbV+gdJvk/CtONL4jtepuXh57RnIGNAZbvlzkeRktM9ezd/KmaWM3O28pYFZ/ooEw6uJyHBtFpqjUYCjbL4zLKHK11+z5NIq25g/GTScanpH3UZoDBEU5v4MVQNj6fyNIK5z22EqvUQck+mfUkEnPH+HmIrKaOOLBJ+Hj8DlchsTLvmIMtYrf31c3jt7fdPn7zcN6uKlK5MrpC9mMOtvZPBmgY5vQC3rKU2CwzyrGkrM9Ia9qX8u12F2t1691W1m0vvnv4kQynTEqcjFuwNeqYxEPzKlBD4Ap248MFVmV+mYqp6N2mHVYrTVHhdUgxbodpK3FrmUN5pHNlkBWOLqVU7Q0A50wN6oNLsbCfwu1/5LdZHSetqfLkWJxYJUoYyZNkV2aiS31kUFOAwAZ8dAANZKUPG6rRbPKoq8ucOw7/gq2yoxwb8bXL6FJbeXO0ArGIZJph6FAENNyYCDRlNPYgSBFLXJrKhaCbnOsBCl7LEaLqChLkKC22AZDToA1wlt1KDOsGQgVv4YsXLRx0lxeRvygL82oxXWcQxgzb2eAjS2lIY7BcQ+4MN1V3kGCfjq9udkKD+qpmALYr2LqBL9YOWjEuAiIyDsdXF9oAt0kP4KSL2LrtjgWVVgq6anJXzI4FWcvx1Q1ODhqp2gI3ZjWmiFxzDAiHaqerCXdFLCh9ipzgOOiqSgMfj2fzSIqJBWnO5WXEa/pETRyI0U7Dw8nnhaaYisTMLEwgjC4GlETxIJNpvkYz55gfOuOOHbMUI5iXLvwPSEfjtOVkjoFOqlSQlmBvvpuKA2XcuYNGURpa+vP6qGqgDFyCmSKkJAWtMpV46PNRnLHLKoOVpUlBSYd22IOrZFEUaKpAa/UPEg5tKQ4tEmxTLGiBx272bIwCjT5doqu8mzjYIgY7DUJF2TgSIX76b5jNpZpozT+jv78q+fS3Ba+4Gv8vl46ftZUPNbEaizk70YI8NwsXJNkiTlKCbHNFgTQ1aZE1AmJP4INLZIuQTSvXRKXGyNY8nT1uaFLN3hS9aTeRWolkNnJaW76RNBLppgpPnxqWVO9yI/Mr6PNIGrHguS0ntrIcnF11JNqU2ewqKSnR0+nRMqd7SkpY2m7SRh0GGM05PCY2JdVK5PQ94VBHZNKdKL/1wBRbrRUvO15ebCaYmFT7uSrV9gIoWEjKvagYUh5cimtoOxMtmhzAedYoOsWSkb3GEPUmx1FLEMvG4eSu0IcNtMZteNSucKupaKlpZj4uL08E5D5FimiDH1rJl6YuAIE9+OSVMcyxC9kIWjcyThPmk5V1yqENO+QghdukAEAbFVE74C1HST3woMolwTFDk1wj6XAudX0g7aVOgKriti9wtrVkBVSd2SShDn15aER1HbqKVcShoGImWEmhvLuA+1vX9EeX5CriRJB4bb+HP7dUuvQJVHKS9LFKIJcpDvHw9wI3CDg5SvM+2bVqgZkxddo+u4lKKMeiedPWbGew0HLtGE8i9AuiSuSewI/x5pDz38FoqeIVubk6XHUJJZhyK6ZUCFhEsuTczw6JkToL1QkMgcXyhvSYCimGpnXISSitQDM0haWS5xCx3xwwQOfo+wMAR6pIUhahL7UKOcOJ9ePJADBQFaUewIec50jfdQ9TK6mQ9lwntutsPh4TCCqm0pZ8K5V0Y6+FpNWzX+XLiDjLAGnxl5puYLBgzkXN+BSkasJQwR15MsfrNEBqtS8K7RuDwVa2U86xb6325CCX9c1ceYV7LQZo2SHBdR/IhW2thujAmaA9oVeUPnhfuUNeCKE/jRNeIZshSZIuy2Y5V89YHQwVR6Ed7P2rs2WD/RaMT4PeST5B4GXUH1g8RznG8t+qWaOLZnQCRQk6hnYZ3cVvnoxSrhbXlvtwXOhPYrUfBDwX4CdpFM3LL91WITB2lrUzQu6270/GV3Vc9hYAD6l9avhg1BmHNysw84ImrJxVEzfm52+cuCpSoFycGRANAGk1fwHqB+iUxXJ0Q44moXImzSywoDuNe6hqUZ/WMspWtvDCnHjK2d0LywqcHI/u4LBqVf++iAKxQCpbfHD96uwsjO+orLmr11+5ViQViICYjj1V/6ZGTQDF+W0WSSzKnLlkyczMIlGyWPwcoBo2Uv27mndpBTKMC4mzJGmWGOJkCLRq2ltVN7Xo1bQvxKpxkza9/u/LX4dm/dqmpTRJTW2Skta2X7Mav2L9AfO0w2Bnyt6BAAAAAElFTkSuQmCC" />
+                <span class="brand-logo brand-logo-southern"></span>
             </a> |
              <a href="https://transpennine.{hostname}" style="font-size:10px;" title="transpennine" target="_blank">
-                <img height="20px" width="20px" src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAAsTAAALEwEAmpwYAAAKT2lDQ1BQaG90b3Nob3AgSUNDIHByb2ZpbGUAAHjanVNnVFPpFj333vRCS4iAlEtvUhUIIFJCi4AUkSYqIQkQSoghodkVUcERRUUEG8igiAOOjoCMFVEsDIoK2AfkIaKOg6OIisr74Xuja9a89+bN/rXXPues852zzwfACAyWSDNRNYAMqUIeEeCDx8TG4eQuQIEKJHAAEAizZCFz/SMBAPh+PDwrIsAHvgABeNMLCADATZvAMByH/w/qQplcAYCEAcB0kThLCIAUAEB6jkKmAEBGAYCdmCZTAKAEAGDLY2LjAFAtAGAnf+bTAICd+Jl7AQBblCEVAaCRACATZYhEAGg7AKzPVopFAFgwABRmS8Q5ANgtADBJV2ZIALC3AMDOEAuyAAgMADBRiIUpAAR7AGDIIyN4AISZABRG8lc88SuuEOcqAAB4mbI8uSQ5RYFbCC1xB1dXLh4ozkkXKxQ2YQJhmkAuwnmZGTKBNA/g88wAAKCRFRHgg/P9eM4Ors7ONo62Dl8t6r8G/yJiYuP+5c+rcEAAAOF0ftH+LC+zGoA7BoBt/qIl7gRoXgugdfeLZrIPQLUAoOnaV/Nw+H48PEWhkLnZ2eXk5NhKxEJbYcpXff5nwl/AV/1s+X48/Pf14L7iJIEyXYFHBPjgwsz0TKUcz5IJhGLc5o9H/LcL//wd0yLESWK5WCoU41EScY5EmozzMqUiiUKSKcUl0v9k4t8s+wM+3zUAsGo+AXuRLahdYwP2SycQWHTA4vcAAPK7b8HUKAgDgGiD4c93/+8//UegJQCAZkmScQAAXkQkLlTKsz/HCAAARKCBKrBBG/TBGCzABhzBBdzBC/xgNoRCJMTCQhBCCmSAHHJgKayCQiiGzbAdKmAv1EAdNMBRaIaTcA4uwlW4Dj1wD/phCJ7BKLyBCQRByAgTYSHaiAFiilgjjggXmYX4IcFIBBKLJCDJiBRRIkuRNUgxUopUIFVIHfI9cgI5h1xGupE7yAAygvyGvEcxlIGyUT3UDLVDuag3GoRGogvQZHQxmo8WoJvQcrQaPYw2oefQq2gP2o8+Q8cwwOgYBzPEbDAuxsNCsTgsCZNjy7EirAyrxhqwVqwDu4n1Y8+xdwQSgUXACTYEd0IgYR5BSFhMWE7YSKggHCQ0EdoJNwkDhFHCJyKTqEu0JroR+cQYYjIxh1hILCPWEo8TLxB7iEPENyQSiUMyJ7mQAkmxpFTSEtJG0m5SI+ksqZs0SBojk8naZGuyBzmULCAryIXkneTD5DPkG+Qh8lsKnWJAcaT4U+IoUspqShnlEOU05QZlmDJBVaOaUt2ooVQRNY9aQq2htlKvUYeoEzR1mjnNgxZJS6WtopXTGmgXaPdpr+h0uhHdlR5Ol9BX0svpR+iX6AP0dwwNhhWDx4hnKBmbGAcYZxl3GK+YTKYZ04sZx1QwNzHrmOeZD5lvVVgqtip8FZHKCpVKlSaVGyovVKmqpqreqgtV81XLVI+pXlN9rkZVM1PjqQnUlqtVqp1Q61MbU2epO6iHqmeob1Q/pH5Z/YkGWcNMw09DpFGgsV/jvMYgC2MZs3gsIWsNq4Z1gTXEJrHN2Xx2KruY/R27iz2qqaE5QzNKM1ezUvOUZj8H45hx+Jx0TgnnKKeX836K3hTvKeIpG6Y0TLkxZVxrqpaXllirSKtRq0frvTau7aedpr1Fu1n7gQ5Bx0onXCdHZ4/OBZ3nU9lT3acKpxZNPTr1ri6qa6UbobtEd79up+6Ynr5egJ5Mb6feeb3n+hx9L/1U/W36p/VHDFgGswwkBtsMzhg8xTVxbzwdL8fb8VFDXcNAQ6VhlWGX4YSRudE8o9VGjUYPjGnGXOMk423GbcajJgYmISZLTepN7ppSTbmmKaY7TDtMx83MzaLN1pk1mz0x1zLnm+eb15vft2BaeFostqi2uGVJsuRaplnutrxuhVo5WaVYVVpds0atna0l1rutu6cRp7lOk06rntZnw7Dxtsm2qbcZsOXYBtuutm22fWFnYhdnt8Wuw+6TvZN9un2N/T0HDYfZDqsdWh1+c7RyFDpWOt6azpzuP33F9JbpL2dYzxDP2DPjthPLKcRpnVOb00dnF2e5c4PziIuJS4LLLpc+Lpsbxt3IveRKdPVxXeF60vWdm7Obwu2o26/uNu5p7ofcn8w0nymeWTNz0MPIQ+BR5dE/C5+VMGvfrH5PQ0+BZ7XnIy9jL5FXrdewt6V3qvdh7xc+9j5yn+M+4zw33jLeWV/MN8C3yLfLT8Nvnl+F30N/I/9k/3r/0QCngCUBZwOJgUGBWwL7+Hp8Ib+OPzrbZfay2e1BjKC5QRVBj4KtguXBrSFoyOyQrSH355jOkc5pDoVQfujW0Adh5mGLw34MJ4WHhVeGP45wiFga0TGXNXfR3ENz30T6RJZE3ptnMU85ry1KNSo+qi5qPNo3ujS6P8YuZlnM1VidWElsSxw5LiquNm5svt/87fOH4p3iC+N7F5gvyF1weaHOwvSFpxapLhIsOpZATIhOOJTwQRAqqBaMJfITdyWOCnnCHcJnIi/RNtGI2ENcKh5O8kgqTXqS7JG8NXkkxTOlLOW5hCepkLxMDUzdmzqeFpp2IG0yPTq9MYOSkZBxQqohTZO2Z+pn5mZ2y6xlhbL+xW6Lty8elQfJa7OQrAVZLQq2QqboVFoo1yoHsmdlV2a/zYnKOZarnivN7cyzytuQN5zvn//tEsIS4ZK2pYZLVy0dWOa9rGo5sjxxedsK4xUFK4ZWBqw8uIq2Km3VT6vtV5eufr0mek1rgV7ByoLBtQFr6wtVCuWFfevc1+1dT1gvWd+1YfqGnRs+FYmKrhTbF5cVf9go3HjlG4dvyr+Z3JS0qavEuWTPZtJm6ebeLZ5bDpaql+aXDm4N2dq0Dd9WtO319kXbL5fNKNu7g7ZDuaO/PLi8ZafJzs07P1SkVPRU+lQ27tLdtWHX+G7R7ht7vPY07NXbW7z3/T7JvttVAVVN1WbVZftJ+7P3P66Jqun4lvttXa1ObXHtxwPSA/0HIw6217nU1R3SPVRSj9Yr60cOxx++/p3vdy0NNg1VjZzG4iNwRHnk6fcJ3/ceDTradox7rOEH0x92HWcdL2pCmvKaRptTmvtbYlu6T8w+0dbq3nr8R9sfD5w0PFl5SvNUyWna6YLTk2fyz4ydlZ19fi753GDborZ752PO32oPb++6EHTh0kX/i+c7vDvOXPK4dPKy2+UTV7hXmq86X23qdOo8/pPTT8e7nLuarrlca7nuer21e2b36RueN87d9L158Rb/1tWeOT3dvfN6b/fF9/XfFt1+cif9zsu72Xcn7q28T7xf9EDtQdlD3YfVP1v+3Njv3H9qwHeg89HcR/cGhYPP/pH1jw9DBY+Zj8uGDYbrnjg+OTniP3L96fynQ89kzyaeF/6i/suuFxYvfvjV69fO0ZjRoZfyl5O/bXyl/erA6xmv28bCxh6+yXgzMV70VvvtwXfcdx3vo98PT+R8IH8o/2j5sfVT0Kf7kxmTk/8EA5jz/GMzLdsAAAAgY0hSTQAAeiUAAICDAAD5/wAAgOkAAHUwAADqYAAAOpgAABdvkl/FRgAABmlJREFUeNq8lmtQVecVhp9v733O5nA/4BEFRAQBL0WsM6S2XiZRx6hVY7UmjbU1ZMzUMdaYxhEVhWJDvMZkJiW1xlgdb0lGJ0adOjHaqlgTqyiOKFjFGyAoCgfOgXPd++sPa5qkNkWgeX/uWe/az6y1Zn1LSCkBKCwspL2ak7u8d0mDf9zFzav/SAf06oJcoYdoiq5rhtKRBCGqaJl3unlDv5zcuY/r/cnE2cNOHKkatGpVkQHQIQBVYEgJzx9vLP7RrxZPbY9n3tyFjqz0KfM+3lm2sFv3sIyH3zsEYEpURRVICdOPN+0Z8/KSsd8WP370rHE73z/928ry+nfssaHW1AxHSacABBimlKAKmgMm0441fTr5laU//GZczi/n903tOT7/yJ8v/8I0zLmaptAnrdvJ37+7rq5TAF9KSjRN4U6bwbSjTSefezVvEMD8+blRw7N/NmP3trNL6mqaC8PCrTOEIggGTfr0jT311RQanZRhSlSr4HpLkKlHG88fzivo5b55P+zzkus7IsKsaCEapikxTUlkVMje5L6xX3zV3+EKqEKAIlAEGCZoukKFM8DkQw3VEamxleN+3A93WwAhQCiCgN8gfWDckTfXr3J3GsAENegzwWNiBiWKeNAOPUSltMHP5EP36D8smczvxeFy+1EVAUBSn5iz38zVIYC331jRtGWkPW/RkEhSoy2YAYnhNfF5TSy6QkmdjxknnIx5ZgA9uofjcvtxxIVvTU6NOdUlAK/l5UcOj7X+YfXgCC5PdPDFBAfFw+1MTLahCoFQBPvKW8i54GXS1IGohklq/+7HV/5r+XRqCF94bVnm5ivedbfbjLExVoWkcIWeNpUxDp0ZSTZqPQYXmgOca/RTXOlisc3OrDFpL8THR1Q+Kt9jAYyes/TFP1315gZN0sM0gTsoOd8YpNQMYkpJiCLpaVNIi9Z5Nt3G5JRIDl9zEZeddHHHW2+c6TDArxfn99hf7Ss6UO0ba9NEoq6CaUpUKVGFRFgUNGsIwmKhRYGj9W4qdp9AddazYMpQEnzdav9b7v8JMO2VvLHv/cNT6PSbQ8NUMAyDoBCoFguarqOoAsPnx1Vby+1zZVw9V07j1SqmTczmp2OG491bwf4RA+c8tWB55V/f/t2udgMsXp6vflbjy9txpe0lTZAYalFRdB2LpiFNE8/9RqpPfk5dxWVcNbVUlZ7nbk09kyaNoHjrEhKDUezLP0DvxDBO2GPz3eXNzSnQPoCc3yzN3FjZtrouoI2PtkeCAL+rlYbyi9wsLcNZXcOdysu4G+7h9fhwtrSSnZ3Jps3LGPfkE5RuOsW2TZ/gcfl46qVnqDUEn1xri7qxcFm/Leter/xWgMmLCiZ9dIdcr6IM05x1VHx2lrvXbnC/6hp3r17H7/WiKMqDfnsC9IhzULBiLi/OnoT/hovtM7dyu7yWUHsY0fZQWtPi+VulBwKSPbe8hcBzX3vYHl5Ed9uM3rvK6jYeKTk/trGyguZb1dRdukyrsxkpJarViqZbUVQVaZrYbDqzZk5g3svTSYx3cGbr3ynZcBwhwRZlo+V+K09Oz+LizFHkHL4LVoUBkRqnn+4WurZohQegoKDg3xVodHmSezhrLz0bF6wPxKboYmSazxIyvlXRNOPBppVIU6pCCMPvD4T2z+h96ODB3R/aPEJ+MHsHNWeqsUXbEIrACJpIU5L0g2TeawiAx0BXBZfu+NlX610MFPxHCz7c8OYx4Fh7d8KNa6dZsmiJvu35LThvNRHWLRzTMJBSYvoNYhKjiR2SFP3zgGVChh4zpcwZnHDgti98U1Vb/ohHAXREK9es9A1OyWxy17vs0jRBgqIq+Lw+skZnbC96a00zDyZ/V1/g9rJ8a2ljYErWyPzw9UUr3F1yD9iT7OeuHr0yyhpmRSKRUiKEIHFIr/385euxa15f4Qc+OtIV98BDxWcl7FZU5csfB71BHOkOT9ITvfe0x98FAIkfh3cPxwgYCFUQ8AZIG5WxsegRL9//BWDtO2vre2Ym1AS9wQdDpWskfD/xYHv9nQYAiE6IuiClJOAJkDA48eb7+zd/+p0CJAzp9YFqVQn6gqSMSN3+ON4uAYgfFL83whGBpmskZbdv+LrsLAdYtX51y+DUzKaoXtH3ine+e+47rwBAZM/IS8lD++x5XJ/WVQD9nh5QpEfot6h6PN8/BwCmmaZcdxuN3QAAAABJRU5ErkJggg==" />
+                <span class="brand-logo brand-logo-transpennine"></span>
             </a>      
         </td>
         <td><a href="{website}" class="text-uppercase">{name}</a> 
@@ -188,19 +215,24 @@ def make_row(instance):
              </form>
         </td>
     </tr>
-    """.format(name=instance["name"],
-               tr_class=instance["tr_class"],
-               jenkins_terminate_job=jenkins_terminate_job,
-               hostname=instance["hostname"],
-               owner=instance["owner"],
-               website=instance["website"],
-               portainer=instance["portainer"],
-               rabbit=instance["rabbit"],
-               admin=instance["admin"],
-               launched=instance["launched"],
-               status_color="#28a745" if instance["running"] else "#dc3545",
-               status_label="Running" if instance["running"] else "Stopped"
-               )
+    """
+
+
+def make_row(instance):
+    status_label, status_color = row_statuses[instance["running"]]
+    return row_template.format(name=instance["name"],
+                               tr_class=instance["tr_class"],
+                               jenkins_terminate_job=jenkins_terminate_job,
+                               hostname=instance["hostname"],
+                               owner=instance["owner"],
+                               website=instance["website"],
+                               portainer=instance["portainer"],
+                               rabbit=instance["rabbit"],
+                               admin=instance["admin"],
+                               launched=instance["launched"],
+                               status_color=status_color,
+                               status_label=status_label
+                               )
 
 
 
@@ -212,6 +244,9 @@ def base_document(script_run, table_rows, jenkins_terminate_job, total_instances
       <title>Running EC2 instances</title>
       <meta name="viewport" content="width=device-width, initial-scale=1">
       <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/twitter-bootstrap/3.3.7/css/bootstrap.min.css">
+      <style>
+      {brand_logo_styles}
+      </style>
      </head>
      <body>
        <div class="container">
@@ -258,7 +293,8 @@ def base_document(script_run, table_rows, jenkins_terminate_job, total_instances
    </script>       
      </body>
     </html>
-    """.format(rows=table_rows, datetime=script_run, jenkins_terminate_job=jenkins_terminate_job, total=total_instances)
+    """.format(rows=table_rows, datetime=script_run, jenkins_terminate_job=jenkins_terminate_job, total=total_instances,
+             brand_logo_styles=brand_logo_styles())
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+#
+# Local SQLite cache of the test EC2 instances and their Rabbit MQ brokers, read by
+# ec2_instances.py so the dashboard stops repeating the same tag:role=test query
+# against the EC2 API on every build.
+#
+# The nightly shutdown / morning startup jobs (ec2_schedule.py and the Perl jobs)
+# don't read it: they stop, terminate and start instances, so they ask AWS for
+# the current states themselves rather than act on a cache up to inventory_ttl
+# old. ec2_schedule.py only expires the cache after it changed instances.
+#
+# Within inventory_ttl seconds of the last refresh the cache is used as it is.
+# After that only the instance states are fetched, and the full records of the
+# instances whose state changed. Every full_refresh_interval seconds everything
+# is fetched again, which is also when changed tags show up. The Rabbit MQ
+# brokers are listed again every broker_ttl seconds, or sooner when a test
+# instance has no broker yet.
+#
+# Usage:
+#       export AWS_ACCESS_KEY_ID="your key id"
+#       export AWS_SECRET_ACCESS_KEY="your secret"
+#       python ec2_inventory.py                    # all cached test instances
+#       python ec2_inventory.py --state stopped    # instance ids of the stopped ones
+#       python ec2_inventory.py --refresh          # ignore the TTL
+#
+
+import os
+import sys
+import json
+import time
+import boto3
+import sqlite3
+import argparse
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+
+AWS_REGION = "eu-west-1"
+AWS_REGIONS = [region.strip() for region in os.environ.get('AWS_REGIONS', AWS_REGION).split(',') if region.strip()]
+
+## Retry throttled and failed calls with exponential backoff, and allow enough
+## connections for the EC2 and MQ calls of a region to run at the same time
+aws_config = Config(
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    max_pool_connections=10
+)
+
+inventory_file = os.environ.get('EC2_INVENTORY_CACHE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ec2_inventory.sqlite'))
+inventory_ttl = 300
+full_refresh_interval = 6 * 3600
+
+## Brokers can be created or recreated after their instance, so they are listed
+## again after broker_ttl seconds, or sooner when a test instance has no broker
+broker_ttl = 900
+
+## describe_instances accepts at most this many instance ids per call
+describe_batch_size = 200
+
+test_instance_filters = [
+    {
+        'Name': 'tag:role',
+        'Values': [
+            'test',
+        ]
+    },
+]
+
+
+def region_clients(region):
+    ## One session per region, its clients keep their connections open between calls
+    session = boto3.session.Session(region_name=region)
+    return {
+        'ec2': session.client('ec2', config=aws_config),
+        'mq': session.client('mq', config=aws_config),
+    }
+
+
+def describe_test_instances(ec2, instance_ids=None):
+    reservations = []
+    paginator = ec2.get_paginator('describe_instances')
+    if instance_ids is None:
+        pages = paginator.paginate(Filters=test_instance_filters)
+    else:
+        pages = paginator.paginate(Filters=test_instance_filters, InstanceIds=instance_ids)
+    for page in pages:
+        reservations.extend(page.get("Reservations", []))
+    return reservations
+
+
+def describe_changed_instances(ec2, instance_ids):
+    ## An instance can be gone between describe_instance_status and describe_instances, which
+    ## fails the whole call, so the batch is split until the missing instances are left out
+    try:
+        return describe_test_instances(ec2, instance_ids)
+    except ClientError as error:
+        if error.response['Error']['Code'] != 'InvalidInstanceID.NotFound':
+            raise
+    if len(instance_ids) == 1:
+        return []
+    middle = len(instance_ids) // 2
+    return describe_changed_instances(ec2, instance_ids[:middle]) + describe_changed_instances(ec2, instance_ids[middle:])
+
+
+def describe_instance_states(ec2):
+    ## Only the state of every instance, which is much cheaper than describe_instances
+    states = {}
+    paginator = ec2.get_paginator('describe_instance_status')
+    for page in paginator.paginate(IncludeAllInstances=True):
+        for status in page.get("InstanceStatuses", []):
+            states[status["InstanceId"]] = status["InstanceState"]["Name"]
+    return states
+
+
+def list_brokers(mq):
+    brokers = []
+    paginator = mq.get_paginator('list_brokers')
+    for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+        brokers.extend(page.get("BrokerSummaries", []))
+    return brokers
+
+
+def instance_record(region, instance):
+    tags = {}
+    for tag in instance.get("Tags", []):
+        tags[tag["Key"]] = tag["Value"]
+
+    return {
+        'instance_id': instance["InstanceId"],
+        'region': region,
+        'build': tags.get("build", ""),
+        'owner': tags.get("launched_by_name", ""),
+        'hostname': tags.get("hostname", ""),
+        'launched_at': tags.get("launched_at", ""),
+        'terminate_after': tags.get("terminate_after", ""),
+        'state': instance["State"]["Name"],
+    }
+
+
+def broker_urls(region, brokers):
+    urls = {}
+    for res in brokers:
+        build = res["BrokerName"].split("-rabbit-dev")[0]
+        urls[build] = "https://" + res["BrokerId"] + ".mq." + region + ".on.aws"
+    return urls
+
+
+def open_inventory(path=inventory_file):
+    db = sqlite3.connect(path)
+    db.executescript("""
+        CREATE TABLE IF NOT EXISTS instances (
+            instance_id TEXT PRIMARY KEY,
+            region TEXT NOT NULL,
+            state TEXT NOT NULL,
+            test INTEGER NOT NULL,
+            record TEXT
+        );
+        CREATE TABLE IF NOT EXISTS brokers (
+            region TEXT NOT NULL,
+            build TEXT NOT NULL,
+            url TEXT NOT NULL,
+            PRIMARY KEY (region, build)
+        );
+        CREATE TABLE IF NOT EXISTS refreshes (
+            region TEXT PRIMARY KEY,
+            checked_at REAL NOT NULL,
+            loaded_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS broker_refreshes (
+            region TEXT PRIMARY KEY,
+            listed_at REAL NOT NULL
+        );
+    """)
+    return db
+
+
+def fetch_region(clients, cached_states, full, brokers_due):
+    ## Returns the records of new or changed test instances, the states of all
+    ## instances and, when they need updating, the Rabbit MQ brokers. The MQ
+    ## calls run next to the EC2 calls, on their own connections
+    ec2 = clients['ec2']
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if full:
+            reservations = executor.submit(describe_test_instances, ec2)
+            brokers = executor.submit(list_brokers, clients['mq'])
+            return reservations.result(), None, brokers.result()
+
+        brokers = executor.submit(list_brokers, clients['mq']) if brokers_due else None
+        states = describe_instance_states(ec2)
+        changed = [instance_id for instance_id, state in states.items() if cached_states.get(instance_id) != state]
+        reservations = []
+        for start in range(0, len(changed), describe_batch_size):
+            reservations.extend(describe_changed_instances(ec2, changed[start:start + describe_batch_size]))
+
+        ## New sidboxes come with a new broker
+        if brokers is None and any(instance_id not in cached_states for instance_id in changed):
+            brokers = executor.submit(list_brokers, clients['mq'])
+        return reservations, states, brokers.result() if brokers is not None else None
+
+
+def refresh_inventory(db, regions=AWS_REGIONS, ttl=inventory_ttl, force=False):
+    now = time.time()
+    refreshes = {region: (checked_at, loaded_at) for region, checked_at, loaded_at in db.execute("SELECT region, checked_at, loaded_at FROM refreshes")}
+    stale = [region for region in regions if force or region not in refreshes or now - refreshes[region][0] >= ttl]
+    if not stale:
+        return []
+
+    full = {region: force or region not in refreshes or now - refreshes[region][1] >= full_refresh_interval for region in stale}
+    cached_states = {}
+    for region in stale:
+        cached_states[region] = dict(db.execute("SELECT instance_id, state FROM instances WHERE region = ?", (region,)))
+
+    listed_at = dict(db.execute("SELECT region, listed_at FROM broker_refreshes"))
+    brokers_due = {}
+    for region in stale:
+        missing_brokers = any(record['build'] and not record['rabbit'] for record in cached_instances(db, [region]))
+        brokers_due[region] = missing_brokers or region not in listed_at or now - listed_at[region] >= broker_ttl
+
+    ## Fetch the regions at the same time, so the refresh takes as long as the slowest one
+    clients = {region: region_clients(region) for region in stale}
+    with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+        futures = {region: executor.submit(fetch_region, clients[region], cached_states[region], full[region], brokers_due[region]) for region in stale}
+        results = {region: future.result() for region, future in futures.items()}
+
+    with db:
+        for region in stale:
+            reservations, states, brokers = results[region]
+            records = [instance_record(region, instance) for reservation in reservations for instance in reservation["Instances"]]
+
+            if full[region]:
+                db.execute("DELETE FROM instances WHERE region = ? AND test = 1", (region,))
+            else:
+                ## Instances which are gone, and changed instances which aren't test instances
+                for instance_id in set(cached_states[region]) - set(states):
+                    db.execute("DELETE FROM instances WHERE instance_id = ?", (instance_id,))
+                for instance_id, state in states.items():
+                    if cached_states[region].get(instance_id) != state:
+                        db.execute("INSERT OR REPLACE INTO instances VALUES (?, ?, ?, 0, NULL)", (instance_id, region, state))
+
+            for record in records:
+                db.execute("INSERT OR REPLACE INTO instances VALUES (?, ?, ?, 1, ?)",
+                           (record['instance_id'], region, record['state'], json.dumps(record)))
+
+            if brokers is not None:
+                db.execute("DELETE FROM brokers WHERE region = ?", (region,))
+                db.executemany("INSERT INTO brokers VALUES (?, ?, ?)", [(region, build, url) for build, url in broker_urls(region, brokers).items()])
+                db.execute("INSERT OR REPLACE INTO broker_refreshes VALUES (?, ?)", (region, now))
+
+            loaded_at = now if full[region] else refreshes[region][1]
+            db.execute("INSERT OR REPLACE INTO refreshes VALUES (?, ?, ?)", (region, now, loaded_at))
+    return stale
+
+
+def expire_inventory(db, regions=AWS_REGIONS):
+    ## Make the next refresh_inventory ask AWS, e.g. after instances were stopped or started
+    with db:
+        db.executemany("UPDATE refreshes SET checked_at = 0 WHERE region = ?", [(region,) for region in regions])
+
+
+def cached_instances(db, regions=AWS_REGIONS, states=None):
+    urls = {}
+    for region, build, url in db.execute("SELECT region, build, url FROM brokers"):
+        urls[(region, build)] = url
+
+    instances = []
+    for region in regions:
+        for (record,) in db.execute("SELECT record FROM instances WHERE region = ? AND test = 1 ORDER BY instance_id", (region,)):
+            record = json.loads(record)
+            if states is None or record['state'] in states:
+                record['rabbit'] = urls.get((region, record['build']), "")
+                instances.append(record)
+    return instances
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print the cached test EC2 instances, refreshing the cache when it is older than the TTL.")
+    parser.add_argument("--state", action="append", help="Only print the instance ids of instances in this state, can be repeated")
+    parser.add_argument("--refresh", action="store_true", help="Fetch everything from AWS, whatever the age of the cache")
+    parser.add_argument("--ttl", type=int, default=inventory_ttl, help="Seconds the cache is used without asking AWS (default: %d)" % inventory_ttl)
+    args = parser.parse_args()
+
+    db = open_inventory()
+    refresh_inventory(db, AWS_REGIONS, ttl=args.ttl, force=args.refresh)
+    instances = cached_instances(db, AWS_REGIONS, args.state)
+    if args.state:
+        for record in instances:
+            print(record['instance_id'])
+    else:
+        json.dump(instances, sys.stdout, indent=2)
+        print()
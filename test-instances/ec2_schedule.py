@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+#
+# Stop or terminate the test instances each night, and start the stopped ones
+# each morning, like ec2_nightly_shutdown.pl and ec2_morning_startup.pl do.
+# Instead of one API call per instance, the instance ids are sent in batches
+# and the batches of all regions run at the same time.
+#
+# Usage:
+#       export AWS_ACCESS_KEY_ID="your key id"
+#       export AWS_SECRET_ACCESS_KEY="your secret"
+#       python ec2_schedule.py shutdown
+#       python ec2_schedule.py startup
+#
+#       Print what would be done and check the permissions for it, without
+#       changing any instance:
+#       python ec2_schedule.py shutdown --dry-run
+#
+
+import sys
+import time
+import random
+import argparse
+import datetime
+from botocore.exceptions import ClientError, WaiterError
+from concurrent.futures import ThreadPoolExecutor
+from ec2_inventory import AWS_REGIONS, region_clients, test_instance_filters, instance_record, open_inventory, expire_inventory
+
+## Number of instance ids sent in one StopInstances, TerminateInstances or StartInstances call
+batch_size = 50
+
+## Number of batches sent at the same time, over all regions
+max_concurrent_batches = 8
+
+## The clients already retry throttled calls (see aws_config in ec2_inventory.py),
+## a batch which is still throttled after that is retried this many times more
+throttle_attempts = 5
+throttle_backoff = 2
+throttle_backoff_max = 60
+throttle_error_codes = ['RequestLimitExceeded', 'Throttling', 'ThrottlingException']
+
+## A batch rejected for one of its instances is split up, so the other instances still get done
+instance_error_codes = ['IncorrectInstanceState', 'InvalidInstanceID.NotFound', 'UnsupportedOperation']
+
+## Waiters check every waiter_delay seconds, the defaults give up after 10 minutes
+waiter_delay = 15
+waiter_max_attempts = 40
+
+## describe_instances accepts at most this many instance ids per call
+wait_batch_size = 200
+
+## API call and waiter for each action
+actions = {
+    'terminate': ('terminate_instances', 'instance_terminated'),
+    'stop': ('stop_instances', 'instance_stopped'),
+    'start': ('start_instances', 'instance_running'),
+}
+
+## Instances each job looks at
+job_states = {
+    'shutdown': 'running',
+    'startup': 'stopped',
+}
+
+
+def find_instances(ec2, state):
+    ## Test instances with a terminate_after tag in the given state
+    filters = test_instance_filters + [
+        {'Name': 'tag:terminate_after', 'Values': ['*']},
+        {'Name': 'instance-state-name', 'Values': [state]},
+    ]
+    instances = []
+    paginator = ec2.get_paginator('describe_instances')
+    for page in paginator.paginate(Filters=filters):
+        for reservation in page.get("Reservations", []):
+            instances.extend(reservation["Instances"])
+    return instances
+
+
+def expired(record, now):
+    try:
+        terminate_after = datetime.datetime.strptime(record['terminate_after'][:19], '%Y-%m-%dT%H:%M:%S')
+    except ValueError:
+        print(f"{record['instance_id']} has an invalid terminate_after tag: {record['terminate_after']}, stopping it instead")
+        return False
+    return terminate_after < now
+
+
+def plan_region(job, region, clients, now):
+    ## Returns the instance records to act on, per action
+    records = [instance_record(region, instance) for instance in find_instances(clients['ec2'], job_states[job])]
+    if job == 'startup':
+        return {'start': records}
+
+    plan = {'terminate': [], 'stop': []}
+    for record in records:
+        plan['terminate' if expired(record, now) else 'stop'].append(record)
+    return plan
+
+
+def call_with_backoff(call, **kwargs):
+    for attempt in range(throttle_attempts + 1):
+        try:
+            return call(**kwargs)
+        except ClientError as error:
+            if error.response['Error']['Code'] not in throttle_error_codes or attempt == throttle_attempts:
+                raise
+        ## Full jitter, so the throttled batches don't all come back at the same moment
+        time.sleep(random.uniform(0, min(throttle_backoff_max, throttle_backoff * 2 ** attempt)))
+
+
+def run_batch(ec2, action, instance_ids, dry_run):
+    ## Returns the ids the action was accepted for, and the errors of the others
+    call = getattr(ec2, actions[action][0])
+    try:
+        call_with_backoff(call, InstanceIds=instance_ids, DryRun=dry_run)
+    except ClientError as error:
+        code = error.response['Error']['Code']
+        ## A dry run which would have succeeded fails with DryRunOperation
+        if dry_run and code == 'DryRunOperation':
+            return instance_ids, []
+        if code in instance_error_codes and len(instance_ids) > 1:
+            middle = len(instance_ids) // 2
+            first_done, first_errors = run_batch(ec2, action, instance_ids[:middle], dry_run)
+            second_done, second_errors = run_batch(ec2, action, instance_ids[middle:], dry_run)
+            return first_done + second_done, first_errors + second_errors
+        return [], [f"{instance_id}: {code}" for instance_id in instance_ids]
+    return instance_ids, []
+
+
+def wait_for(ec2, action, instance_ids):
+    waiter = ec2.get_waiter(actions[action][1])
+    for start in range(0, len(instance_ids), wait_batch_size):
+        waiter.wait(
+            InstanceIds=instance_ids[start:start + wait_batch_size],
+            WaiterConfig={'Delay': waiter_delay, 'MaxAttempts': waiter_max_attempts}
+        )
+
+
+def print_plan(plans):
+    for region, plan in plans.items():
+        for action, records in plan.items():
+            for record in records:
+                print(f"{region} {record['instance_id']} {record['build'] or '-'} expires {record['terminate_after'] or '-'} - {action}")
+            if records:
+                print(f"{region}: {action} {len(records)} instances in {(len(records) + batch_size - 1) // batch_size} batches")
+
+
+def run_job(job, regions=AWS_REGIONS, dry_run=False, wait=True):
+    timings = {}
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+    start = time.perf_counter()
+    clients = {region: region_clients(region) for region in regions}
+    with ThreadPoolExecutor(max_workers=len(regions)) as executor:
+        futures = {region: executor.submit(plan_region, job, region, clients[region], now) for region in regions}
+        plans = {region: future.result() for region, future in futures.items()}
+    timings['plan'] = time.perf_counter() - start
+    print_plan(plans)
+
+    ## Terminate, stop and start in batches, the batches of every region and action at the same time
+    start = time.perf_counter()
+    batches = []
+    for region, plan in plans.items():
+        for action, records in plan.items():
+            instance_ids = [record['instance_id'] for record in records]
+            for batch_start in range(0, len(instance_ids), batch_size):
+                batches.append((region, action, instance_ids[batch_start:batch_start + batch_size]))
+
+    done = {}
+    errors = []
+    with ThreadPoolExecutor(max_workers=max_concurrent_batches) as executor:
+        futures = [(region, action, executor.submit(run_batch, clients[region]['ec2'], action, instance_ids, dry_run))
+                   for region, action, instance_ids in batches]
+        for region, action, future in futures:
+            batch_done, batch_errors = future.result()
+            done.setdefault((region, action), []).extend(batch_done)
+            errors.extend(f"{region} {action} {error}" for error in batch_errors)
+    timings['dry run' if dry_run else 'api calls'] = time.perf_counter() - start
+
+    ## Wait for the instances to get where they are going, one waiter per region and action
+    if wait and not dry_run:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(len(done), 1)) as executor:
+            futures = [(region, action, executor.submit(wait_for, clients[region]['ec2'], action, instance_ids))
+                       for (region, action), instance_ids in done.items() if instance_ids]
+            for region, action, future in futures:
+                try:
+                    future.result()
+                except WaiterError as error:
+                    errors.append(f"{region} {action} did not finish: {error}")
+        timings['wait'] = time.perf_counter() - start
+
+    ## The dashboard and the other jobs should see the new states on their next run
+    if not dry_run:
+        expire_inventory(open_inventory(), regions)
+
+    for (region, action), instance_ids in done.items():
+        print(f"{region}: {'would ' if dry_run else ''}{action} {len(instance_ids)} instances")
+    for error in errors:
+        print(error)
+    print(", ".join(f"{name} {seconds:.1f}s" for name, seconds in timings.items()))
+    return not errors
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stop or terminate the test instances at night, and start them again in the morning.")
+    parser.add_argument("job", choices=sorted(job_states), help="shutdown stops running instances and terminates expired ones, startup starts stopped instances")
+    parser.add_argument("--dry-run", action="store_true", help="Print the plan and check the permissions for it without changing any instance")
+    parser.add_argument("--no-wait", action="store_true", help="Don't wait for the instances to reach their new state")
+    args = parser.parse_args()
+
+    if not run_job(args.job, AWS_REGIONS, dry_run=args.dry_run, wait=not args.no_wait):
+        sys.exit(1)
@@ -0,0 +1,52 @@
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+import ec2_schedule
+
+
+@pytest.fixture
+def ec2():
+    client = boto3.client('ec2', region_name='eu-west-1', aws_access_key_id='test', aws_secret_access_key='test')
+    with Stubber(client) as stubber:
+        yield client, stubber
+        stubber.assert_no_pending_responses()
+
+
+def expect_stop(stubber, instance_ids, error_code=None, dry_run=False):
+    expected_params = {'InstanceIds': instance_ids, 'DryRun': dry_run}
+    if error_code:
+        stubber.add_client_error('stop_instances', service_error_code=error_code, expected_params=expected_params)
+    else:
+        stubber.add_response('stop_instances', {'StoppingInstances': []}, expected_params)
+
+
+def test_run_batch_splits_a_batch_rejected_for_one_instance(ec2):
+    client, stubber = ec2
+    expect_stop(stubber, ['i-1', 'i-2', 'i-3', 'i-4'], 'IncorrectInstanceState')
+    expect_stop(stubber, ['i-1', 'i-2'])
+    expect_stop(stubber, ['i-3', 'i-4'], 'IncorrectInstanceState')
+    expect_stop(stubber, ['i-3'])
+    expect_stop(stubber, ['i-4'], 'IncorrectInstanceState')
+
+    done, errors = ec2_schedule.run_batch(client, 'stop', ['i-1', 'i-2', 'i-3', 'i-4'], dry_run=False)
+    assert done == ['i-1', 'i-2', 'i-3']
+    assert errors == ['i-4: IncorrectInstanceState']
+
+
+def test_run_batch_does_not_split_on_other_errors(ec2):
+    client, stubber = ec2
+    expect_stop(stubber, ['i-1', 'i-2'], 'UnauthorizedOperation')
+
+    done, errors = ec2_schedule.run_batch(client, 'stop', ['i-1', 'i-2'], dry_run=False)
+    assert done == []
+    assert errors == ['i-1: UnauthorizedOperation', 'i-2: UnauthorizedOperation']
+
+
+def test_run_batch_counts_a_dry_run_operation_as_done(ec2):
+    client, stubber = ec2
+    expect_stop(stubber, ['i-1', 'i-2'], 'DryRunOperation', dry_run=True)
+
+    done, errors = ec2_schedule.run_batch(client, 'stop', ['i-1', 'i-2'], dry_run=True)
+    assert done == ['i-1', 'i-2']
+    assert errors == []
@@ -0,0 +1,159 @@
+import os
+import gzip
+import random
+import urllib.parse
+
+import pytest
+
+import haproxy_endpoint_statistics as stats_script
+from haproxy_endpoint_statistics_benchmark import synthetic_lines
+
+
+# The sequential substitutions are what the table always showed, including for a reference followed by an id
+@pytest.mark.parametrize('url, expected', [
+    ('/api/bookings/OTRL12345678/98765', '/api/bookings/[id]id]'),
+    ('/api/OTRLAB/123456789', '/api/[id]'),
+    ('/OTRL1/2/3/4/5/6', '/[id]]/[id]/[id]/[id]'),
+    ('/jp/journeys/123%7CSOUTHERN/calling-points', '/jp/journeys/[fare_id]/calling-points'),
+    ('/api/search?from=London%20Bridge', '/api/search?from=London Bridge'),
+])
+def test_endpoint_key_matches_normalize_url(url, expected):
+    stats_script.endpoint_key.cache_clear()
+    assert stats_script.normalize_url(urllib.parse.unquote(url), stats_script.subs) == expected
+    assert stats_script.endpoint_key(b'GET', url.encode('ascii')) == f'GET {expected}'
+
+
+def write_log(path, lines, mode='wb'):
+    with open(path, mode) as file:
+        file.writelines(lines)
+
+
+def plain_stats(endpoint_stats):
+    return {endpoint: dict(stats, latency=stats['latency'].to_dict()) for endpoint, stats in endpoint_stats.items()}
+
+
+def serial_stats(log_folder):
+    return plain_stats(stats_script.parse_haproxy_logs(str(log_folder)))
+
+
+@pytest.fixture
+def log_lines():
+    return list(synthetic_lines(3000, seed=7))
+
+
+# Small chunks, so the byte ranges end in the middle of lines and the workers have to move them to line ends
+@pytest.mark.parametrize('chunk_size', [1, 997, 64 * 1024])
+def test_workers_give_the_serial_table(tmp_path, monkeypatch, log_lines, chunk_size):
+    write_log(tmp_path / 'haproxy.log', log_lines[:2000])
+    with gzip.open(tmp_path / 'haproxy.log.1.gz', 'wb') as file:
+        file.writelines(log_lines[2000:])
+    monkeypatch.setattr(stats_script, 'chunk_size', chunk_size)
+
+    chunks = stats_script.split_log_file(str(tmp_path / 'haproxy.log'), chunk_size)
+    data = (tmp_path / 'haproxy.log').read_bytes()
+    assert chunks[0][1] == 0 and chunks[-1][2] == len(data)
+    for (_, _, end), (_, start, _) in zip(chunks, chunks[1:]):
+        assert start == end and data[end - 1:end] == b'\n'
+
+    parallel = stats_script.parse_haproxy_logs(str(tmp_path), workers=2)
+    assert plain_stats(parallel) == serial_stats(tmp_path)
+
+
+def parse_with_state(log_folder, state_file, parsed_chunks=None):
+    if parsed_chunks is not None:
+        parse_chunks = stats_script.parse_chunks
+
+        def recording_parse_chunks(chunks, workers, engine='python'):
+            parsed_chunks.extend(chunks)
+            return parse_chunks(chunks, workers, engine)
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(stats_script, 'parse_chunks', recording_parse_chunks)
+            return plain_stats(stats_script.parse_haproxy_logs(str(log_folder), state_file=str(state_file)))
+    return plain_stats(stats_script.parse_haproxy_logs(str(log_folder), state_file=str(state_file)))
+
+
+def test_state_parses_appended_lines(tmp_path, log_lines):
+    log_folder, state_file = tmp_path / 'log', tmp_path / 'state.json'
+    log_folder.mkdir()
+    write_log(log_folder / 'haproxy.log', log_lines[:1000])
+    assert parse_with_state(log_folder, state_file) == serial_stats(log_folder)
+
+    write_log(log_folder / 'haproxy.log', log_lines[1000:], 'ab')
+    parsed_chunks = []
+    assert parse_with_state(log_folder, state_file, parsed_chunks) == serial_stats(log_folder)
+    assert [start for _, start, _ in parsed_chunks] == [len(b''.join(log_lines[:1000]))]
+
+
+def test_state_leaves_a_partial_last_line_for_the_next_run(tmp_path, log_lines):
+    log_folder, state_file = tmp_path / 'log', tmp_path / 'state.json'
+    log_folder.mkdir()
+    partial = log_lines[1000][:40]
+    write_log(log_folder / 'haproxy.log', log_lines[:1000] + [partial])
+    (tmp_path / 'complete').mkdir()
+    write_log(tmp_path / 'complete' / 'haproxy.log', log_lines[:1000])
+    assert parse_with_state(log_folder, state_file) == serial_stats(tmp_path / 'complete')
+
+    write_log(log_folder / 'haproxy.log', [log_lines[1000][40:]] + log_lines[1001:], 'ab')
+    assert parse_with_state(log_folder, state_file) == serial_stats(log_folder)
+
+
+def test_state_follows_a_rotated_file(tmp_path, log_lines):
+    log_folder, state_file = tmp_path / 'log', tmp_path / 'state.json'
+    log_folder.mkdir()
+    write_log(log_folder / 'haproxy.log', log_lines[:1000])
+    parse_with_state(log_folder, state_file)
+
+    # The logger writes a few more lines to the renamed file before it reopens haproxy.log
+    os.rename(log_folder / 'haproxy.log', log_folder / 'haproxy.log.1')
+    write_log(log_folder / 'haproxy.log.1', log_lines[1000:1100], 'ab')
+    write_log(log_folder / 'haproxy.log', log_lines[1100:])
+    parsed_chunks = []
+    assert parse_with_state(log_folder, state_file, parsed_chunks) == serial_stats(log_folder)
+    assert sorted((os.path.basename(path), start) for path, start, _ in parsed_chunks) == [
+        ('haproxy.log', 0), ('haproxy.log.1', len(b''.join(log_lines[:1000])))
+    ]
+
+
+def test_state_parses_a_truncated_file_again(tmp_path, log_lines):
+    log_folder, state_file = tmp_path / 'log', tmp_path / 'state.json'
+    log_folder.mkdir()
+    write_log(log_folder / 'haproxy.log', log_lines[:2000])
+    parse_with_state(log_folder, state_file)
+
+    # copytruncate, the same inode starts over with fewer lines. They start like the old ones, so only the size
+    # tells that the file was truncated
+    os.truncate(log_folder / 'haproxy.log', 0)
+    write_log(log_folder / 'haproxy.log', log_lines[:500], 'ab')
+    assert parse_with_state(log_folder, state_file) == serial_stats(log_folder)
+
+
+def sketch_of(values):
+    sketch = stats_script.LatencySketch()
+    for value in values:
+        sketch.add(value)
+    return sketch
+
+
+@pytest.fixture
+def latencies():
+    generator = random.Random(5)
+    return [generator.lognormvariate(5, 1.5) for _ in range(20000)] + [0] * 50
+
+
+@pytest.mark.parametrize('q', [0.01, 0.25, 0.5, 0.9, 0.95, 0.99, 0.999])
+def test_latency_sketch_quantiles_are_within_accuracy(latencies, q):
+    exact = sorted(latencies)[int(q * (len(latencies) - 1))]
+    assert sketch_of(latencies).quantile(q) == pytest.approx(exact, rel=stats_script.latency_accuracy)
+
+
+def test_latency_sketch_merge_and_subtract(latencies):
+    first, second = latencies[:7000], latencies[7000:]
+    merged = sketch_of(first)
+    merged += sketch_of(second)
+    assert merged == sketch_of(latencies)
+
+    merged -= sketch_of(second)
+    expected = sketch_of(first)
+    # max is left as it is, the sketch can't know the max of what remains
+    expected.max = merged.max
+    assert merged == expected